@@ -9,22 +9,228 @@ Analyze individual stocks and ETFs with:
 """
 
 import streamlit as st
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import pandas as pd
-import sys
-import os
-
-# Add src to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+import numpy as np
 
 from src.data.data_fetcher import fetch_historical_data, fetch_ticker_info
-from src.analysis.technical import add_all_indicators, calculate_rsi, calculate_macd
+from src.analysis.technical import add_indicators, calculate_rsi, calculate_macd
 from src.analysis.fundamental import create_fundamental_summary
-from src.analysis.patterns import add_all_patterns, summarize_patterns
 
 st.set_page_config(page_title="Stock Analyzer", page_icon="📊", layout="wide")
 
+
+@st.cache_data(ttl=600, show_spinner=False)
+def load_historical_data(ticker: str, period: str, interval: str) -> pd.DataFrame:
+    """Fetch price history, cached across reruns for 10 minutes."""
+    return fetch_historical_data(ticker, period=period, interval=interval)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_ticker_info(ticker: str) -> dict:
+    """Fetch company info, cached for an hour since fundamentals change rarely."""
+    return fetch_ticker_info(ticker)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_fundamental_summary(ticker: str) -> dict:
+    """Build the fundamental summary, cached like the info it is derived from."""
+    return create_fundamental_summary(load_ticker_info(ticker))
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def compute_indicators(
+    ticker: str,
+    period: str,
+    last_bar: pd.Timestamp,
+    indicators: tuple,
+    _df: pd.DataFrame
+) -> pd.DataFrame:
+    """
+    Add the requested indicator columns.
+
+    Keyed on (ticker, period, last bar, indicators) so the price frame
+    itself is not hashed.
+    """
+    return add_indicators(_df, indicators)
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def compute_pattern_summary(ticker: str, period: str, last_bar: pd.Timestamp, _df: pd.DataFrame) -> dict:
+    """Summarize candlestick and chart patterns, cached like compute_indicators."""
+    # Deferred so the patterns module only loads once the Patterns tab is rendered
+    from src.analysis.patterns import summarize_patterns
+
+    return summarize_patterns(_df)
+
+
+# Sidebar indicator labels mapped to add_indicators groups
+INDICATOR_GROUPS = {
+    "SMA 20": 'SMA_20',
+    "SMA 50": 'SMA_50',
+    "SMA 200": 'SMA_200',
+    "Bollinger Bands": 'BB',
+    "VWAP": 'VWAP'
+}
+
+# add_indicators groups read by the metrics and Technical Summary tab
+SUMMARY_INDICATORS = ('SMA_20', 'SMA_50', 'SMA_200', 'RSI', 'MACD')
+
+# Above this many bars, long periods are plotted as weekly candles
+MAX_PLOT_BARS = 500
+OHLCV_AGGREGATION = {'Open': 'first', 'High': 'max', 'Low': 'min', 'Close': 'last', 'Volume': 'sum'}
+PLOT_INDICATORS = ['SMA_20', 'SMA_50', 'SMA_200', 'BB_Upper', 'BB_Middle', 'BB_Lower',
+                   'VWAP', 'RSI', 'MACD', 'MACD_Signal']
+
+
+def downsample_for_plot(df: pd.DataFrame, period: str) -> pd.DataFrame:
+    """
+    Resample long daily series to weekly bars before charting.
+
+    Plotly serialization and browser rendering scale with the number of
+    points, so 2y/5y charts are drawn from weekly OHLC with the indicator
+    values as of each week's last bar.
+    """
+    if len(df) <= MAX_PLOT_BARS or period not in {"2y", "5y"}:
+        return df
+
+    weekly = df.resample('W').agg(OHLCV_AGGREGATION)
+    indicator_cols = [col for col in PLOT_INDICATORS if col in df.columns]
+    weekly = weekly.join(df[indicator_cols].resample('W').last())
+
+    return weekly.dropna(subset=['Close'])
+
+
+def build_price_chart(
+    plot_df: pd.DataFrame,
+    ticker: str,
+    show_indicators: list,
+    show_volume: bool,
+    show_rsi: bool,
+    show_macd: bool
+) -> "go.Figure":
+    """Build the price/volume/oscillator chart for the selected overlays."""
+    # Plotly is imported lazily to keep the page's first render light
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    # Create main chart
+    fig = make_subplots(
+        rows=3 if (show_rsi or show_macd) else 2,
+        cols=1,
+        shared_xaxes=True,
+        vertical_spacing=0.05,
+        row_heights=[0.6, 0.2, 0.2] if (show_rsi or show_macd) else [0.7, 0.3],
+        subplot_titles=("Price", "Volume", "RSI/MACD" if (show_rsi or show_macd) else "")
+    )
+
+    # Price candlesticks
+    fig.add_trace(
+        go.Candlestick(
+            x=plot_df.index,
+            open=plot_df['Open'],
+            high=plot_df['High'],
+            low=plot_df['Low'],
+            close=plot_df['Close'],
+            name=ticker,
+            increasing_line_color='green',
+            decreasing_line_color='red'
+        ),
+        row=1, col=1
+    )
+
+    # Add selected indicators
+    if "SMA 20" in show_indicators and 'SMA_20' in plot_df.columns:
+        fig.add_trace(
+            go.Scattergl(x=plot_df.index, y=plot_df['SMA_20'], name="SMA 20",
+                        line=dict(color='orange', width=1)),
+            row=1, col=1
+        )
+
+    if "SMA 50" in show_indicators and 'SMA_50' in plot_df.columns:
+        fig.add_trace(
+            go.Scattergl(x=plot_df.index, y=plot_df['SMA_50'], name="SMA 50",
+                        line=dict(color='blue', width=1.5)),
+            row=1, col=1
+        )
+
+    if "SMA 200" in show_indicators and 'SMA_200' in plot_df.columns:
+        fig.add_trace(
+            go.Scattergl(x=plot_df.index, y=plot_df['SMA_200'], name="SMA 200",
+                        line=dict(color='purple', width=2)),
+            row=1, col=1
+        )
+
+    if "Bollinger Bands" in show_indicators:
+        if all(col in plot_df.columns for col in ['BB_Upper', 'BB_Middle', 'BB_Lower']):
+            fig.add_trace(
+                go.Scattergl(x=plot_df.index, y=plot_df['BB_Upper'], name="BB Upper",
+                            line=dict(color='gray', width=1, dash='dash')),
+                row=1, col=1
+            )
+            fig.add_trace(
+                go.Scattergl(x=plot_df.index, y=plot_df['BB_Lower'], name="BB Lower",
+                            line=dict(color='gray', width=1, dash='dash'),
+                            fill='tonexty', fillcolor='rgba(128,128,128,0.1)'),
+                row=1, col=1
+            )
+
+    if "VWAP" in show_indicators and 'VWAP' in plot_df.columns:
+        fig.add_trace(
+            go.Scattergl(x=plot_df.index, y=plot_df['VWAP'], name="VWAP",
+                        line=dict(color='brown', width=1.5)),
+            row=1, col=1
+        )
+
+    # Volume
+    if show_volume:
+        colors = np.where(plot_df['Close'].to_numpy() >= plot_df['Open'].to_numpy(), 'green', 'red')
+
+        fig.add_trace(
+            go.Bar(x=plot_df.index, y=plot_df['Volume'], name="Volume",
+                  marker_color=colors, showlegend=False),
+            row=2, col=1
+        )
+
+    # RSI
+    if show_rsi and 'RSI' in plot_df.columns:
+        fig.add_trace(
+            go.Scattergl(x=plot_df.index, y=plot_df['RSI'], name="RSI",
+                        line=dict(color='purple', width=2)),
+            row=3, col=1
+        )
+        # Add overbought/oversold lines
+        fig.add_hline(y=70, line_dash="dash", line_color="red", row=3, col=1)
+        fig.add_hline(y=30, line_dash="dash", line_color="green", row=3, col=1)
+
+    # MACD
+    if show_macd and 'MACD' in plot_df.columns:
+        fig.add_trace(
+            go.Scattergl(x=plot_df.index, y=plot_df['MACD'], name="MACD",
+                        line=dict(color='blue', width=1.5)),
+            row=3, col=1
+        )
+        fig.add_trace(
+            go.Scattergl(x=plot_df.index, y=plot_df['MACD_Signal'], name="Signal",
+                        line=dict(color='orange', width=1.5)),
+            row=3, col=1
+        )
+
+    # Update layout
+    fig.update_layout(
+        height=800,
+        showlegend=True,
+        xaxis_rangeslider_visible=False,
+        hovermode='x unified'
+    )
+
+    fig.update_yaxes(title_text="Price ($)", row=1, col=1)
+    fig.update_yaxes(title_text="Volume", row=2, col=1)
+    if show_rsi or show_macd:
+        fig.update_yaxes(title_text="RSI/MACD", row=3, col=1)
+
+    return fig
+
+
 st.title("📊 Stock/ETF Analyzer")
 st.markdown("Analyze stocks and ETFs with technical indicators and fundamental data")
 
@@ -57,19 +263,26 @@ if analyze_button or ticker:
     try:
         with st.spinner(f"Fetching data for {ticker}..."):
             # Fetch data
-            df = fetch_historical_data(ticker, period=period, interval='1d')
+            df = load_historical_data(ticker, period, '1d')
 
             if df.empty:
                 st.error(f"No data found for ticker: {ticker}")
                 st.stop()
 
-            # Add indicators
-            df = add_all_indicators(df)
-            df = add_all_patterns(df)
+            # The summary metrics and Technical Summary tab always read
+            # SUMMARY_INDICATORS; chart-only overlays follow the sidebar
+            wanted = set(SUMMARY_INDICATORS)
+            wanted.update(INDICATOR_GROUPS[label] for label in show_indicators)
+
+            df = compute_indicators(ticker, period, df.index[-1], tuple(sorted(wanted)), df)
+
+            # Latest bar, read once for all the summary metrics
+            last = df.iloc[-1]
+            prev = df.iloc[-2] if len(df) > 1 else last
 
             # Display current price
-            current_price = df['Close'].iloc[-1]
-            prev_close = df['Close'].iloc[-2] if len(df) > 1 else current_price
+            current_price = last['Close']
+            prev_close = prev['Close']
             price_change = current_price - prev_close
             price_change_pct = (price_change / prev_close) * 100
 
@@ -83,137 +296,34 @@ if analyze_button or ticker:
                 )
 
             with col2:
-                day_high = df['High'].iloc[-1]
-                day_low = df['Low'].iloc[-1]
+                day_high = last['High']
+                day_low = last['Low']
                 st.metric("Day Range", f"${day_low:.2f} - ${day_high:.2f}")
 
             with col3:
-                volume = df['Volume'].iloc[-1]
+                volume = last['Volume']
                 st.metric("Volume", f"{volume:,.0f}")
 
             with col4:
-                if 'RSI' in df.columns:
-                    rsi_current = df['RSI'].iloc[-1]
-                    if not pd.isna(rsi_current):
-                        st.metric("RSI (14)", f"{rsi_current:.2f}")
+                rsi_current = last.get('RSI')
+                if rsi_current is not None and not pd.isna(rsi_current):
+                    st.metric("RSI (14)", f"{rsi_current:.2f}")
 
             st.markdown("---")
 
-            # Create main chart
-            fig = make_subplots(
-                rows=3 if (show_rsi or show_macd) else 2,
-                cols=1,
-                shared_xaxes=True,
-                vertical_spacing=0.05,
-                row_heights=[0.6, 0.2, 0.2] if (show_rsi or show_macd) else [0.7, 0.3],
-                subplot_titles=("Price", "Volume", "RSI/MACD" if (show_rsi or show_macd) else "")
-            )
-
-            # Price candlesticks
-            fig.add_trace(
-                go.Candlestick(
-                    x=df.index,
-                    open=df['Open'],
-                    high=df['High'],
-                    low=df['Low'],
-                    close=df['Close'],
-                    name=ticker,
-                    increasing_line_color='green',
-                    decreasing_line_color='red'
-                ),
-                row=1, col=1
-            )
-
-            # Add selected indicators
-            if "SMA 20" in show_indicators and 'SMA_20' in df.columns:
-                fig.add_trace(
-                    go.Scatter(x=df.index, y=df['SMA_20'], name="SMA 20",
-                              line=dict(color='orange', width=1)),
-                    row=1, col=1
-                )
-
-            if "SMA 50" in show_indicators and 'SMA_50' in df.columns:
-                fig.add_trace(
-                    go.Scatter(x=df.index, y=df['SMA_50'], name="SMA 50",
-                              line=dict(color='blue', width=1.5)),
-                    row=1, col=1
-                )
-
-            if "SMA 200" in show_indicators and 'SMA_200' in df.columns:
-                fig.add_trace(
-                    go.Scatter(x=df.index, y=df['SMA_200'], name="SMA 200",
-                              line=dict(color='purple', width=2)),
-                    row=1, col=1
-                )
-
-            if "Bollinger Bands" in show_indicators:
-                if all(col in df.columns for col in ['BB_Upper', 'BB_Middle', 'BB_Lower']):
-                    fig.add_trace(
-                        go.Scatter(x=df.index, y=df['BB_Upper'], name="BB Upper",
-                                  line=dict(color='gray', width=1, dash='dash')),
-                        row=1, col=1
-                    )
-                    fig.add_trace(
-                        go.Scatter(x=df.index, y=df['BB_Lower'], name="BB Lower",
-                                  line=dict(color='gray', width=1, dash='dash'),
-                                  fill='tonexty', fillcolor='rgba(128,128,128,0.1)'),
-                        row=1, col=1
-                    )
-
-            if "VWAP" in show_indicators and 'VWAP' in df.columns:
-                fig.add_trace(
-                    go.Scatter(x=df.index, y=df['VWAP'], name="VWAP",
-                              line=dict(color='brown', width=1.5)),
-                    row=1, col=1
+            # Reuse the last figure when nothing that shapes it has changed.
+            # The chart is built from a (possibly) downsampled copy; metrics use the full data
+            figure_key = (ticker, period, df.index[-1], tuple(show_indicators), show_volume, show_rsi, show_macd)
+            cached_figure = st.session_state.get('analyzer_figure')
+
+            if cached_figure is not None and cached_figure[0] == figure_key:
+                fig = cached_figure[1]
+            else:
+                fig = build_price_chart(
+                    downsample_for_plot(df, period), ticker,
+                    show_indicators, show_volume, show_rsi, show_macd
                 )
-
-            # Volume
-            if show_volume:
-                colors = ['green' if close >= open_ else 'red'
-                         for close, open_ in zip(df['Close'], df['Open'])]
-
-                fig.add_trace(
-                    go.Bar(x=df.index, y=df['Volume'], name="Volume",
-                          marker_color=colors, showlegend=False),
-                    row=2, col=1
-                )
-
-            # RSI
-            if show_rsi and 'RSI' in df.columns:
-                fig.add_trace(
-                    go.Scatter(x=df.index, y=df['RSI'], name="RSI",
-                              line=dict(color='purple', width=2)),
-                    row=3, col=1
-                )
-                # Add overbought/oversold lines
-                fig.add_hline(y=70, line_dash="dash", line_color="red", row=3, col=1)
-                fig.add_hline(y=30, line_dash="dash", line_color="green", row=3, col=1)
-
-            # MACD
-            if show_macd and 'MACD' in df.columns:
-                fig.add_trace(
-                    go.Scatter(x=df.index, y=df['MACD'], name="MACD",
-                              line=dict(color='blue', width=1.5)),
-                    row=3, col=1
-                )
-                fig.add_trace(
-                    go.Scatter(x=df.index, y=df['MACD_Signal'], name="Signal",
-                              line=dict(color='orange', width=1.5)),
-                    row=3, col=1
-                )
-
-            # Update layout
-            fig.update_layout(
-                height=800,
-                showlegend=True,
-                xaxis_rangeslider_visible=False,
-                hovermode='x unified'
-            )
-
-            fig.update_yaxes(title_text="Price ($)", row=1, col=1)
-            fig.update_yaxes(title_text="Volume", row=2, col=1)
-            if show_rsi or show_macd:
-                fig.update_yaxes(title_text="RSI/MACD", row=3, col=1)
+                st.session_state['analyzer_figure'] = (figure_key, fig)
 
             st.plotly_chart(fig, use_container_width=True)
 
@@ -227,26 +337,26 @@ if analyze_button or ticker:
 
                 with col1:
                     st.markdown("**Moving Averages**")
-                    if 'SMA_20' in df.columns:
-                        st.write(f"SMA 20: ${df['SMA_20'].iloc[-1]:.2f}")
-                    if 'SMA_50' in df.columns:
-                        st.write(f"SMA 50: ${df['SMA_50'].iloc[-1]:.2f}")
-                    if 'SMA_200' in df.columns:
-                        st.write(f"SMA 200: ${df['SMA_200'].iloc[-1]:.2f}")
+                    if 'SMA_20' in last:
+                        st.write(f"SMA 20: ${last['SMA_20']:.2f}")
+                    if 'SMA_50' in last:
+                        st.write(f"SMA 50: ${last['SMA_50']:.2f}")
+                    if 'SMA_200' in last:
+                        st.write(f"SMA 200: ${last['SMA_200']:.2f}")
 
                 with col2:
                     st.markdown("**Momentum Indicators**")
-                    if 'RSI' in df.columns and not pd.isna(df['RSI'].iloc[-1]):
-                        rsi = df['RSI'].iloc[-1]
+                    if 'RSI' in last and not pd.isna(last['RSI']):
+                        rsi = last['RSI']
                         st.write(f"RSI: {rsi:.2f}")
                         if rsi > 70:
                             st.warning("⚠️ Overbought")
                         elif rsi < 30:
                             st.success("✅ Oversold")
 
-                    if 'MACD' in df.columns:
-                        macd_val = df['MACD'].iloc[-1]
-                        signal_val = df['MACD_Signal'].iloc[-1]
+                    if 'MACD' in last:
+                        macd_val = last['MACD']
+                        signal_val = last['MACD_Signal']
                         st.write(f"MACD: {macd_val:.2f}")
                         st.write(f"Signal: {signal_val:.2f}")
 
@@ -255,8 +365,7 @@ if analyze_button or ticker:
 
                 with st.spinner("Fetching fundamental data..."):
                     try:
-                        info = fetch_ticker_info(ticker)
-                        summary = create_fundamental_summary(info)
+                        summary = load_fundamental_summary(ticker)
 
                         col1, col2, col3 = st.columns(3)
 
@@ -290,7 +399,7 @@ if analyze_button or ticker:
             with tab3:
                 st.subheader("Pattern Recognition")
 
-                pattern_summary = summarize_patterns(df)
+                pattern_summary = compute_pattern_summary(ticker, period, df.index[-1], df)
 
                 col1, col2 = st.columns(2)
 
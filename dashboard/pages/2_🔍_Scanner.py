@@ -10,11 +10,7 @@ Scan multiple stocks for:
 
 import streamlit as st
 import pandas as pd
-import sys
-import os
-
-# Add src to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+import io
 
 from src.scanner.breakout_scanner import (
     scan_multiple_tickers,
@@ -28,6 +24,80 @@ from src.scanner.breakout_scanner import (
 
 st.set_page_config(page_title="Market Scanner", page_icon="🔍", layout="wide")
 
+# Result columns shown in the table, in display order
+DISPLAY_COLUMNS = [
+    'ticker',
+    'current_price',
+    'relative_volume',
+    'rsi_value',
+    'rsi_signal',
+    'price_change_5d',
+    'price_change_20d',
+    'volume_surge',
+    'near_52w_high',
+    'ma_crossover',
+    'breakout_score'
+]
+
+# Seconds scan results and the signals behind them are reused
+SCAN_CACHE_TTL = 10 * 60
+
+# Client-side number formats; the underlying data keeps full precision
+COLUMN_CONFIG = {
+    'current_price': st.column_config.NumberColumn(format='$%.2f'),
+    'relative_volume': st.column_config.NumberColumn(format='%.2fx'),
+    'rsi_value': st.column_config.NumberColumn(format='%.1f'),
+    'price_change_5d': st.column_config.NumberColumn(format='%+.2f%%'),
+    'price_change_20d': st.column_config.NumberColumn(format='%+.2f%%')
+}
+
+
+@st.cache_data(ttl=SCAN_CACHE_TTL, show_spinner=False)
+def run_scan(
+    scan_type: str,
+    tickers: tuple,
+    max_workers: int,
+    liquidity_filter: bool,
+    _progress_callback=None
+) -> pd.DataFrame:
+    """
+    Run a scan, cached for 10 minutes on its arguments.
+
+    The progress callback is left out of the cache key; a cache hit
+    returns without calling it.
+    """
+    # Every scan type reads the same signals; share them across scan types
+    # on the same universe for as long as this cache keeps results
+    scan_options = {
+        'max_workers': max_workers,
+        'progress_callback': _progress_callback,
+        'liquidity_filter': liquidity_filter,
+        'cache_ttl': SCAN_CACHE_TTL
+    }
+    tickers = list(tickers)
+
+    if scan_type == "Breakout Candidates":
+        return find_breakout_candidates(tickers, **scan_options)
+    elif scan_type == "High Volume Movers":
+        return find_high_volume_movers(tickers, min_rel_volume=2.0, **scan_options)
+    elif scan_type == "Oversold Stocks (RSI)":
+        return find_oversold_stocks(tickers, **scan_options)
+    elif scan_type == "Golden Cross":
+        return find_golden_cross_stocks(tickers, **scan_options)
+    else:
+        return scan_multiple_tickers(tickers, **scan_options)
+
+
+@st.cache_data(show_spinner=False)
+def results_to_csv(df: pd.DataFrame) -> bytes:
+    """
+    Encode scan results as CSV bytes, cached so reruns skip re-serialization.
+    """
+    buffer = io.BytesIO()
+    df.to_csv(buffer, index=False)
+    return buffer.getvalue()
+
+
 st.title("🔍 Market Scanner")
 st.markdown("Scan the market for breakout opportunities and trading signals")
 
@@ -66,6 +136,20 @@ with st.sidebar:
 
     st.info(f"📊 Scanning {len(tickers)} tickers")
 
+    threads = st.slider(
+        "Parallel Requests",
+        min_value=1,
+        max_value=32,
+        value=16,
+        help="Number of tickers fetched concurrently"
+    )
+
+    skip_illiquid = st.checkbox(
+        "Skip Illiquid Tickers",
+        value=False,
+        help="Pre-screen on the last 5 days and skip tickers under $5 or with unusually thin volume"
+    )
+
     # Custom filters for Custom Scan
     if scan_type == "Custom Scan":
         st.markdown("---")
@@ -80,25 +164,29 @@ with st.sidebar:
 if scan_button:
     with st.spinner(f"Scanning {len(tickers)} tickers... This may take a minute..."):
         try:
+            progress_bar = st.progress(0.0)
+
+            def update_progress(completed, total):
+                progress_bar.progress(completed / total, text=f"Scanned {completed}/{total} tickers")
+
+            try:
+                results = run_scan(scan_type, tuple(tickers), threads, skip_illiquid, update_progress)
+            finally:
+                progress_bar.empty()
+
             if scan_type == "Breakout Candidates":
-                results = find_breakout_candidates(tickers)
                 st.success(f"✅ Found {len(results)} breakout candidates")
 
             elif scan_type == "High Volume Movers":
-                results = find_high_volume_movers(tickers, min_rel_volume=2.0)
                 st.success(f"✅ Found {len(results)} high volume movers")
 
             elif scan_type == "Oversold Stocks (RSI)":
-                results = find_oversold_stocks(tickers)
                 st.success(f"✅ Found {len(results)} oversold stocks")
 
             elif scan_type == "Golden Cross":
-                results = find_golden_cross_stocks(tickers)
                 st.success(f"✅ Found {len(results)} stocks with golden cross")
 
             elif scan_type == "Custom Scan":
-                results = scan_multiple_tickers(tickers)
-
                 # Apply custom filters
                 if not results.empty:
                     if volume_surge:
@@ -119,69 +207,24 @@ if scan_button:
                 st.subheader("Scan Results")
 
                 # Prepare display dataframe
-                display_df = results.copy()
-
-                # Format columns
-                if 'current_price' in display_df.columns:
-                    display_df['current_price'] = display_df['current_price'].round(2)
-
-                if 'relative_volume' in display_df.columns:
-                    display_df['relative_volume'] = display_df['relative_volume'].round(2)
-
-                if 'rsi_value' in display_df.columns:
-                    display_df['rsi_value'] = display_df['rsi_value'].round(2)
-
-                if 'price_change_5d' in display_df.columns:
-                    display_df['price_change_5d'] = display_df['price_change_5d'].round(2)
-
-                if 'price_change_20d' in display_df.columns:
-                    display_df['price_change_20d'] = display_df['price_change_20d'].round(2)
+                display_df = results
 
                 # Select relevant columns for display
-                display_columns = ['ticker', 'current_price']
-
-                if 'relative_volume' in display_df.columns:
-                    display_columns.append('relative_volume')
-
-                if 'rsi_value' in display_df.columns:
-                    display_columns.append('rsi_value')
-
-                if 'rsi_signal' in display_df.columns:
-                    display_columns.append('rsi_signal')
-
-                if 'price_change_5d' in display_df.columns:
-                    display_columns.append('price_change_5d')
-
-                if 'price_change_20d' in display_df.columns:
-                    display_columns.append('price_change_20d')
-
-                if 'volume_surge' in display_df.columns:
-                    display_columns.append('volume_surge')
-
-                if 'near_52w_high' in display_df.columns:
-                    display_columns.append('near_52w_high')
-
-                if 'ma_crossover' in display_df.columns:
-                    display_columns.append('ma_crossover')
-
-                if 'breakout_score' in display_df.columns:
-                    display_columns.append('breakout_score')
-
-                # Filter to existing columns
-                display_columns = [col for col in display_columns if col in display_df.columns]
+                available = set(display_df.columns)
+                display_columns = [col for col in DISPLAY_COLUMNS if col in available]
 
                 # Show dataframe
                 st.dataframe(
                     display_df[display_columns],
+                    column_config=COLUMN_CONFIG,
                     use_container_width=True,
                     height=400
                 )
 
                 # Download button
-                csv = display_df.to_csv(index=False)
                 st.download_button(
                     label="📥 Download Results as CSV",
-                    data=csv,
+                    data=results_to_csv(display_df),
                     file_name=f"{scan_type.lower().replace(' ', '_')}_results.csv",
                     mime="text/csv"
                 )
@@ -195,7 +238,7 @@ if scan_button:
                     top_picks = display_df.head(5)
 
                     for idx, row in top_picks.iterrows():
-                        with st.expander(f"**{row['ticker']}** - ${row.get('current_price', 'N/A')}"):
+                        with st.expander(f"**{row['ticker']}** - ${row['current_price']:.2f}"):
                             col1, col2, col3 = st.columns(3)
 
                             with col1:
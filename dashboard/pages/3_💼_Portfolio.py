@@ -8,26 +8,200 @@ Track your portfolio:
 - P/L tracking
 """
 
+import time
+
 import streamlit as st
 import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
-import sys
-import os
-
-# Add src to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-
-from src.data.data_fetcher import fetch_multiple_tickers
-from src.portfolio.tracker import (
-    calculate_portfolio_value,
-    calculate_portfolio_performance,
-    calculate_allocation,
-    compare_to_benchmark
-)
+import numpy as np
+
+from src.data.data_fetcher import fetch_closes
 
 st.set_page_config(page_title="Portfolio Tracker", page_icon="💼", layout="wide")
 
+# Manual holdings grid; deleting rows happens client-side in the grid
+HOLDINGS_EDITOR_CONFIG = {
+    'ticker': st.column_config.TextColumn('Ticker', required=True),
+    'shares': st.column_config.NumberColumn('Shares', min_value=0.0),
+    'purchase_price': st.column_config.NumberColumn('Purchase Price', min_value=0.0, format='$%.2f'),
+    'purchase_date': st.column_config.DateColumn('Purchase Date')
+}
+
+# Holdings table columns, labels and formats; numbers are formatted by the
+# grid at render time, so the numeric columns are sent as-is
+HOLDINGS_COLUMN_CONFIG = {
+    'ticker': st.column_config.TextColumn('Ticker'),
+    'shares': st.column_config.NumberColumn('Shares'),
+    'purchase_price': st.column_config.NumberColumn('Purchase', format='$%.2f'),
+    'current_price': st.column_config.NumberColumn('Current', format='$%.2f'),
+    'cost_basis': st.column_config.NumberColumn('Cost', format='$%.2f'),
+    'current_value': st.column_config.NumberColumn('Value', format='$%.2f'),
+    'gain_loss': st.column_config.NumberColumn('G/L', format='$%.2f'),
+    'gain_loss_pct': st.column_config.NumberColumn('G/L %', format='%+.2f%%')
+}
+
+
+# Seconds a fetched price history stays fresh
+PRICE_CACHE_TTL = 600
+
+
+@st.cache_data(ttl=PRICE_CACHE_TTL, show_spinner=False)
+def load_closes(tickers: tuple, period: str, interval: str) -> pd.DataFrame:
+    """Fetch wide close prices for a sorted ticker tuple, cached for 10 minutes."""
+    return fetch_closes(list(tickers), period=period, interval=interval)
+
+
+@st.cache_data(show_spinner=False)
+def csv_template() -> bytes:
+    """Serialize the example holdings CSV once per process."""
+    template_df = pd.DataFrame({
+        'ticker': ['AAPL', 'MSFT', 'SPY'],
+        'shares': [10, 5, 20],
+        'purchase_price': [150.00, 350.00, 450.00],
+        'purchase_date': ['2024-01-15', '2024-02-01', '2024-01-10']
+    })
+
+    return template_df.to_csv(index=False).encode('utf-8')
+
+
+def empty_holdings() -> dict:
+    """Column-oriented holdings store: one numpy array per field."""
+    return {
+        'ticker': np.array([], dtype=str),
+        'shares': np.array([], dtype=np.float64),
+        'purchase_price': np.array([], dtype=np.float64),
+        'purchase_date': np.array([], dtype='datetime64[D]')
+    }
+
+
+def append_holding(holdings: dict, ticker: str, shares: float, purchase_price: float, purchase_date) -> dict:
+    """Return a new holdings store with one position appended to each column."""
+    return {
+        'ticker': np.append(holdings['ticker'], ticker),
+        'shares': np.append(holdings['shares'], np.float64(shares)),
+        'purchase_price': np.append(holdings['purchase_price'], np.float64(purchase_price)),
+        'purchase_date': np.append(holdings['purchase_date'], np.datetime64(purchase_date, 'D'))
+    }
+
+
+def set_holdings(holdings: dict) -> None:
+    """
+    Store the manual holdings in session state.
+
+    The sorted ticker tuple is derived here, at mutation time, so reruns
+    and the analysis can read it without rescanning the ticker column.
+    """
+    st.session_state.holdings = holdings
+    st.session_state.holding_tickers = tuple(np.unique(holdings['ticker']).tolist())
+
+    # A fresh editor key drops the grid's pending edits, now part of the store
+    st.session_state.holdings_version = st.session_state.get('holdings_version', 0) + 1
+
+
+def holdings_editor_key() -> str:
+    """Widget key of the holdings grid for the current store version."""
+    return f"holdings_editor_{st.session_state.get('holdings_version', 0)}"
+
+
+def has_pending_edits() -> bool:
+    """Whether the holdings grid has edits not yet folded into the store."""
+    changes = st.session_state.get(holdings_editor_key()) or {}
+    return any(changes.get(kind) for kind in ('edited_rows', 'added_rows', 'deleted_rows'))
+
+
+def holdings_with_edits(holdings: dict, changes: dict = None) -> dict:
+    """
+    Fold the holdings grid's pending edits, deletions and additions into a
+    new store. Rows left without a ticker are dropped.
+    """
+    if not changes:
+        return holdings
+
+    df = pd.DataFrame(holdings)
+
+    for row, values in changes.get('edited_rows', {}).items():
+        for column, value in values.items():
+            df.loc[int(row), column] = value
+
+    df = df.drop(index=changes.get('deleted_rows', []))
+
+    if changes.get('added_rows'):
+        df = pd.concat([df, pd.DataFrame(changes['added_rows'])], ignore_index=True)
+
+    tickers = df['ticker'].fillna('').astype(str).str.strip().str.upper()
+    df = df[tickers.ne('')]
+
+    return {
+        'ticker': tickers[tickers.ne('')].to_numpy(dtype=str),
+        'shares': pd.to_numeric(df['shares']).to_numpy(dtype=np.float64),
+        'purchase_price': pd.to_numeric(df['purchase_price']).to_numpy(dtype=np.float64),
+        'purchase_date': pd.to_datetime(df['purchase_date']).to_numpy(dtype='datetime64[D]')
+    }
+
+
+# Each chart keeps one figure per session. Builders create the figure on
+# first use and afterwards only patch its trace data, and the chart is
+# rendered under a stable key so the browser updates it in place.
+def session_figure(name: str, build, *args) -> "go.Figure":
+    """Return this session's figure for a chart, built or patched with `args`."""
+    fig = build(*args, fig=st.session_state.get(name))
+    st.session_state[name] = fig
+    return fig
+
+
+def build_allocation_pie(tickers: np.ndarray, values: np.ndarray, fig=None) -> "go.Figure":
+    """Build (or patch) the holdings-by-value pie chart."""
+    import plotly.graph_objects as go
+
+    if fig is None:
+        fig = go.Figure(go.Pie())
+        fig.update_layout(title='Holdings by Value')
+
+    fig.update_traces(labels=tickers, values=values)
+
+    return fig
+
+
+def build_gain_loss_bar(tickers: np.ndarray, gain_loss: np.ndarray, gain_loss_pct: np.ndarray, fig=None) -> "go.Figure":
+    """Build (or patch) the gain/loss by position bar chart."""
+    import plotly.graph_objects as go
+
+    if fig is None:
+        fig = go.Figure(go.Bar(texttemplate='%{text:+.1f}%', textposition='outside'))
+        fig.update_layout(
+            title='Gain/Loss by Position',
+            xaxis_title='Ticker',
+            yaxis_title='Gain/Loss ($)',
+            showlegend=False
+        )
+
+    fig.update_traces(
+        x=tickers,
+        y=gain_loss,
+        marker_color=np.where(gain_loss >= 0, 'green', 'red'),
+        text=gain_loss_pct
+    )
+
+    return fig
+
+
+def build_benchmark_chart(symbol: str, closes: pd.Series, fig=None) -> "go.Figure":
+    """Build (or patch) the benchmark price chart."""
+    import plotly.graph_objects as go
+
+    if fig is None:
+        fig = go.Figure(go.Scatter(line=dict(color='blue', width=2)))
+        fig.update_layout(
+            xaxis_title="Date",
+            yaxis_title="Price ($)",
+            hovermode='x unified'
+        )
+
+    fig.update_traces(x=closes.index, y=closes.to_numpy(), name=symbol)
+    fig.update_layout(title=f"{symbol} - 1 Year Performance")
+
+    return fig
+
+
 st.title("💼 Portfolio Tracker")
 st.markdown("Track your holdings, performance, and allocation")
 
@@ -48,6 +222,7 @@ with st.sidebar:
         if uploaded_file is not None:
             try:
                 portfolio_df = pd.read_csv(uploaded_file)
+                holding_tickers = tuple(sorted(portfolio_df['ticker'].unique()))
                 st.success(f"✅ Loaded {len(portfolio_df)} holdings")
             except Exception as e:
                 st.error(f"Error reading file: {str(e)}")
@@ -60,7 +235,7 @@ with st.sidebar:
 
         # Initialize session state for holdings
         if 'holdings' not in st.session_state:
-            st.session_state.holdings = []
+            set_holdings(empty_holdings())
 
         # Input form
         with st.form("add_holding"):
@@ -77,31 +252,38 @@ with st.sidebar:
             submitted = st.form_submit_button("Add Holding")
 
             if submitted and ticker and shares > 0:
-                st.session_state.holdings.append({
-                    'ticker': ticker.upper(),
-                    'shares': shares,
-                    'purchase_price': purchase_price,
-                    'purchase_date': str(purchase_date)
-                })
+                set_holdings(append_holding(
+                    holdings_with_edits(st.session_state.holdings, st.session_state.get(holdings_editor_key())),
+                    ticker.upper(),
+                    shares,
+                    purchase_price,
+                    purchase_date
+                ))
                 st.success(f"Added {ticker}")
 
-        # Show current holdings
-        if st.session_state.holdings:
+        # Show current holdings in one editable grid; rows are changed or
+        # deleted in place and only reach the store when the holdings change
+        holdings = st.session_state.holdings
+
+        if len(holdings['ticker']):
             st.markdown("**Current Holdings:**")
-            for i, holding in enumerate(st.session_state.holdings):
-                col1, col2 = st.columns([3, 1])
-                with col1:
-                    st.text(f"{holding['ticker']}: {holding['shares']} @ ${holding['purchase_price']}")
-                with col2:
-                    if st.button("❌", key=f"del_{i}"):
-                        st.session_state.holdings.pop(i)
-                        st.rerun()
-
-            if st.button("Clear All", type="secondary"):
-                st.session_state.holdings = []
-                st.rerun()
-
-            portfolio_df = pd.DataFrame(st.session_state.holdings)
+            edited_df = st.data_editor(
+                pd.DataFrame(holdings, copy=False),
+                column_config=HOLDINGS_EDITOR_CONFIG,
+                num_rows='dynamic',
+                hide_index=True,
+                use_container_width=True,
+                key=holdings_editor_key()
+            )
+
+            portfolio_df = edited_df[
+                edited_df['ticker'].fillna('').astype(str).str.strip().ne('') & edited_df['shares'].gt(0)
+            ].assign(ticker=lambda df: df['ticker'].astype(str).str.strip().str.upper())
+
+            if has_pending_edits():
+                holding_tickers = tuple(sorted(portfolio_df['ticker'].unique()))
+            else:
+                holding_tickers = st.session_state.holding_tickers
         else:
             portfolio_df = None
 
@@ -116,29 +298,51 @@ with st.sidebar:
 # Main content
 if analyze_button and portfolio_df is not None and len(portfolio_df) > 0:
     try:
-        with st.spinner("Fetching current prices..."):
-            # Get current prices
-            tickers = portfolio_df['ticker'].unique().tolist()
-            price_data = fetch_multiple_tickers(tickers, period='1y', interval='1d')
-
-            if not price_data:
-                st.error("Could not fetch price data for any tickers.")
-                st.stop()
-
-            # Calculate current prices
-            current_prices = {}
-            for ticker, df in price_data.items():
-                if not df.empty:
-                    current_prices[ticker] = df['Close'].iloc[-1]
+        # Holdings, benchmark and the price-cache window identify an analysis,
+        # so re-clicking Analyze with unchanged inputs reuses the last result
+        fingerprint = (
+            tuple(portfolio_df[['ticker', 'shares', 'purchase_price']].itertuples(index=False, name=None)),
+            benchmark_ticker,
+            int(time.time() // PRICE_CACHE_TTL)
+        )
+        last_analysis = st.session_state.get('portfolio_analysis')
 
-            # Add current prices to portfolio
-            portfolio_df['current_price'] = portfolio_df['ticker'].map(current_prices)
+        with st.spinner("Fetching current prices..."):
+            if last_analysis is not None and last_analysis[0] == fingerprint:
+                portfolio_df, closes = last_analysis[1]
+            else:
+                # Get closes for every holding plus the benchmark in one
+                # batched download, as a single wide frame
+                closes = load_closes(tuple(sorted(set(holding_tickers) | {benchmark_ticker})), '1y', '1d')
+
+                if not closes.columns.isin(holding_tickers).any():
+                    st.error("Could not fetch price data for any tickers.")
+                    st.stop()
+
+                # Latest close per ticker (forward-filled over ragged endings)
+                latest = closes.ffill().iloc[-1]
+
+                # Look prices up once per distinct ticker, then gather them
+                # back to rows; the trailing NaN catches missing tickers (code -1)
+                codes, uniques = pd.factorize(portfolio_df['ticker'].to_numpy())
+                unique_prices = latest.reindex(uniques).to_numpy(dtype=np.float64)
+                current_price = np.append(unique_prices, np.nan)[codes]
+
+                # Calculate metrics on the raw arrays and attach them in one go
+                shares = portfolio_df['shares'].to_numpy(dtype=np.float64)
+                cost_basis = shares * portfolio_df['purchase_price'].to_numpy(dtype=np.float64)
+                current_value = shares * current_price
+                gain_loss = current_value - cost_basis
+
+                portfolio_df = portfolio_df.assign(
+                    current_price=current_price,
+                    cost_basis=cost_basis,
+                    current_value=current_value,
+                    gain_loss=gain_loss,
+                    gain_loss_pct=gain_loss / cost_basis * 100
+                )
 
-            # Calculate metrics
-            portfolio_df['cost_basis'] = portfolio_df['shares'] * portfolio_df['purchase_price']
-            portfolio_df['current_value'] = portfolio_df['shares'] * portfolio_df['current_price']
-            portfolio_df['gain_loss'] = portfolio_df['current_value'] - portfolio_df['cost_basis']
-            portfolio_df['gain_loss_pct'] = (portfolio_df['gain_loss'] / portfolio_df['cost_basis']) * 100
+                st.session_state['portfolio_analysis'] = (fingerprint, (portfolio_df, closes))
 
             # Overall metrics
             total_cost = portfolio_df['cost_basis'].sum()
@@ -173,20 +377,11 @@ if analyze_button and portfolio_df is not None and len(portfolio_df) > 0:
             # Holdings table
             st.subheader("Holdings Detail")
 
-            display_df = portfolio_df[[
-                'ticker', 'shares', 'purchase_price', 'current_price',
-                'cost_basis', 'current_value', 'gain_loss', 'gain_loss_pct'
-            ]].copy()
-
-            # Format columns
-            display_df['purchase_price'] = display_df['purchase_price'].apply(lambda x: f"${x:.2f}")
-            display_df['current_price'] = display_df['current_price'].apply(lambda x: f"${x:.2f}" if pd.notna(x) else "N/A")
-            display_df['cost_basis'] = display_df['cost_basis'].apply(lambda x: f"${x:,.2f}")
-            display_df['current_value'] = display_df['current_value'].apply(lambda x: f"${x:,.2f}" if pd.notna(x) else "N/A")
-            display_df['gain_loss'] = display_df['gain_loss'].apply(lambda x: f"${x:,.2f}" if pd.notna(x) else "N/A")
-            display_df['gain_loss_pct'] = display_df['gain_loss_pct'].apply(lambda x: f"{x:+.2f}%" if pd.notna(x) else "N/A")
-
-            st.dataframe(display_df, use_container_width=True)
+            st.dataframe(
+                portfolio_df[list(HOLDINGS_COLUMN_CONFIG)],
+                column_config=HOLDINGS_COLUMN_CONFIG,
+                use_container_width=True
+            )
 
             st.markdown("---")
 
@@ -196,36 +391,25 @@ if analyze_button and portfolio_df is not None and len(portfolio_df) > 0:
             with col1:
                 st.subheader("Portfolio Allocation")
 
-                fig = px.pie(
-                    portfolio_df,
-                    values='current_value',
-                    names='ticker',
-                    title='Holdings by Value'
+                fig = session_figure(
+                    'allocation_chart',
+                    build_allocation_pie,
+                    portfolio_df['ticker'].to_numpy(),
+                    portfolio_df['current_value'].to_numpy()
                 )
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(fig, use_container_width=True, key='allocation_chart')
 
             with col2:
                 st.subheader("Gain/Loss by Holding")
 
-                fig = go.Figure()
-                colors = ['green' if x >= 0 else 'red' for x in portfolio_df['gain_loss']]
-
-                fig.add_trace(go.Bar(
-                    x=portfolio_df['ticker'],
-                    y=portfolio_df['gain_loss'],
-                    marker_color=colors,
-                    text=portfolio_df['gain_loss_pct'].apply(lambda x: f"{x:+.1f}%"),
-                    textposition='outside'
-                ))
-
-                fig.update_layout(
-                    title='Gain/Loss by Position',
-                    xaxis_title='Ticker',
-                    yaxis_title='Gain/Loss ($)',
-                    showlegend=False
+                fig = session_figure(
+                    'gain_loss_chart',
+                    build_gain_loss_bar,
+                    portfolio_df['ticker'].to_numpy(),
+                    portfolio_df['gain_loss'].to_numpy(),
+                    portfolio_df['gain_loss_pct'].to_numpy()
                 )
-
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(fig, use_container_width=True, key='gain_loss_chart')
 
             # Performance comparison
             st.markdown("---")
@@ -233,18 +417,16 @@ if analyze_button and portfolio_df is not None and len(portfolio_df) > 0:
 
             with st.spinner(f"Comparing to {benchmark_ticker}..."):
                 try:
-                    benchmark_data = fetch_multiple_tickers([benchmark_ticker], period='1y', interval='1d')
-
-                    if benchmark_ticker in benchmark_data:
-                        benchmark_df = benchmark_data[benchmark_ticker]
+                    if benchmark_ticker in closes.columns:
+                        benchmark_closes = closes[benchmark_ticker].dropna()
 
                         # Calculate portfolio historical value (simplified)
                         # For a proper calculation, would need to track over time
                         st.info("Note: Detailed historical portfolio performance tracking requires transaction history over time.")
 
                         # Show benchmark performance
-                        bench_start = benchmark_df['Close'].iloc[0]
-                        bench_end = benchmark_df['Close'].iloc[-1]
+                        bench_start = benchmark_closes.iloc[0]
+                        bench_end = benchmark_closes.iloc[-1]
                         bench_return = ((bench_end - bench_start) / bench_start) * 100
 
                         col1, col2 = st.columns(2)
@@ -262,23 +444,13 @@ if analyze_button and portfolio_df is not None and len(portfolio_df) > 0:
                             )
 
                         # Show benchmark chart
-                        fig = go.Figure()
-
-                        fig.add_trace(go.Scatter(
-                            x=benchmark_df.index,
-                            y=benchmark_df['Close'],
-                            name=benchmark_ticker,
-                            line=dict(color='blue', width=2)
-                        ))
-
-                        fig.update_layout(
-                            title=f"{benchmark_ticker} - 1 Year Performance",
-                            xaxis_title="Date",
-                            yaxis_title="Price ($)",
-                            hovermode='x unified'
+                        fig = session_figure(
+                            'benchmark_chart',
+                            build_benchmark_chart,
+                            benchmark_ticker,
+                            benchmark_closes
                         )
-
-                        st.plotly_chart(fig, use_container_width=True)
+                        st.plotly_chart(fig, use_container_width=True, key='benchmark_chart')
 
                 except Exception as e:
                     st.warning(f"Could not fetch benchmark data: {str(e)}")
@@ -326,17 +498,9 @@ else:
     ### Download Template
     """)
 
-    template_df = pd.DataFrame({
-        'ticker': ['AAPL', 'MSFT', 'SPY'],
-        'shares': [10, 5, 20],
-        'purchase_price': [150.00, 350.00, 450.00],
-        'purchase_date': ['2024-01-15', '2024-02-01', '2024-01-10']
-    })
-
-    csv_template = template_df.to_csv(index=False)
     st.download_button(
         label="📥 Download CSV Template",
-        data=csv_template,
+        data=csv_template(),
         file_name="portfolio_template.csv",
         mime="text/csv"
     )
@@ -0,0 +1,316 @@
+"""
+Numba Kernels for Technical Indicators
+
+Single-pass loop implementations of the indicator recursions in
+`technical.py`. Each kernel operates on float64 NumPy arrays and returns
+a NumPy array matching the pandas implementation it replaces.
+
+The pandas wrappers only dispatch here when Numba is installed; without
+it the kernels still work (as slow pure Python) which keeps them testable.
+"""
+
+import numpy as np
+from src.utils._njit import njit, prange
+
+
+@njit(cache=True)
+def ema_kernel(values: np.ndarray, alpha: float) -> np.ndarray:
+    """
+    Exponential moving average matching `Series.ewm(alpha, adjust=False).mean()`.
+
+    Leading NaNs stay NaN. Interior NaNs repeat the previous value and
+    decay the old weight, the same way pandas does with ignore_na=False.
+
+    Args:
+        values: Input prices
+        alpha: Smoothing factor (2 / (span + 1) for a span-based EMA)
+
+    Returns:
+        np.ndarray: EMA values
+    """
+    n = values.shape[0]
+    out = np.empty(n)
+    out[:] = np.nan
+
+    ema = np.nan
+    old_wt = 1.0
+    started = False
+
+    for i in range(n):
+        x = values[i]
+
+        if not started:
+            if x == x:
+                ema = x
+                started = True
+                out[i] = ema
+            continue
+
+        old_wt *= 1.0 - alpha
+        if x == x:
+            ema = (old_wt * ema + alpha * x) / (old_wt + alpha)
+            old_wt = 1.0
+
+        out[i] = ema
+
+    return out
+
+
+@njit(cache=True)
+def rsi_kernel(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Wilder's RSI matching `calculate_rsi`.
+
+    Gains and losses are smoothed with `ema_kernel` at alpha = 1 / period,
+    so missing price changes are handled exactly like `Series.ewm`.
+
+    Args:
+        values: Input prices
+        period: Lookback period
+
+    Returns:
+        np.ndarray: RSI values (NaN until `period` price changes are seen)
+    """
+    n = values.shape[0]
+    out = np.empty(n)
+    out[:] = np.nan
+
+    gains = np.empty(n)
+    losses = np.empty(n)
+    gains[:] = np.nan
+    losses[:] = np.nan
+
+    for i in range(1, n):
+        delta = values[i] - values[i - 1]
+        if delta == delta:
+            gains[i] = max(delta, 0.0)
+            losses[i] = max(-delta, 0.0)
+
+    avg_gain = ema_kernel(gains, 1.0 / period)
+    avg_loss = ema_kernel(losses, 1.0 / period)
+
+    observed = 0
+    for i in range(n):
+        if gains[i] == gains[i]:
+            observed += 1
+        if observed < period:
+            continue
+
+        if avg_loss[i] == 0.0:
+            out[i] = 100.0 if avg_gain[i] > 0.0 else np.nan
+        else:
+            out[i] = 100.0 - 100.0 / (1.0 + avg_gain[i] / avg_loss[i])
+
+    return out
+
+
+@njit(cache=True, parallel=True)
+def rsi_columns_kernel(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    `rsi_kernel` applied to every column of a 2-D array.
+
+    Columns (one per ticker in a wide scan) are independent, so they are
+    spread across threads.
+
+    Args:
+        values: Input prices, shape (bars, tickers)
+        period: Lookback period
+
+    Returns:
+        np.ndarray: RSI values with the same shape as `values`
+    """
+    n, m = values.shape
+    out = np.empty((n, m))
+
+    for j in prange(m):
+        out[:, j] = rsi_kernel(values[:, j], period)
+
+    return out
+
+
+@njit(cache=True)
+def crossover_kernel(fast: np.ndarray, slow: np.ndarray) -> np.ndarray:
+    """
+    Crossover flags matching `identify_crossover`.
+
+    Args:
+        fast: First series values (e.g., fast MA)
+        slow: Second series values (e.g., slow MA)
+
+    Returns:
+        np.ndarray: 1 for bullish crossover, -1 for bearish, 0 otherwise
+    """
+    n = fast.shape[0]
+    out = np.zeros(n, dtype=np.int64)
+
+    for i in range(1, n):
+        if fast[i] > slow[i] and fast[i - 1] <= slow[i - 1]:
+            out[i] = 1
+        elif fast[i] < slow[i] and fast[i - 1] >= slow[i - 1]:
+            out[i] = -1
+
+    return out
+
+
+@njit(cache=True)
+def obv_kernel(close: np.ndarray, volume: np.ndarray) -> np.ndarray:
+    """
+    On-Balance Volume matching `calculate_obv`.
+
+    Args:
+        close: Closing prices
+        volume: Volume
+
+    Returns:
+        np.ndarray: OBV values
+    """
+    n = close.shape[0]
+    out = np.empty(n)
+    if n == 0:
+        return out
+
+    out[0] = volume[0]
+
+    for i in range(1, n):
+        if close[i] > close[i - 1]:
+            out[i] = out[i - 1] + volume[i]
+        elif close[i] < close[i - 1]:
+            out[i] = out[i - 1] - volume[i]
+        else:
+            out[i] = out[i - 1]
+
+    return out
+
+
+@njit(cache=True)
+def moving_averages_kernel(
+    values: np.ndarray,
+    sma_periods: np.ndarray,
+    ema_alphas: np.ndarray
+) -> np.ndarray:
+    """
+    Several SMAs and EMAs of one series in a single pass.
+
+    Each SMA keeps a running (compensated) window sum, matching
+    `Series.rolling(period).mean()`: a window containing a NaN is NaN.
+    Each EMA follows the same recursion as `ema_kernel`.
+
+    Args:
+        values: Input prices
+        sma_periods: SMA window lengths
+        ema_alphas: EMA smoothing factors (2 / (span + 1))
+
+    Returns:
+        np.ndarray: Array of shape (len(values), len(sma_periods) + len(ema_alphas)),
+            SMA columns first, in the order given
+    """
+    n = values.shape[0]
+    n_sma = sma_periods.shape[0]
+    n_ema = ema_alphas.shape[0]
+
+    out = np.empty((n, n_sma + n_ema))
+    out[:] = np.nan
+
+    sums = np.zeros(n_sma)
+    compensation = np.zeros(n_sma)
+    missing = np.zeros(n_sma, dtype=np.int64)
+
+    emas = np.empty(n_ema)
+    emas[:] = np.nan
+    old_wts = np.ones(n_ema)
+    started = False
+
+    for i in range(n):
+        x = values[i]
+        valid = x == x
+
+        for j in range(n_sma):
+            period = sma_periods[j]
+
+            # Add the new value and drop the one leaving the window
+            if valid:
+                y = x - compensation[j]
+                t = sums[j] + y
+                compensation[j] = (t - sums[j]) - y
+                sums[j] = t
+            else:
+                missing[j] += 1
+
+            if i >= period:
+                old = values[i - period]
+                if old == old:
+                    y = -old - compensation[j]
+                    t = sums[j] + y
+                    compensation[j] = (t - sums[j]) - y
+                    sums[j] = t
+                else:
+                    missing[j] -= 1
+
+            if i >= period - 1 and missing[j] == 0:
+                out[i, j] = sums[j] / period
+
+        if not started:
+            if not valid:
+                continue
+            started = True
+            for k in range(n_ema):
+                emas[k] = x
+                out[i, n_sma + k] = x
+            continue
+
+        for k in range(n_ema):
+            alpha = ema_alphas[k]
+            old_wts[k] *= 1.0 - alpha
+            if valid:
+                emas[k] = (old_wts[k] * emas[k] + alpha * x) / (old_wts[k] + alpha)
+                old_wts[k] = 1.0
+
+            out[i, n_sma + k] = emas[k]
+
+    return out
+
+
+@njit(cache=True)
+def vwap_kernel(high: np.ndarray, low: np.ndarray, close: np.ndarray, volume: np.ndarray) -> np.ndarray:
+    """
+    Cumulative VWAP matching `calculate_vwap`.
+
+    Running price-volume and volume totals each skip missing values, like
+    `Series.cumsum`; a bar with missing data is NaN itself.
+
+    Args:
+        high: High prices
+        low: Low prices
+        close: Closing prices
+        volume: Volume
+
+    Returns:
+        np.ndarray: VWAP values
+    """
+    n = volume.shape[0]
+    out = np.empty(n)
+    out[:] = np.nan
+
+    num = 0.0
+    den = 0.0
+
+    for i in range(n):
+        v = volume[i]
+        pv = (high[i] + low[i] + close[i]) / 3.0 * v
+
+        # Each total skips its own missing values, as cumsum does
+        if pv == pv:
+            num += pv
+        if v == v:
+            den += v
+        if pv != pv or v != v:
+            continue
+
+        if den != 0.0:
+            out[i] = num / den
+        elif num > 0.0:
+            out[i] = np.inf
+        elif num < 0.0:
+            out[i] = -np.inf
+
+    return out
@@ -13,38 +13,92 @@ Metrics included:
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Optional
+from typing import Dict, List, Optional
+
+
+# Metric name -> info keys, tried in order until one has a value
+BASIC_FIELDS = (
+    ('Company_Name', ('longName', 'shortName')),
+    ('Sector', ('sector',)),
+    ('Industry', ('industry',)),
+    ('Market_Cap', ('marketCap',)),
+    ('Current_Price', ('currentPrice', 'regularMarketPrice')),
+)
+
+VALUATION_FIELDS = (
+    ('PE_Ratio', ('trailingPE', 'forwardPE')),
+    ('PS_Ratio', ('priceToSalesTrailing12Months',)),
+    ('PB_Ratio', ('priceToBook',)),
+    ('PEG_Ratio', ('pegRatio',)),
+    ('EV_to_Revenue', ('enterpriseToRevenue',)),
+    ('EV_to_EBITDA', ('enterpriseToEbitda',)),
+)
+
+PROFITABILITY_FIELDS = (
+    ('EPS', ('trailingEps',)),
+    ('ROE', ('returnOnEquity',)),
+    ('ROA', ('returnOnAssets',)),
+    ('Gross_Margin', ('grossMargins',)),
+    ('Operating_Margin', ('operatingMargins',)),
+    ('Net_Margin', ('profitMargins',)),
+)
+
+FINANCIAL_HEALTH_FIELDS = (
+    ('Debt_to_Equity', ('debtToEquity',)),
+    ('Total_Debt', ('totalDebt',)),
+    ('Total_Cash', ('totalCash',)),
+    ('Current_Ratio', ('currentRatio',)),
+    ('Quick_Ratio', ('quickRatio',)),
+    ('Free_Cash_Flow', ('freeCashflow',)),
+    ('Operating_Cash_Flow', ('operatingCashflow',)),
+)
+
+GROWTH_FIELDS = (
+    ('Revenue_Growth', ('revenueGrowth',)),
+    ('Earnings_Growth', ('earningsGrowth',)),
+    ('Quarterly_Earnings_Growth', ('earningsQuarterlyGrowth',)),
+    ('Total_Revenue', ('totalRevenue',)),
+    ('Revenue_Per_Share', ('revenuePerShare',)),
+)
+
+DIVIDEND_FIELDS = (
+    ('Dividend_Yield', ('dividendYield',)),
+    ('Dividend_Rate', ('dividendRate',)),
+    ('Payout_Ratio', ('payoutRatio',)),
+    ('Five_Year_Avg_Dividend_Yield', ('fiveYearAvgDividendYield',)),
+)
+
+# Summary category -> fields
+METRIC_SPEC = (
+    ('Valuation', VALUATION_FIELDS),
+    ('Profitability', PROFITABILITY_FIELDS),
+    ('Financial_Health', FINANCIAL_HEALTH_FIELDS),
+    ('Growth', GROWTH_FIELDS),
+    ('Dividends', DIVIDEND_FIELDS),
+)
+
+
+def _extract(info: Dict, fields: tuple) -> Dict:
+    """Pull each field's first non-None info value (None if none are set)."""
+    return {
+        name: next((info[key] for key in keys if info.get(key) is not None), None)
+        for name, keys in fields
+    }
 
 
 def calculate_valuation_ratios(info: Dict) -> Dict:
     """
     Calculate key valuation ratios from ticker info.
 
+    P/E falls back to forward P/E when trailing P/E is unavailable.
+
     Args:
         info: Dictionary containing stock info from yfinance
 
     Returns:
         dict: Dictionary of valuation ratios
     """
-    ratios = {}
-
-    # Price-to-Earnings Ratio
-    ratios['PE_Ratio'] = info.get('trailingPE', None) or info.get('forwardPE', None)
-
-    # Price-to-Sales Ratio
-    ratios['PS_Ratio'] = info.get('priceToSalesTrailing12Months', None)
-
-    # Price-to-Book Ratio
-    ratios['PB_Ratio'] = info.get('priceToBook', None)
-
-    # PEG Ratio (P/E relative to growth)
-    ratios['PEG_Ratio'] = info.get('pegRatio', None)
-
-    # Enterprise Value multiples
-    ratios['EV_to_Revenue'] = info.get('enterpriseToRevenue', None)
-    ratios['EV_to_EBITDA'] = info.get('enterpriseToEbitda', None)
-
-    return ratios
+    return _extract(info, VALUATION_FIELDS)
 
 
 def calculate_profitability_metrics(info: Dict) -> Dict:
@@ -57,23 +111,7 @@ def calculate_profitability_metrics(info: Dict) -> Dict:
     Returns:
         dict: Dictionary of profitability metrics
     """
-    metrics = {}
-
-    # Earnings Per Share
-    metrics['EPS'] = info.get('trailingEps', None)
-
-    # Return on Equity
-    metrics['ROE'] = info.get('returnOnEquity', None)
-
-    # Return on Assets
-    metrics['ROA'] = info.get('returnOnAssets', None)
-
-    # Profit Margins
-    metrics['Gross_Margin'] = info.get('grossMargins', None)
-    metrics['Operating_Margin'] = info.get('operatingMargins', None)
-    metrics['Net_Margin'] = info.get('profitMargins', None)
-
-    return metrics
+    return _extract(info, PROFITABILITY_FIELDS)
 
 
 def calculate_financial_health(info: Dict) -> Dict:
@@ -86,22 +124,7 @@ def calculate_financial_health(info: Dict) -> Dict:
     Returns:
         dict: Dictionary of financial health metrics
     """
-    health = {}
-
-    # Debt metrics
-    health['Debt_to_Equity'] = info.get('debtToEquity', None)
-    health['Total_Debt'] = info.get('totalDebt', None)
-    health['Total_Cash'] = info.get('totalCash', None)
-
-    # Liquidity ratios
-    health['Current_Ratio'] = info.get('currentRatio', None)
-    health['Quick_Ratio'] = info.get('quickRatio', None)
-
-    # Free Cash Flow
-    health['Free_Cash_Flow'] = info.get('freeCashflow', None)
-    health['Operating_Cash_Flow'] = info.get('operatingCashflow', None)
-
-    return health
+    return _extract(info, FINANCIAL_HEALTH_FIELDS)
 
 
 def calculate_growth_metrics(info: Dict) -> Dict:
@@ -114,20 +137,7 @@ def calculate_growth_metrics(info: Dict) -> Dict:
     Returns:
         dict: Dictionary of growth metrics
     """
-    growth = {}
-
-    # Revenue growth
-    growth['Revenue_Growth'] = info.get('revenueGrowth', None)
-
-    # Earnings growth
-    growth['Earnings_Growth'] = info.get('earningsGrowth', None)
-    growth['Quarterly_Earnings_Growth'] = info.get('earningsQuarterlyGrowth', None)
-
-    # Revenue
-    growth['Total_Revenue'] = info.get('totalRevenue', None)
-    growth['Revenue_Per_Share'] = info.get('revenuePerShare', None)
-
-    return growth
+    return _extract(info, GROWTH_FIELDS)
 
 
 def get_dividend_metrics(info: Dict) -> Dict:
@@ -140,14 +150,29 @@ def get_dividend_metrics(info: Dict) -> Dict:
     Returns:
         dict: Dictionary of dividend metrics
     """
-    dividends = {}
+    return _extract(info, DIVIDEND_FIELDS)
 
-    dividends['Dividend_Yield'] = info.get('dividendYield', None)
-    dividends['Dividend_Rate'] = info.get('dividendRate', None)
-    dividends['Payout_Ratio'] = info.get('payoutRatio', None)
-    dividends['Five_Year_Avg_Dividend_Yield'] = info.get('fiveYearAvgDividendYield', None)
 
-    return dividends
+def _growth(statement: pd.DataFrame, labels: List[str]) -> Dict:
+    """
+    Period-over-period growth (%) of the two most recent columns for each
+    row label present in a financial statement.
+
+    Rows whose growth is undefined (previous period zero or missing) are
+    left out.
+    """
+    present = statement.index.intersection(labels)
+    if present.empty or statement.shape[1] < 2:
+        return {}
+
+    values = statement.loc[present].iloc[:, :2].to_numpy(dtype=np.float64)
+    current, previous = values[:, 0], values[:, 1]
+
+    growth = np.full(len(present), np.nan)
+    np.divide(current - previous, np.abs(previous), out=growth, where=previous != 0)
+    growth *= 100
+
+    return {label: g for label, g in zip(present, growth) if np.isfinite(g)}
 
 
 def analyze_financial_statements(statements: Dict[str, pd.DataFrame]) -> Dict:
@@ -166,21 +191,13 @@ def analyze_financial_statements(statements: Dict[str, pd.DataFrame]) -> Dict:
     balance_sheet = statements.get('balance_sheet')
     cash_flow = statements.get('cash_flow')
 
-    # Analyze Income Statement
+    # Analyze Income Statement (most recent vs previous period)
     if income_stmt is not None and not income_stmt.empty:
-        if 'Total Revenue' in income_stmt.index:
-            revenue = income_stmt.loc['Total Revenue']
-            if len(revenue) > 1:
-                # Calculate revenue growth (most recent vs previous)
-                revenue_growth = ((revenue.iloc[0] - revenue.iloc[1]) / abs(revenue.iloc[1])) * 100
-                analysis['Revenue_Growth_%'] = revenue_growth
-
-        if 'Net Income' in income_stmt.index:
-            net_income = income_stmt.loc['Net Income']
-            if len(net_income) > 1:
-                # Calculate earnings growth
-                earnings_growth = ((net_income.iloc[0] - net_income.iloc[1]) / abs(net_income.iloc[1])) * 100
-                analysis['Earnings_Growth_%'] = earnings_growth
+        growth = _growth(income_stmt, ['Total Revenue', 'Net Income'])
+        if 'Total Revenue' in growth:
+            analysis['Revenue_Growth_%'] = growth['Total Revenue']
+        if 'Net Income' in growth:
+            analysis['Earnings_Growth_%'] = growth['Net Income']
 
     # Analyze Balance Sheet
     if balance_sheet is not None and not balance_sheet.empty:
@@ -191,12 +208,9 @@ def analyze_financial_statements(statements: Dict[str, pd.DataFrame]) -> Dict:
 
     # Analyze Cash Flow
     if cash_flow is not None and not cash_flow.empty:
-        if 'Free Cash Flow' in cash_flow.index:
-            fcf = cash_flow.loc['Free Cash Flow']
-            if len(fcf) > 1 and fcf.iloc[1] != 0:
-                # Calculate FCF growth
-                fcf_growth = ((fcf.iloc[0] - fcf.iloc[1]) / abs(fcf.iloc[1])) * 100
-                analysis['FCF_Growth_%'] = fcf_growth
+        growth = _growth(cash_flow, ['Free Cash Flow'])
+        if 'Free Cash Flow' in growth:
+            analysis['FCF_Growth_%'] = growth['Free Cash Flow']
 
     return analysis
 
@@ -238,31 +252,27 @@ def simple_dcf_valuation(
             'intrinsic_value_per_share': None
         }
 
-    projected_fcf = []
-    discounted_fcf = []
-
     # Project FCF and discount to present value
-    for year in range(1, projection_years + 1):
-        fcf = current_fcf * ((1 + growth_rate) ** year)
-        pv = fcf / ((1 + discount_rate) ** year)
-        projected_fcf.append(fcf)
-        discounted_fcf.append(pv)
+    years = np.arange(1, projection_years + 1)
+    projected_fcf = current_fcf * (1 + growth_rate) ** years
+    discounted_fcf = projected_fcf / (1 + discount_rate) ** years
+    sum_pv_fcf = float(discounted_fcf.sum())
 
     # Calculate terminal value
     terminal_fcf = projected_fcf[-1] * (1 + terminal_growth_rate)
-    terminal_value = terminal_fcf / (discount_rate - terminal_growth_rate)
+    terminal_value = float(terminal_fcf / (discount_rate - terminal_growth_rate))
     discounted_terminal_value = terminal_value / ((1 + discount_rate) ** projection_years)
 
     # Sum all present values
-    enterprise_value = sum(discounted_fcf) + discounted_terminal_value
+    enterprise_value = sum_pv_fcf + discounted_terminal_value
 
     # Calculate per-share value
     intrinsic_value_per_share = enterprise_value / shares_outstanding if shares_outstanding > 0 else None
 
     return {
         'enterprise_value': enterprise_value,
-        'projected_fcf': projected_fcf,
-        'sum_pv_fcf': sum(discounted_fcf),
+        'projected_fcf': projected_fcf.tolist(),
+        'sum_pv_fcf': sum_pv_fcf,
         'terminal_value': terminal_value,
         'discounted_terminal_value': discounted_terminal_value,
         'intrinsic_value_per_share': intrinsic_value_per_share,
@@ -275,6 +285,64 @@ def simple_dcf_valuation(
     }
 
 
+def simple_dcf_valuation_batch(
+    current_fcf,
+    growth_rate=0.10,
+    terminal_growth_rate=0.03,
+    discount_rate=0.10,
+    projection_years: int = 5,
+    shares_outstanding=1.0
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized `simple_dcf_valuation` over arrays of inputs.
+
+    All arguments except `projection_years` may be scalars or NumPy arrays
+    and are broadcast together, e.g. a grid of growth and discount rates
+    for a sensitivity table.
+
+    Args:
+        current_fcf: Current free cash flow(s)
+        growth_rate: Expected FCF growth rate(s) (default: 10%)
+        terminal_growth_rate: Perpetual growth rate(s) (default: 3%)
+        discount_rate: Required rate(s) of return/WACC (default: 10%)
+        projection_years: Number of years to project (default: 5)
+        shares_outstanding: Number(s) of shares outstanding
+
+    Returns:
+        dict: Arrays of enterprise value, sum of discounted FCF, terminal
+            value, discounted terminal value and intrinsic value per share.
+            Entries with non-positive FCF are NaN.
+    """
+    fcf, g, tg, r, shares = np.broadcast_arrays(
+        *(np.asarray(x, dtype=np.float64) for x in (
+            current_fcf, growth_rate, terminal_growth_rate, discount_rate, shares_outstanding
+        ))
+    )
+
+    # Years run along a trailing axis so every scenario is projected at once
+    years = np.arange(1, projection_years + 1)
+    growth_factors = (1 + g[..., np.newaxis]) ** years
+    discount_factors = (1 + r[..., np.newaxis]) ** years
+    sum_pv_fcf = (fcf[..., np.newaxis] * growth_factors / discount_factors).sum(axis=-1)
+
+    terminal_value = fcf * growth_factors[..., -1] * (1 + tg) / (r - tg)
+    discounted_terminal_value = terminal_value / discount_factors[..., -1]
+    enterprise_value = sum_pv_fcf + discounted_terminal_value
+
+    valid = fcf > 0
+    enterprise_value = np.where(valid, enterprise_value, np.nan)
+
+    return {
+        'enterprise_value': enterprise_value,
+        'sum_pv_fcf': np.where(valid, sum_pv_fcf, np.nan),
+        'terminal_value': np.where(valid, terminal_value, np.nan),
+        'discounted_terminal_value': np.where(valid, discounted_terminal_value, np.nan),
+        'intrinsic_value_per_share': np.where(
+            valid & (shares > 0), enterprise_value / np.where(shares > 0, shares, 1.0), np.nan
+        )
+    }
+
+
 def create_fundamental_summary(info: Dict) -> Dict:
     """
     Create a comprehensive fundamental analysis summary.
@@ -285,20 +353,11 @@ def create_fundamental_summary(info: Dict) -> Dict:
     Returns:
         dict: Comprehensive dictionary of all fundamental metrics
     """
-    summary = {}
-
     # Basic info
-    summary['Company_Name'] = info.get('longName', info.get('shortName'))
-    summary['Sector'] = info.get('sector')
-    summary['Industry'] = info.get('industry')
-    summary['Market_Cap'] = info.get('marketCap')
-    summary['Current_Price'] = info.get('currentPrice', info.get('regularMarketPrice'))
-
-    # Add all metric categories
-    summary['Valuation'] = calculate_valuation_ratios(info)
-    summary['Profitability'] = calculate_profitability_metrics(info)
-    summary['Financial_Health'] = calculate_financial_health(info)
-    summary['Growth'] = calculate_growth_metrics(info)
-    summary['Dividends'] = get_dividend_metrics(info)
+    summary = _extract(info, BASIC_FIELDS)
+
+    # Add all metric categories in one pass over the spec
+    for category, fields in METRIC_SPEC:
+        summary[category] = _extract(info, fields)
 
     return summary
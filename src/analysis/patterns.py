@@ -11,6 +11,7 @@ Patterns included:
 
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from typing import List, Tuple, Optional, Dict
 
 
@@ -28,16 +29,9 @@ def identify_doji(df: pd.DataFrame, threshold: float = 0.1) -> pd.Series:
     Returns:
         pd.Series: Boolean series indicating Doji candles
     """
-    body_size = abs(df['Close'] - df['Open'])
-    candle_range = df['High'] - df['Low']
+    body, _, _, candle_range = _body_shadow(df)
 
-    # Avoid division by zero
-    candle_range = candle_range.replace(0, np.nan)
-
-    body_percentage = (body_size / candle_range) * 100
-
-    # Doji: body is very small relative to the range
-    is_doji = body_percentage < threshold
+    is_doji = pd.Series(_doji_from_arrays(body, candle_range, threshold), index=df.index)
 
     return is_doji
 
@@ -55,16 +49,29 @@ def identify_engulfing(df: pd.DataFrame) -> Tuple[pd.Series, pd.Series]:
     Returns:
         Tuple of (bullish_engulfing, bearish_engulfing) boolean series
     """
-    # Current candle
-    curr_open = df['Open']
-    curr_close = df['Close']
+    bullish_engulfing, bearish_engulfing = _engulfing(
+        df['Open'].to_numpy(dtype=np.float64),
+        df['Close'].to_numpy(dtype=np.float64)
+    )
+
+    bullish_engulfing = pd.Series(bullish_engulfing, index=df.index)
+    bearish_engulfing = pd.Series(bearish_engulfing, index=df.index)
+
+    return bullish_engulfing, bearish_engulfing
 
-    # Previous candle
-    prev_open = df['Open'].shift(1)
-    prev_close = df['Close'].shift(1)
+
+def _engulfing(open_: np.ndarray, close: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Engulfing flags from Open/Close arrays, comparing each candle with the
+    previous one through array slices (the first candle has no predecessor).
+    """
+    # Previous and current candles
+    prev_open, prev_close = open_[:-1], close[:-1]
+    curr_open, curr_close = open_[1:], close[1:]
 
     # Bullish Engulfing
-    bullish_engulfing = (
+    bullish_engulfing = np.zeros(open_.shape, dtype=bool)
+    bullish_engulfing[1:] = (
         (prev_close < prev_open) &  # Previous candle is bearish
         (curr_close > curr_open) &  # Current candle is bullish
         (curr_open < prev_close) &  # Current opens below previous close
@@ -72,7 +79,8 @@ def identify_engulfing(df: pd.DataFrame) -> Tuple[pd.Series, pd.Series]:
     )
 
     # Bearish Engulfing
-    bearish_engulfing = (
+    bearish_engulfing = np.zeros(open_.shape, dtype=bool)
+    bearish_engulfing[1:] = (
         (prev_close > prev_open) &  # Previous candle is bullish
         (curr_close < curr_open) &  # Current candle is bearish
         (curr_open > prev_close) &  # Current opens above previous close
@@ -82,6 +90,69 @@ def identify_engulfing(df: pd.DataFrame) -> Tuple[pd.Series, pd.Series]:
     return bullish_engulfing, bearish_engulfing
 
 
+def _body_shadow(df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Candle anatomy as arrays: (body, lower shadow, upper shadow, range).
+
+    The body top/bottom come from elementwise np.maximum/np.minimum of Open
+    and Close rather than row-wise DataFrame reductions.
+    """
+    open_, high, low, close = df[['Open', 'High', 'Low', 'Close']].to_numpy(dtype=np.float64).T
+
+    body = np.abs(close - open_)
+    lower_shadow = np.minimum(open_, close) - low
+    upper_shadow = high - np.maximum(open_, close)
+    candle_range = high - low
+
+    return body, lower_shadow, upper_shadow, candle_range
+
+
+def _doji_from_arrays(body: np.ndarray, candle_range: np.ndarray, threshold: float = 0.1) -> np.ndarray:
+    # Doji: body is very small relative to the range. Zero-range candles
+    # have no defined body percentage, so the division is masked instead
+    # of substituting NaN into a copy of the range.
+    body_pct = np.full(body.shape, np.nan)
+    np.divide(body, candle_range, out=body_pct, where=candle_range != 0)
+
+    return body_pct * 100 < threshold
+
+
+def _hammer_from_arrays(
+    body: np.ndarray,
+    lower_shadow: np.ndarray,
+    upper_shadow: np.ndarray,
+    candle_range: np.ndarray,
+    ratio: float = 2.0
+) -> np.ndarray:
+    # Hammer criteria:
+    # 1. Lower shadow is at least 2x the body
+    # 2. Upper shadow is small (less than body)
+    # 3. Body is small relative to range
+    return (
+        (lower_shadow > ratio * body) &
+        (upper_shadow < body) &
+        (body < 0.3 * candle_range)
+    )
+
+
+def _shooting_star_from_arrays(
+    body: np.ndarray,
+    lower_shadow: np.ndarray,
+    upper_shadow: np.ndarray,
+    candle_range: np.ndarray,
+    ratio: float = 2.0
+) -> np.ndarray:
+    # Shooting Star criteria:
+    # 1. Upper shadow is at least 2x the body
+    # 2. Lower shadow is small (less than body)
+    # 3. Body is small relative to range
+    return (
+        (upper_shadow > ratio * body) &
+        (lower_shadow < body) &
+        (body < 0.3 * candle_range)
+    )
+
+
 def identify_hammer(df: pd.DataFrame, ratio: float = 2.0) -> pd.Series:
     """
     Identify Hammer candlestick pattern.
@@ -96,21 +167,11 @@ def identify_hammer(df: pd.DataFrame, ratio: float = 2.0) -> pd.Series:
     Returns:
         pd.Series: Boolean series indicating Hammer candles
     """
-    body = abs(df['Close'] - df['Open'])
-    lower_shadow = df[['Open', 'Close']].min(axis=1) - df['Low']
-    upper_shadow = df['High'] - df[['Open', 'Close']].max(axis=1)
+    body, lower_shadow, upper_shadow, candle_range = _body_shadow(df)
 
-    # Hammer criteria:
-    # 1. Lower shadow is at least 2x the body
-    # 2. Upper shadow is small (less than body)
-    # 3. Body is small relative to range
-    candle_range = df['High'] - df['Low']
+    is_hammer = _hammer_from_arrays(body, lower_shadow, upper_shadow, candle_range, ratio)
 
-    is_hammer = (
-        (lower_shadow > ratio * body) &
-        (upper_shadow < body) &
-        (body < 0.3 * candle_range)
-    )
+    is_hammer = pd.Series(is_hammer, index=df.index)
 
     return is_hammer
 
@@ -129,21 +190,11 @@ def identify_shooting_star(df: pd.DataFrame, ratio: float = 2.0) -> pd.Series:
     Returns:
         pd.Series: Boolean series indicating Shooting Star candles
     """
-    body = abs(df['Close'] - df['Open'])
-    lower_shadow = df[['Open', 'Close']].min(axis=1) - df['Low']
-    upper_shadow = df['High'] - df[['Open', 'Close']].max(axis=1)
+    body, lower_shadow, upper_shadow, candle_range = _body_shadow(df)
 
-    # Shooting Star criteria:
-    # 1. Upper shadow is at least 2x the body
-    # 2. Lower shadow is small (less than body)
-    # 3. Body is small relative to range
-    candle_range = df['High'] - df['Low']
+    is_shooting_star = _shooting_star_from_arrays(body, lower_shadow, upper_shadow, candle_range, ratio)
 
-    is_shooting_star = (
-        (upper_shadow > ratio * body) &
-        (lower_shadow < body) &
-        (body < 0.3 * candle_range)
-    )
+    is_shooting_star = pd.Series(is_shooting_star, index=df.index)
 
     return is_shooting_star
 
@@ -163,18 +214,26 @@ def detect_consolidation(df: pd.DataFrame, window: int = 20, threshold: float =
     Returns:
         pd.Series: Boolean series indicating consolidation periods
     """
-    # Calculate rolling high and low
-    rolling_high = df['High'].rolling(window=window).max()
-    rolling_low = df['Low'].rolling(window=window).min()
+    high = df['High'].to_numpy(dtype=np.float64)
+    low = df['Low'].to_numpy(dtype=np.float64)
 
-    # Calculate price range as percentage of average price
-    avg_price = (rolling_high + rolling_low) / 2
-    price_range_pct = ((rolling_high - rolling_low) / avg_price) * 100
+    # The first window - 1 bars have no full window
+    is_consolidating = np.zeros(len(df), dtype=bool)
 
-    # Consolidation: price range is below threshold
-    is_consolidating = price_range_pct < (threshold * 100)
+    if len(df) >= window:
+        # Rolling high and low over strided windows (a window containing
+        # a missing price stays NaN and never counts as consolidating)
+        rolling_high = sliding_window_view(high, window).max(axis=1)
+        rolling_low = sliding_window_view(low, window).min(axis=1)
 
-    return is_consolidating
+        # Calculate price range as percentage of average price
+        avg_price = (rolling_high + rolling_low) / 2
+        price_range_pct = ((rolling_high - rolling_low) / avg_price) * 100
+
+        # Consolidation: price range is below threshold
+        is_consolidating[window - 1:] = price_range_pct < (threshold * 100)
+
+    return pd.Series(is_consolidating, index=df.index)
 
 
 def find_support_resistance_levels(
@@ -196,22 +255,26 @@ def find_support_resistance_levels(
     Returns:
         Tuple of (support_levels, resistance_levels) as lists of prices
     """
-    # Find local minima (potential support)
-    local_min = df['Low'][
-        (df['Low'].shift(1) > df['Low']) &
-        (df['Low'].shift(-1) > df['Low'])
-    ]
-
-    # Find local maxima (potential resistance)
-    local_max = df['High'][
-        (df['High'].shift(1) < df['High']) &
-        (df['High'].shift(-1) < df['High'])
-    ]
+    low = df['Low'].to_numpy(dtype=np.float64)
+    high = df['High'].to_numpy(dtype=np.float64)
+
+    # Find local minima (potential support) and maxima (potential resistance):
+    # interior bars strictly below / above both neighbours
+    local_min = low[1:-1][(low[1:-1] < low[:-2]) & (low[1:-1] < low[2:])]
+    local_max = high[1:-1][(high[1:-1] > high[:-2]) & (high[1:-1] > high[2:])]
 
     # Get the most significant levels (by frequency/clustering)
-    # For simplicity, just take the num_levels lowest and highest
-    support_levels = sorted(local_min.nlargest(num_levels * 2).unique())[:num_levels]
-    resistance_levels = sorted(local_max.nsmallest(num_levels * 2).unique(), reverse=True)[:num_levels]
+    # For simplicity, keep the lowest of the highest minima and the highest
+    # of the lowest maxima; np.partition selects them without a full sort
+    candidates = num_levels * 2
+
+    if len(local_min) > candidates:
+        local_min = np.partition(local_min, len(local_min) - candidates)[-candidates:]
+    if len(local_max) > candidates:
+        local_max = np.partition(local_max, candidates - 1)[:candidates]
+
+    support_levels = np.unique(local_min)[:num_levels]
+    resistance_levels = np.unique(local_max)[::-1][:num_levels]
 
     return support_levels.tolist(), resistance_levels.tolist()
 
@@ -250,30 +313,102 @@ def calculate_52_week_high_low(df: pd.DataFrame) -> Dict:
     }
 
 
-def add_all_patterns(df: pd.DataFrame) -> pd.DataFrame:
+def _candlestick_patterns(
+    df: pd.DataFrame,
+    doji_threshold: float = 0.1,
+    ratio: float = 2.0
+) -> Dict[str, np.ndarray]:
+    """
+    Detect every candlestick pattern in one pass over the OHLC columns.
+
+    Body, range and shadows are computed once and shared; results match
+    `identify_doji`, `identify_engulfing`, `identify_hammer` and
+    `identify_shooting_star` with their default parameters.
+    """
+    body, lower_shadow, upper_shadow, candle_range = _body_shadow(df)
+
+    bullish_engulfing, bearish_engulfing = _engulfing(
+        df['Open'].to_numpy(dtype=np.float64),
+        df['Close'].to_numpy(dtype=np.float64)
+    )
+
+    return {
+        'Doji': _doji_from_arrays(body, candle_range, doji_threshold),
+        'Bullish_Engulfing': bullish_engulfing,
+        'Bearish_Engulfing': bearish_engulfing,
+        'Hammer': _hammer_from_arrays(body, lower_shadow, upper_shadow, candle_range, ratio),
+        'Shooting_Star': _shooting_star_from_arrays(body, lower_shadow, upper_shadow, candle_range, ratio)
+    }
+
+
+# Bars of history kept ahead of a requested tail (the consolidation window)
+PATTERN_WARMUP = 20
+
+# Pattern columns in Pattern_Flags bit order (bit 0 = Doji), and their
+# summarize_patterns keys
+PATTERN_COUNTS = {
+    'Doji': 'doji_count',
+    'Bullish_Engulfing': 'bullish_engulfing_count',
+    'Bearish_Engulfing': 'bearish_engulfing_count',
+    'Hammer': 'hammer_count',
+    'Shooting_Star': 'shooting_star_count',
+    'Consolidation': 'consolidation_days'
+}
+
+
+def pack_pattern_flags(patterns: Dict[str, np.ndarray]) -> np.ndarray:
+    """
+    Pack the boolean pattern columns into one uint8 bitmask per row.
+
+    Bit i is set when the i-th pattern of PATTERN_COUNTS is present, so a
+    whole row of flags can be tested or counted without touching six columns.
+
+    Args:
+        patterns: Mapping of pattern column name to boolean array
+
+    Returns:
+        np.ndarray: uint8 flags
+    """
+    flags = np.zeros(len(patterns['Doji']), dtype=np.uint8)
+
+    for bit, column in enumerate(PATTERN_COUNTS):
+        flags |= np.asarray(patterns[column], dtype=np.uint8) << bit
+
+    return flags
+
+
+def add_all_patterns(df: pd.DataFrame, tail: Optional[int] = None) -> pd.DataFrame:
     """
     Add all pattern recognition indicators to a DataFrame.
 
     Args:
         df: DataFrame with OHLC data
+        tail: Only compute and return the last `tail` rows, using
+            PATTERN_WARMUP earlier bars for the lookback windows. Results
+            for those rows are identical to a full run.
 
     Returns:
-        pd.DataFrame: Original DataFrame with added pattern columns
+        pd.DataFrame: Original DataFrame (or its last `tail` rows) with
+            added pattern columns
     """
-    result_df = df.copy()
+    if tail is not None:
+        df = df.iloc[max(len(df) - tail - PATTERN_WARMUP, 0):]
 
     # Candlestick patterns
-    result_df['Doji'] = identify_doji(df)
-    bullish_engulfing, bearish_engulfing = identify_engulfing(df)
-    result_df['Bullish_Engulfing'] = bullish_engulfing
-    result_df['Bearish_Engulfing'] = bearish_engulfing
-    result_df['Hammer'] = identify_hammer(df)
-    result_df['Shooting_Star'] = identify_shooting_star(df)
+    patterns = _candlestick_patterns(df)
 
     # Chart patterns
-    result_df['Consolidation'] = detect_consolidation(df)
+    patterns['Consolidation'] = detect_consolidation(df).to_numpy()
+
+    # All of the above as one bitmask column
+    patterns['Pattern_Flags'] = pack_pattern_flags(patterns)
 
-    return result_df
+    # Recomputed patterns replace any existing columns of the same name
+    existing = df.columns.intersection(list(patterns))
+
+    result = pd.concat([df.drop(columns=existing), pd.DataFrame(patterns, index=df.index)], axis=1)
+
+    return result if tail is None else result.tail(tail)
 
 
 def summarize_patterns(df: pd.DataFrame) -> Dict:
@@ -286,21 +421,16 @@ def summarize_patterns(df: pd.DataFrame) -> Dict:
     Returns:
         dict: Summary of patterns found in recent periods
     """
-    # Add patterns
-    df_with_patterns = add_all_patterns(df)
-
-    # Look at last 30 days
-    recent = df_with_patterns.tail(30)
-
-    summary = {
-        'doji_count': recent['Doji'].sum(),
-        'bullish_engulfing_count': recent['Bullish_Engulfing'].sum(),
-        'bearish_engulfing_count': recent['Bearish_Engulfing'].sum(),
-        'hammer_count': recent['Hammer'].sum(),
-        'shooting_star_count': recent['Shooting_Star'].sum(),
-        'in_consolidation': recent['Consolidation'].iloc[-1] if len(recent) > 0 else False,
-        'consolidation_days': recent['Consolidation'].sum()
-    }
+    # Add patterns for the last 30 days only
+    recent = add_all_patterns(df, tail=30)
+
+    # Unpack the bitmask column and count every pattern in one reduction
+    flags = recent['Pattern_Flags'].to_numpy(dtype=np.uint8)
+    bits = np.unpackbits(flags[:, None], axis=1, bitorder='little')
+    counts = bits[:, :len(PATTERN_COUNTS)].sum(axis=0, dtype=np.int64)
+
+    summary = dict(zip(PATTERN_COUNTS.values(), counts))
+    summary['in_consolidation'] = recent['Consolidation'].iloc[-1] if len(recent) > 0 else False
 
     # Add support/resistance levels
     support, resistance = find_support_resistance_levels(df)
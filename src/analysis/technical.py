@@ -15,7 +15,17 @@ Indicators included:
 
 import pandas as pd
 import numpy as np
-from typing import Optional, Tuple
+from typing import Iterable, List, Optional, Tuple
+from src.utils._njit import NUMBA_AVAILABLE
+from src.analysis._numba_kernels import (
+    ema_kernel,
+    rsi_kernel,
+    rsi_columns_kernel,
+    crossover_kernel,
+    obv_kernel,
+    moving_averages_kernel,
+    vwap_kernel
+)
 
 
 def calculate_sma(data: pd.Series, period: int) -> pd.Series:
@@ -49,6 +59,10 @@ def calculate_ema(data: pd.Series, period: int) -> pd.Series:
     Returns:
         pd.Series: EMA values
     """
+    if NUMBA_AVAILABLE and isinstance(data, pd.Series):
+        values = ema_kernel(data.to_numpy(dtype=np.float64), 2.0 / (period + 1))
+        return pd.Series(values, index=data.index, name=data.name)
+
     return data.ewm(span=period, adjust=False).mean()
 
 
@@ -61,29 +75,40 @@ def calculate_rsi(data: pd.Series, period: int = 14) -> pd.Series:
 
     Formula:
         RSI = 100 - (100 / (1 + RS))
-        where RS = Average Gain / Average Loss over period
+        where RS = Average Gain / Average Loss, each smoothed with
+        Wilder's moving average (an EMA with alpha = 1 / period)
 
     Interpretation:
         - RSI > 70: Overbought (potential sell signal)
         - RSI < 30: Oversold (potential buy signal)
 
     Args:
-        data: Price series (typically Close prices)
+        data: Price series (typically Close prices), or a DataFrame with
+            one price column per ticker
         period: Lookback period (default: 14)
 
     Returns:
-        pd.Series: RSI values (0-100)
+        pd.Series: RSI values (0-100), a DataFrame for DataFrame input
     """
+    if NUMBA_AVAILABLE and isinstance(data, pd.Series):
+        values = rsi_kernel(data.to_numpy(dtype=np.float64), period)
+        return pd.Series(values, index=data.index, name=data.name)
+
+    # Wide frames (one column per ticker) run the columns in parallel
+    if NUMBA_AVAILABLE and isinstance(data, pd.DataFrame):
+        values = rsi_columns_kernel(data.to_numpy(dtype=np.float64), period)
+        return pd.DataFrame(values, index=data.index, columns=data.columns)
+
     # Calculate price changes
     delta = data.diff()
 
     # Separate gains and losses
-    gain = (delta.where(delta > 0, 0)).fillna(0)
-    loss = (-delta.where(delta < 0, 0)).fillna(0)
+    gain = delta.clip(lower=0)
+    loss = (-delta).clip(lower=0)
 
-    # Calculate average gain and loss
-    avg_gain = gain.rolling(window=period).mean()
-    avg_loss = loss.rolling(window=period).mean()
+    # Wilder's smoothing of the average gain and loss
+    avg_gain = gain.ewm(alpha=1 / period, adjust=False, min_periods=period).mean()
+    avg_loss = loss.ewm(alpha=1 / period, adjust=False, min_periods=period).mean()
 
     # Calculate RS and RSI
     rs = avg_gain / avg_loss
@@ -126,6 +151,15 @@ def calculate_macd(
     ema_fast = calculate_ema(data, fast_period)
     ema_slow = calculate_ema(data, slow_period)
 
+    return _macd_from_emas(ema_fast, ema_slow, signal_period)
+
+
+def _macd_from_emas(
+    ema_fast: pd.Series,
+    ema_slow: pd.Series,
+    signal_period: int = 9
+) -> Tuple[pd.Series, pd.Series, pd.Series]:
+    """MACD line, signal line and histogram from precomputed fast/slow EMAs."""
     # Calculate MACD line
     macd_line = ema_fast - ema_slow
 
@@ -198,6 +232,13 @@ def calculate_vwap(df: pd.DataFrame) -> pd.Series:
     Returns:
         pd.Series: VWAP values
     """
+    if NUMBA_AVAILABLE:
+        values = vwap_kernel(*(
+            df[column].to_numpy(dtype=np.float64)
+            for column in ('High', 'Low', 'Close', 'Volume')
+        ))
+        return pd.Series(values, index=df.index)
+
     # Calculate typical price
     typical_price = (df['High'] + df['Low'] + df['Close']) / 3
 
@@ -229,63 +270,159 @@ def calculate_obv(df: pd.DataFrame) -> pd.Series:
     Returns:
         pd.Series: OBV values
     """
-    obv = pd.Series(index=df.index, dtype='float64')
-    obv.iloc[0] = df['Volume'].iloc[0]
-
-    for i in range(1, len(df)):
-        if df['Close'].iloc[i] > df['Close'].iloc[i - 1]:
-            obv.iloc[i] = obv.iloc[i - 1] + df['Volume'].iloc[i]
-        elif df['Close'].iloc[i] < df['Close'].iloc[i - 1]:
-            obv.iloc[i] = obv.iloc[i - 1] - df['Volume'].iloc[i]
-        else:
-            obv.iloc[i] = obv.iloc[i - 1]
+    close = df['Close'].to_numpy(dtype=np.float64)
+    volume = df['Volume'].to_numpy(dtype=np.float64)
+
+    if NUMBA_AVAILABLE:
+        return pd.Series(obv_kernel(close, volume), index=df.index)
 
-    return obv
+    # Signed volume per bar (first bar seeds OBV), then a running total.
+    # Unchanged closes contribute nothing, even when their volume is missing.
+    change = np.diff(close)
+    signed_volume = np.empty_like(volume)
+    signed_volume[:1] = volume[:1]
+    signed_volume[1:] = np.where(change > 0, volume[1:], np.where(change < 0, -volume[1:], 0.0))
 
+    return pd.Series(np.cumsum(signed_volume), index=df.index)
 
-def add_all_indicators(df: pd.DataFrame) -> pd.DataFrame:
+
+def _moving_averages(data: pd.Series, sma_periods: List[int], ema_periods: List[int]) -> pd.DataFrame:
     """
-    Add all technical indicators to a DataFrame.
+    SMA_<period> and EMA_<period> columns for one price series.
 
-    This is a convenience function that calculates and adds all indicators
-    as new columns to the input DataFrame.
+    With Numba installed, all of them come from a single pass over the
+    prices instead of one pandas pass per average.
+    """
+    if NUMBA_AVAILABLE and (sma_periods or ema_periods):
+        values = moving_averages_kernel(
+            data.to_numpy(dtype=np.float64),
+            np.asarray(sma_periods, dtype=np.int64),
+            np.asarray([2.0 / (period + 1) for period in ema_periods], dtype=np.float64)
+        )
+        columns = [f'SMA_{p}' for p in sma_periods] + [f'EMA_{p}' for p in ema_periods]
+        return pd.DataFrame(values, index=data.index, columns=columns)
+
+    averages = {f'SMA_{p}': calculate_sma(data, p) for p in sma_periods}
+    averages.update({f'EMA_{p}': calculate_ema(data, p) for p in ema_periods})
+
+    return pd.DataFrame(averages, index=data.index)
+
+
+# Indicator groups understood by add_indicators, in column order
+ALL_INDICATORS = ('SMA_20', 'SMA_50', 'SMA_200', 'EMA', 'RSI', 'MACD', 'BB', 'VWAP', 'OBV')
+
+# Bars of history kept ahead of the requested tail (the longest window, SMA_200)
+INDICATOR_WARMUP = 200
+
+
+def add_indicators(
+    df: pd.DataFrame,
+    indicators: Iterable[str],
+    tail: Optional[int] = None
+) -> pd.DataFrame:
+    """
+    Add only the requested technical indicators to a DataFrame.
+
+    Indicator groups:
+        - SMA_20, SMA_50, SMA_200: Simple moving averages
+        - EMA: EMA_12 and EMA_26
+        - RSI: 14-period RSI
+        - MACD: MACD, MACD_Signal and MACD_Histogram
+        - BB: BB_Upper, BB_Middle and BB_Lower
+        - VWAP, OBV: Volume-based indicators (skipped without Volume data)
 
     Args:
         df: DataFrame with OHLCV data (Open, High, Low, Close, Volume)
+        indicators: Indicator groups to calculate (see ALL_INDICATORS)
+        tail: Only return the last `tail` rows. Windowed indicators are then
+            computed over those rows plus INDICATOR_WARMUP bars of history,
+            so EMA-based values (EMA, MACD, RSI) differ negligibly from a
+            full-history run; cumulative VWAP and OBV still use all of `df`.
 
     Returns:
-        pd.DataFrame: Original DataFrame with added indicator columns
+        pd.DataFrame: Original DataFrame (or its last `tail` rows) with
+            added indicator columns
+
+    Raises:
+        ValueError: If an unknown indicator group is requested
     """
-    result_df = df.copy()
+    wanted = set(indicators)
+    unknown = wanted - set(ALL_INDICATORS)
+    if unknown:
+        raise ValueError(f"Unknown indicators: {sorted(unknown)}")
+
+    # Windowed indicators only need enough history to fill their windows
+    if tail is not None:
+        source = df.iloc[max(len(df) - tail - INDICATOR_WARMUP, 0):]
+    else:
+        source = df
+    close = source['Close']
+
+    # Collect new columns and attach them in one concat, rather than
+    # copying the frame and inserting columns one at a time
+    columns = {}
 
     # Moving Averages
-    result_df['SMA_20'] = calculate_sma(df['Close'], 20)
-    result_df['SMA_50'] = calculate_sma(df['Close'], 50)
-    result_df['SMA_200'] = calculate_sma(df['Close'], 200)
-    result_df['EMA_12'] = calculate_ema(df['Close'], 12)
-    result_df['EMA_26'] = calculate_ema(df['Close'], 26)
+    sma_periods = [period for period in (20, 50, 200) if f'SMA_{period}' in wanted]
+    ema_periods = [12, 26] if 'EMA' in wanted else []
+
+    for name, values in _moving_averages(close, sma_periods, ema_periods).items():
+        columns[name] = values
 
     # RSI
-    result_df['RSI'] = calculate_rsi(df['Close'])
+    if 'RSI' in wanted:
+        columns['RSI'] = calculate_rsi(close)
 
     # MACD
-    macd, signal, histogram = calculate_macd(df['Close'])
-    result_df['MACD'] = macd
-    result_df['MACD_Signal'] = signal
-    result_df['MACD_Histogram'] = histogram
+    if 'MACD' in wanted:
+        # Reuse the 12/26 EMAs when they were already computed above
+        if 'EMA' in wanted:
+            ema_fast, ema_slow = columns['EMA_12'], columns['EMA_26']
+        else:
+            ema_fast, ema_slow = calculate_ema(close, 12), calculate_ema(close, 26)
+
+        macd, signal, histogram = _macd_from_emas(ema_fast, ema_slow)
+        columns['MACD'] = macd
+        columns['MACD_Signal'] = signal
+        columns['MACD_Histogram'] = histogram
 
     # Bollinger Bands
-    bb_upper, bb_middle, bb_lower = calculate_bollinger_bands(df['Close'])
-    result_df['BB_Upper'] = bb_upper
-    result_df['BB_Middle'] = bb_middle
-    result_df['BB_Lower'] = bb_lower
+    if 'BB' in wanted:
+        bb_upper, bb_middle, bb_lower = calculate_bollinger_bands(close)
+        columns['BB_Upper'] = bb_upper
+        columns['BB_Middle'] = bb_middle
+        columns['BB_Lower'] = bb_lower
 
-    # VWAP (if Volume data exists)
+    # VWAP and OBV (if Volume data exists)
     if 'Volume' in df.columns:
-        result_df['VWAP'] = calculate_vwap(df)
-        result_df['OBV'] = calculate_obv(df)
+        if 'VWAP' in wanted:
+            columns['VWAP'] = calculate_vwap(df).iloc[-len(source):]
+        if 'OBV' in wanted:
+            columns['OBV'] = calculate_obv(df).iloc[-len(source):]
 
-    return result_df
+    # Recomputed indicators replace any existing columns of the same name
+    existing = source.columns.intersection(list(columns))
+
+    result = pd.concat([source.drop(columns=existing), pd.DataFrame(columns, index=source.index)], axis=1)
+
+    return result if tail is None else result.tail(tail)
+
+
+def add_all_indicators(df: pd.DataFrame, tail: Optional[int] = None) -> pd.DataFrame:
+    """
+    Add all technical indicators to a DataFrame.
+
+    This is a convenience function that calculates and adds all indicators
+    as new columns to the input DataFrame.
+
+    Args:
+        df: DataFrame with OHLCV data (Open, High, Low, Close, Volume)
+        tail: Only compute and return the last `tail` rows (see add_indicators)
+
+    Returns:
+        pd.DataFrame: Original DataFrame with added indicator columns
+    """
+    return add_indicators(df, ALL_INDICATORS, tail=tail)
 
 
 def identify_crossover(series1: pd.Series, series2: pd.Series) -> pd.Series:
@@ -301,6 +438,23 @@ def identify_crossover(series1: pd.Series, series2: pd.Series) -> pd.Series:
                   -1 for bearish crossover (series1 crosses below series2),
                   0 for no crossover
     """
+    if series1.index.equals(series2.index):
+        fast = series1.to_numpy(dtype=np.float64)
+        slow = series2.to_numpy(dtype=np.float64)
+
+        if NUMBA_AVAILABLE:
+            values = crossover_kernel(fast, slow)
+        else:
+            # Compare each bar with the previous one through array slices
+            values = np.zeros(len(fast), dtype=np.int64)
+            prev_fast, prev_slow = fast[:-1], slow[:-1]
+            curr_fast, curr_slow = fast[1:], slow[1:]
+
+            values[1:][(curr_fast > curr_slow) & (prev_fast <= prev_slow)] = 1
+            values[1:][(curr_fast < curr_slow) & (prev_fast >= prev_slow)] = -1
+
+        return pd.Series(values, index=series1.index)
+
     crossover = pd.Series(0, index=series1.index)
 
     # Bullish crossover: series1 was below, now above
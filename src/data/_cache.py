@@ -0,0 +1,112 @@
+"""
+Disk Cache for Data Fetching
+
+A small pickle-based memoization decorator so repeated requests for the
+same data survive reruns and process restarts. Entries expire after a
+per-function TTL. Exceptions are not cached, except that a function may
+opt in to remembering `ValueError` misses (invalid ticker, no data) for a
+shorter TTL.
+
+The cache lives in `financial_dashboard/yfinance` under the user cache
+directory (`$XDG_CACHE_HOME`, falling back to `~/.cache`) unless the
+`DASHBOARD_CACHE_DIR` environment variable points elsewhere.
+"""
+
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+
+def cache_dir() -> Path:
+    """Directory holding cached results."""
+    override = os.environ.get('DASHBOARD_CACHE_DIR')
+    if override:
+        return Path(override)
+
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(Path.home(), '.cache')
+    return Path(base) / 'financial_dashboard' / 'yfinance'
+
+
+class _CachedMiss:
+    """Pickled in place of a result when a call raised ValueError."""
+
+    def __init__(self, message: str):
+        self.message = message
+
+
+def _write(path: Path, value) -> None:
+    # Write to a temp file and rename so concurrent readers never see a
+    # partial entry
+    tmp_path = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except Exception:
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def disk_cache(ttl: int, miss_ttl: int = 0) -> Callable:
+    """
+    Memoize a function's results on disk for `ttl` seconds.
+
+    Calls are keyed on the function name and its bound arguments (with
+    defaults applied), so positional and keyword calls share entries.
+    Cache read/write failures fall through to calling the function.
+
+    Args:
+        ttl: Seconds a cached result stays valid
+        miss_ttl: Seconds a `ValueError` raised by the function is replayed
+            instead of calling it again (default: 0, never cached)
+
+    Returns:
+        Decorator
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = repr((func.__module__, func.__qualname__, tuple(bound.arguments.items())))
+            path = cache_dir() / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.pkl"
+
+            cached = None
+            try:
+                age = time.time() - path.stat().st_mtime
+                if age < max(ttl, miss_ttl):
+                    with open(path, 'rb') as f:
+                        cached = pickle.load(f)
+            except Exception:
+                pass
+            else:
+                if isinstance(cached, _CachedMiss):
+                    if age < miss_ttl:
+                        raise ValueError(cached.message)
+                elif age < ttl:
+                    return cached
+
+            try:
+                result = func(*args, **kwargs)
+            except ValueError as e:
+                if miss_ttl > 0:
+                    _write(path, _CachedMiss(str(e)))
+                raise
+
+            _write(path, result)
+
+            return result
+
+        return wrapper
+
+    return decorator
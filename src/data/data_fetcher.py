@@ -7,18 +7,69 @@ This module provides functions to:
 - Download financial statements
 """
 
+import re
+import time
 import pandas as pd
 import yfinance as yf
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional, Union, List, Dict
 import warnings
+from src.data._cache import disk_cache
 
 # Suppress yfinance warnings
 warnings.filterwarnings('ignore')
 
+# Seconds fetched data is reused from the disk cache
+HISTORY_CACHE_TTL = 15 * 60
+INFO_CACHE_TTL = 60 * 60
+STATEMENTS_CACHE_TTL = 24 * 60 * 60
+
+# Seconds an invalid or empty history request is remembered, so repeated
+# scans of a bad ticker don't re-hit the API
+HISTORY_MISS_TTL = 5 * 60
+
+# Seconds a yf.Ticker object (and whatever it caches internally) is reused
+TICKER_CACHE_TTL = 15 * 60
+
+# Plausible Yahoo symbols: letters, digits and . - ^ = (e.g. BRK-B, ^GSPC, EURUSD=X)
+TICKER_PATTERN = re.compile(r'^[A-Z0-9.\-^=]{1,10}$')
+
+
+def get_ticker(symbol: str) -> yf.Ticker:
+    """
+    Return a shared `yf.Ticker` for a symbol.
+
+    Ticker objects are reused within a TTL window so repeated lookups share
+    one session and its internally cached responses, without serving them
+    indefinitely.
+
+    Args:
+        symbol: Stock ticker symbol
+
+    Returns:
+        yf.Ticker: Ticker object for the symbol
+    """
+    return _cached_ticker(symbol, int(time.time() // TICKER_CACHE_TTL))
+
+
+@lru_cache(maxsize=256)
+def _cached_ticker(symbol: str, window: int) -> yf.Ticker:
+    return yf.Ticker(symbol)
+
+
+def _is_valid_symbol(ticker: Optional[str]) -> bool:
+    """Cheap offline check that a ticker is a well-formed symbol."""
+    return isinstance(ticker, str) and TICKER_PATTERN.match(ticker.upper()) is not None
+
 
 def validate_ticker(ticker: Optional[str]) -> bool:
     """
-    Validate if a ticker symbol is valid by attempting to fetch its info.
+    Validate if a ticker symbol is valid.
+
+    The symbol is first checked for a plausible format, then confirmed
+    with a lightweight quote lookup (`fast_info`) rather than the full
+    `info` fundamentals request.
 
     Args:
         ticker: Stock ticker symbol (e.g., 'AAPL', 'SPY')
@@ -26,22 +77,19 @@ def validate_ticker(ticker: Optional[str]) -> bool:
     Returns:
         bool: True if ticker is valid, False otherwise
     """
-    if not ticker or not isinstance(ticker, str):
+    if not _is_valid_symbol(ticker):
         return False
 
     try:
-        stock = yf.Ticker(ticker)
-        info = stock.info
-
-        # Check if we got meaningful data back
-        if not info or 'symbol' not in info:
-            return False
+        last_price = get_ticker(ticker).fast_info['last_price']
 
-        return True
+        # Check if we got a real quote back
+        return last_price is not None and not pd.isna(last_price)
     except Exception:
         return False
 
 
+@disk_cache(ttl=HISTORY_CACHE_TTL, miss_ttl=HISTORY_MISS_TTL)
 def fetch_historical_data(
     ticker: str,
     period: Optional[str] = '1mo',
@@ -65,11 +113,13 @@ def fetch_historical_data(
     Raises:
         ValueError: If ticker is invalid or data cannot be fetched
     """
-    if not validate_ticker(ticker):
+    # Only the symbol format is checked up front; an unknown symbol
+    # surfaces as an empty history below
+    if not _is_valid_symbol(ticker):
         raise ValueError(f"Invalid ticker: {ticker}")
 
     try:
-        stock = yf.Ticker(ticker)
+        stock = get_ticker(ticker)
 
         # Fetch data using period or start/end dates
         if start and end:
@@ -96,47 +146,196 @@ def fetch_multiple_tickers(
     period: Optional[str] = '1mo',
     interval: Optional[str] = '1d',
     start: Optional[str] = None,
-    end: Optional[str] = None
+    end: Optional[str] = None,
+    max_workers: int = 8
 ) -> Dict[str, pd.DataFrame]:
     """
     Fetch historical data for multiple tickers.
 
+    All tickers are requested in one batched download. Any ticker the batch
+    misses (or all of them, if the batch fails) is retried individually,
+    with those requests run concurrently since each is dominated by
+    network latency.
+
     Args:
         tickers: List of ticker symbols
         period: Data period to download
         interval: Data interval
         start: Start date string (YYYY-MM-DD)
         end: End date string (YYYY-MM-DD)
+        max_workers: Number of per-ticker fallback requests run in parallel (default: 8)
 
     Returns:
-        dict: Dictionary mapping ticker symbols to their DataFrames
+        dict: Dictionary mapping ticker symbols to their DataFrames, in the
+            order of `tickers`
     """
     if not tickers:
         return {}
 
-    results = {}
+    try:
+        frames = fetch_batch_historical_data(tickers, period=period, interval=interval, start=start, end=end)
+    except ValueError as e:
+        print(f"Warning: {str(e)}")
+        frames = {}
 
-    for ticker in tickers:
+    def fetch(ticker):
         try:
-            df = fetch_historical_data(
+            return fetch_historical_data(
                 ticker=ticker,
                 period=period,
                 interval=interval,
                 start=start,
                 end=end
             )
-            results[ticker] = df
         except ValueError as e:
             # Skip invalid tickers, log warning
             print(f"Warning: Skipping {ticker} - {str(e)}")
-            continue
         except Exception as e:
             print(f"Warning: Error fetching {ticker} - {str(e)}")
+
+        return None
+
+    remaining = [ticker for ticker in tickers if ticker not in frames]
+
+    if remaining:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(remaining)))) as executor:
+            for ticker, df in zip(remaining, executor.map(fetch, remaining)):
+                if df is not None:
+                    frames[ticker] = df
+
+    return {ticker: frames[ticker] for ticker in tickers if ticker in frames}
+
+
+def _download(
+    tickers: List[str],
+    period: Optional[str],
+    interval: Optional[str],
+    start: Optional[str],
+    end: Optional[str],
+    group_by: str = 'column'
+) -> pd.DataFrame:
+    """Issue one threaded `yf.download` for a list of tickers."""
+    if start and end:
+        window = {'start': start, 'end': end}
+    else:
+        window = {'period': period}
+
+    try:
+        return yf.download(
+            tickers=" ".join(tickers), interval=interval, group_by=group_by,
+            auto_adjust=True, threads=True, progress=False, **window
+        )
+    except Exception as e:
+        raise ValueError(f"Error downloading batch of {len(tickers)} tickers: {str(e)}")
+
+
+def fetch_batch_historical_data(
+    tickers: List[str],
+    period: Optional[str] = '1mo',
+    interval: Optional[str] = '1d',
+    start: Optional[str] = None,
+    end: Optional[str] = None
+) -> Dict[str, pd.DataFrame]:
+    """
+    Fetch historical data for many tickers with a single batched download.
+
+    This skips per-ticker validation and issues one `yf.download` request
+    for the whole list. Tickers that come back without data are simply
+    left out of the result (`fetch_multiple_tickers` retries them).
+
+    Args:
+        tickers: List of ticker symbols
+        period: Data period to download
+        interval: Data interval
+        start: Start date string (YYYY-MM-DD)
+        end: End date string (YYYY-MM-DD)
+
+    Returns:
+        dict: Dictionary mapping ticker symbols to their DataFrames
+
+    Raises:
+        ValueError: If the batched download fails
+    """
+    if not tickers:
+        return {}
+
+    data = _download(tickers, period, interval, start, end, group_by='ticker')
+
+    if data is None or data.empty:
+        return {}
+
+    results = {}
+
+    for ticker in tickers:
+        # Single-ticker downloads may come back with flat columns
+        if isinstance(data.columns, pd.MultiIndex):
+            if ticker not in data.columns.get_level_values(0):
+                continue
+            df = data[ticker]
+        elif len(tickers) == 1:
+            df = data
+        else:
+            continue
+
+        df = df.dropna(how='all')
+        if df.empty:
             continue
 
+        df.index.name = 'Date'
+        results[ticker] = df
+
     return results
 
 
+def fetch_closes(
+    tickers: List[str],
+    period: Optional[str] = '1mo',
+    interval: Optional[str] = '1d',
+    start: Optional[str] = None,
+    end: Optional[str] = None
+) -> pd.DataFrame:
+    """
+    Fetch closing prices for many tickers as one wide DataFrame.
+
+    Uses a single batched download and keeps only the Close field, so the
+    latest price of every ticker is one row lookup away.
+
+    Args:
+        tickers: List of ticker symbols
+        period: Data period to download
+        interval: Data interval
+        start: Start date string (YYYY-MM-DD)
+        end: End date string (YYYY-MM-DD)
+
+    Returns:
+        pd.DataFrame: Close prices with a DatetimeIndex and one column per
+            ticker, in the order of `tickers`. Tickers without data are left out.
+
+    Raises:
+        ValueError: If the batched download fails
+    """
+    if not tickers:
+        return pd.DataFrame()
+
+    data = _download(tickers, period, interval, start, end)
+
+    if data is None or data.empty or 'Close' not in data.columns.get_level_values(0):
+        return pd.DataFrame()
+
+    closes = data['Close']
+
+    # Older yfinance returns flat columns for a single ticker
+    if isinstance(closes, pd.Series):
+        closes = closes.to_frame(tickers[0])
+
+    closes = closes.reindex(columns=[t for t in tickers if t in closes.columns])
+    closes = closes.dropna(axis=1, how='all')
+    closes.index.name = 'Date'
+
+    return closes
+
+
+@disk_cache(ttl=INFO_CACHE_TTL)
 def fetch_ticker_info(ticker: str) -> Dict:
     """
     Fetch fundamental information for a given ticker.
@@ -150,15 +349,16 @@ def fetch_ticker_info(ticker: str) -> Dict:
     Raises:
         ValueError: If ticker is invalid
     """
-    if not validate_ticker(ticker):
+    if not _is_valid_symbol(ticker):
         raise ValueError(f"Invalid ticker: {ticker}")
 
     try:
-        stock = yf.Ticker(ticker)
+        stock = get_ticker(ticker)
         info = stock.info
 
-        if not info:
-            raise ValueError(f"No information available for ticker: {ticker}")
+        # Unknown symbols come back without a symbol field
+        if not info or 'symbol' not in info:
+            raise ValueError(f"Invalid ticker: {ticker}")
 
         # Return the full info dictionary
         return info
@@ -169,6 +369,7 @@ def fetch_ticker_info(ticker: str) -> Dict:
         raise ValueError(f"Error fetching info for {ticker}: {str(e)}")
 
 
+@disk_cache(ttl=STATEMENTS_CACHE_TTL)
 def fetch_financial_statements(ticker: str) -> Dict[str, pd.DataFrame]:
     """
     Fetch financial statements (Income Statement, Balance Sheet, Cash Flow) for a ticker.
@@ -185,11 +386,11 @@ def fetch_financial_statements(ticker: str) -> Dict[str, pd.DataFrame]:
     Raises:
         ValueError: If ticker is invalid or statements cannot be fetched
     """
-    if not validate_ticker(ticker):
+    if not _is_valid_symbol(ticker):
         raise ValueError(f"Invalid ticker: {ticker}")
 
     try:
-        stock = yf.Ticker(ticker)
+        stock = get_ticker(ticker)
 
         # Fetch financial statements
         income_stmt = stock.financials
@@ -200,6 +401,11 @@ def fetch_financial_statements(ticker: str) -> Dict[str, pd.DataFrame]:
         if income_stmt is None or balance_sheet is None or cash_flow is None:
             raise ValueError(f"No financial statements available for ticker: {ticker}")
 
+        # Funds legitimately have no statements, so only probe the symbol
+        # when everything came back empty
+        if income_stmt.empty and balance_sheet.empty and cash_flow.empty and not validate_ticker(ticker):
+            raise ValueError(f"Invalid ticker: {ticker}")
+
         statements = {
             'income_statement': income_stmt,
             'balance_sheet': balance_sheet,
@@ -5,9 +5,19 @@ Functions for fetching and analyzing options chains.
 """
 
 import pandas as pd
-import yfinance as yf
+import numpy as np
 from typing import Optional, Dict, List
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from src.data.data_fetcher import get_ticker
+from src.data._cache import disk_cache
+from src.options.greeks import calculate_greeks_vectorized, calculate_time_to_expiration
+
+# Seconds a fetched options chain is reused from the disk cache
+OPTIONS_CACHE_TTL = 5 * 60
+
+# Chain columns used downstream; the rest of yfinance's chain is dropped at fetch time
+CHAIN_COLUMNS = ['strike', 'lastPrice', 'bid', 'ask', 'volume', 'openInterest', 'impliedVolatility']
 
 
 def fetch_options_expiration_dates(ticker: str) -> List[str]:
@@ -21,7 +31,7 @@ def fetch_options_expiration_dates(ticker: str) -> List[str]:
         list: List of expiration date strings (YYYY-MM-DD format)
     """
     try:
-        stock = yf.Ticker(ticker)
+        stock = get_ticker(ticker)
         return list(stock.options)
     except Exception as e:
         print(f"Error fetching expiration dates for {ticker}: {str(e)}")
@@ -35,6 +45,9 @@ def fetch_options_chain(
     """
     Fetch options chain for a given ticker and expiration date.
 
+    The nearest expiration is resolved first, so default and explicit
+    requests share the disk-cached chain (reused for OPTIONS_CACHE_TTL).
+
     Args:
         ticker: Stock ticker symbol
         expiration_date: Expiration date (YYYY-MM-DD). If None, uses nearest expiration.
@@ -43,7 +56,7 @@ def fetch_options_chain(
         dict: Dictionary with 'calls' and 'puts' DataFrames
     """
     try:
-        stock = yf.Ticker(ticker)
+        stock = get_ticker(ticker)
 
         # Get available expiration dates
         expirations = stock.options
@@ -57,20 +70,72 @@ def fetch_options_chain(
         elif expiration_date not in expirations:
             raise ValueError(f"Expiration date {expiration_date} not available. Available dates: {expirations}")
 
-        # Fetch options chain
-        options = stock.option_chain(expiration_date)
-
-        return {
-            'calls': options.calls,
-            'puts': options.puts,
-            'expiration_date': expiration_date,
-            'ticker': ticker
-        }
+        # Fetch options chain (cached once the expiration is resolved)
+        return _fetch_resolved_chain(ticker, expiration_date)
 
     except Exception as e:
         raise ValueError(f"Error fetching options chain for {ticker}: {str(e)}")
 
 
+@disk_cache(ttl=OPTIONS_CACHE_TTL)
+def _fetch_resolved_chain(ticker: str, expiration_date: str) -> Dict[str, pd.DataFrame]:
+    options = get_ticker(ticker).option_chain(expiration_date)
+
+    return {
+        'calls': _chain_columns(options.calls),
+        'puts': _chain_columns(options.puts),
+        'expiration_date': expiration_date,
+        'ticker': ticker
+    }
+
+
+def _chain_columns(options_df: pd.DataFrame) -> pd.DataFrame:
+    """Keep only the CHAIN_COLUMNS a chain actually has."""
+    return options_df[[col for col in CHAIN_COLUMNS if col in options_df.columns]]
+
+
+def fetch_options_chains_batch(
+    tickers: List[str],
+    expiration_date: Optional[str] = None,
+    max_workers: int = 8
+) -> Dict[str, Dict[str, pd.DataFrame]]:
+    """
+    Fetch options chains for several tickers concurrently.
+
+    Each chain is a separate request dominated by network latency, so the
+    per-ticker `fetch_options_chain` calls run on a thread pool.
+
+    Args:
+        tickers: List of ticker symbols
+        expiration_date: Expiration date (YYYY-MM-DD) for every ticker. If
+            None, each ticker uses its nearest expiration.
+        max_workers: Number of chains fetched in parallel (default: 8)
+
+    Returns:
+        dict: Dictionary mapping ticker symbols to their chains (as returned
+            by `fetch_options_chain`), in the order of `tickers`. Tickers
+            whose chain cannot be fetched are left out.
+    """
+    if not tickers:
+        return {}
+
+    def fetch(ticker):
+        try:
+            return fetch_options_chain(ticker, expiration_date)
+        except ValueError as e:
+            print(f"Warning: Skipping {ticker} - {str(e)}")
+            return None
+
+    chains = {}
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(tickers)))) as executor:
+        for ticker, chain in zip(tickers, executor.map(fetch, tickers)):
+            if chain is not None:
+                chains[ticker] = chain
+
+    return chains
+
+
 def filter_options_by_moneyness(
     options_df: pd.DataFrame,
     current_price: float,
@@ -90,10 +155,9 @@ def filter_options_by_moneyness(
     lower_bound = current_price * (1 - moneyness_range)
     upper_bound = current_price * (1 + moneyness_range)
 
-    filtered = options_df[
-        (options_df['strike'] >= lower_bound) &
-        (options_df['strike'] <= upper_bound)
-    ]
+    # One boolean mask over the raw strike array
+    strike = options_df['strike'].to_numpy()
+    filtered = options_df[(strike >= lower_bound) & (strike <= upper_bound)]
 
     return filtered
 
@@ -114,10 +178,12 @@ def find_liquid_options(
     Returns:
         pd.DataFrame: Filtered liquid options
     """
-    liquid = options_df[
-        (options_df['volume'] >= min_volume) &
-        (options_df['openInterest'] >= min_open_interest)
-    ]
+    # One boolean mask over the raw volume/open interest arrays
+    mask = np.logical_and(
+        options_df['volume'].to_numpy() >= min_volume,
+        options_df['openInterest'].to_numpy() >= min_open_interest
+    )
+    liquid = options_df[mask]
 
     return liquid
 
@@ -132,12 +198,46 @@ def calculate_option_spread(options_df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         pd.DataFrame: Options with spread columns added
     """
-    result_df = options_df.copy()
+    spread = options_df['ask'] - options_df['bid']
 
-    result_df['spread'] = result_df['ask'] - result_df['bid']
-    result_df['spread_pct'] = (result_df['spread'] / result_df['bid']) * 100
+    # assign returns a new frame without an explicit full copy up front
+    return options_df.assign(spread=spread, spread_pct=(spread / options_df['bid']) * 100)
 
-    return result_df
+
+def add_greeks(
+    options_df: pd.DataFrame,
+    current_price: float,
+    expiration_date: str,
+    option_type: str = 'calls',
+    risk_free_rate: float = 0.05
+) -> pd.DataFrame:
+    """
+    Add Black-Scholes Greeks for every contract in an options chain.
+
+    All strikes are priced in one vectorized call using each contract's
+    implied volatility.
+
+    Args:
+        options_df: Options DataFrame (calls or puts)
+        current_price: Current stock price
+        expiration_date: Expiration date (YYYY-MM-DD)
+        option_type: 'calls' or 'puts'
+        risk_free_rate: Risk-free interest rate (default: 5%)
+
+    Returns:
+        pd.DataFrame: Options with delta, gamma, theta, vega, rho and
+            theoretical_price columns added
+    """
+    greeks = calculate_greeks_vectorized(
+        S=current_price,
+        K=options_df['strike'].to_numpy(dtype=np.float64),
+        T=calculate_time_to_expiration(expiration_date),
+        r=risk_free_rate,
+        sigma=options_df['impliedVolatility'].to_numpy(dtype=np.float64),
+        is_call=option_type == 'calls'
+    )
+
+    return options_df.assign(**greeks)
 
 
 def get_option_summary_stats(options_chain: Dict[str, pd.DataFrame]) -> Dict:
@@ -154,14 +254,10 @@ def get_option_summary_stats(options_chain: Dict[str, pd.DataFrame]) -> Dict:
     puts = options_chain['puts']
 
     # Calculate put/call ratio
-    total_call_volume = calls['volume'].sum()
-    total_put_volume = puts['volume'].sum()
+    total_call_volume = np.nansum(calls['volume'].to_numpy())
+    total_put_volume = np.nansum(puts['volume'].to_numpy())
     put_call_ratio = total_put_volume / total_call_volume if total_call_volume > 0 else None
 
-    # Find highest open interest
-    max_call_oi = calls.loc[calls['openInterest'].idxmax()] if not calls.empty else None
-    max_put_oi = puts.loc[puts['openInterest'].idxmax()] if not puts.empty else None
-
     return {
         'expiration_date': options_chain['expiration_date'],
         'total_call_volume': total_call_volume,
@@ -169,11 +265,20 @@ def get_option_summary_stats(options_chain: Dict[str, pd.DataFrame]) -> Dict:
         'put_call_ratio': put_call_ratio,
         'num_call_strikes': len(calls),
         'num_put_strikes': len(puts),
-        'max_call_oi_strike': max_call_oi['strike'] if max_call_oi is not None else None,
-        'max_put_oi_strike': max_put_oi['strike'] if max_put_oi is not None else None
+        'max_call_oi_strike': _max_open_interest_strike(calls),
+        'max_put_oi_strike': _max_open_interest_strike(puts)
     }
 
 
+def _max_open_interest_strike(options_df: pd.DataFrame) -> Optional[float]:
+    """Strike with the highest open interest, read without building the row."""
+    if options_df.empty:
+        return None
+
+    open_interest = options_df['openInterest'].to_numpy(dtype=np.float64)
+    return options_df['strike'].to_numpy()[np.nanargmax(open_interest)]
+
+
 def display_options_chain(
     options_df: pd.DataFrame,
     option_type: str = 'calls'
@@ -196,9 +301,7 @@ def display_options_chain(
     # Check which columns exist
     available_cols = [col for col in display_cols if col in options_df.columns]
 
-    result = options_df[available_cols].copy()
-
-    # Rename for clarity
+    # Rename for clarity (selecting and renaming already yields a new frame)
     column_names = {
         'lastPrice': 'Last',
         'bid': 'Bid',
@@ -208,10 +311,11 @@ def display_options_chain(
         'impliedVolatility': 'IV'
     }
 
-    result = result.rename(columns=column_names)
+    result = options_df[available_cols].rename(columns=column_names)
 
-    # Format IV as percentage
+    # Format IV as percentage (printf-formatted across the whole column)
     if 'IV' in result.columns:
-        result['IV'] = result['IV'].apply(lambda x: f"{x*100:.1f}%" if pd.notna(x) else "N/A")
+        iv = result['IV'].to_numpy(dtype=np.float64) * 100
+        result['IV'] = np.where(np.isnan(iv), 'N/A', np.char.add(np.char.mod('%.1f', iv), '%'))
 
     return result
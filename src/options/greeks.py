@@ -11,10 +11,24 @@ Calculate and explain the options Greeks:
 Uses Black-Scholes model for calculations.
 """
 
+import math
+from functools import lru_cache
 import numpy as np
-from scipy.stats import norm
-from typing import Dict, Optional
-from datetime import datetime, date
+from scipy.special import ndtr
+from typing import Dict, Optional, Tuple, Union
+from datetime import date
+from src.utils._njit import NUMBA_AVAILABLE
+from src.options._numba_kernels import greeks_kernel
+
+
+# Normal CDF/PDF are evaluated directly (scipy.special.ndtr and the closed
+# form density) rather than through scipy.stats.norm's per-call overhead
+_INV_SQRT_2PI = 1.0 / math.sqrt(2 * math.pi)
+
+
+def _norm_pdf(x):
+    """Standard normal density."""
+    return np.exp(-0.5 * x * x) * _INV_SQRT_2PI
 
 
 def calculate_time_to_expiration(expiration_date: str) -> float:
@@ -27,18 +41,80 @@ def calculate_time_to_expiration(expiration_date: str) -> float:
     Returns:
         float: Time to expiration in years
     """
+    # Today is part of the cache key, so cached values roll over at midnight
+    return _time_to_expiration(expiration_date, date.today().toordinal())
+
+
+@lru_cache(maxsize=256)
+def _time_to_expiration(expiration_date, today_ordinal: int) -> float:
     if isinstance(expiration_date, str):
-        exp_date = datetime.strptime(expiration_date, '%Y-%m-%d').date()
+        exp_date = date.fromisoformat(expiration_date)
     else:
         exp_date = expiration_date
 
-    today = date.today()
-    days_to_expiration = (exp_date - today).days
+    days_to_expiration = exp_date.toordinal() - today_ordinal
 
     # Convert to years
     return max(days_to_expiration / 365.0, 0.001)  # Minimum to avoid division issues
 
 
+def calculate_times_to_expiration(expiration_dates) -> np.ndarray:
+    """
+    Calculate time to expiration in years for many expirations at once.
+
+    Dates are converted to `datetime64[D]` and differenced against today in
+    one array operation, with the same floor as `calculate_time_to_expiration`.
+
+    Args:
+        expiration_dates: Array-like of date strings (YYYY-MM-DD), dates or
+            datetime64 values
+
+    Returns:
+        np.ndarray: Time to expiration in years for each date
+    """
+    exp_days = np.asarray(expiration_dates, dtype='datetime64[D]')
+    days_to_expiration = (exp_days - np.datetime64(date.today(), 'D')).astype(np.int64)
+
+    return np.maximum(days_to_expiration / 365.0, 0.001)
+
+
+def _d1_d2(S: float, K: float, T: float, r: float, sigma: float) -> Tuple[float, float, float]:
+    """Black-Scholes d1, d2 and sqrt(T)."""
+    sqrt_t = np.sqrt(T)
+    d1 = (np.log(S / K) + (r + 0.5 * sigma ** 2) * T) / (sigma * sqrt_t)
+    d2 = d1 - sigma * sqrt_t
+
+    return d1, d2, sqrt_t
+
+
+def _bs_core(
+    S: float,
+    K: float,
+    T: float,
+    r: float,
+    sigma: float,
+    option_type: str = 'call'
+) -> Tuple[float, float, float, float, float, float, float]:
+    """
+    Shared Black-Scholes terms, computed once for pricing and all Greeks.
+
+    The normal CDFs are taken on the side that matters for the option type
+    (N(d1), N(d2) for calls; N(-d1), N(-d2) for puts), so put values don't
+    lose precision to 1 - N(x) cancellation.
+
+    Returns:
+        Tuple of (d1, d2, sqrt(T), N(±d1), N(±d2), pdf(d1), exp(-r * T))
+    """
+    d1, d2, sqrt_t = _d1_d2(S, K, T, r, sigma)
+    sign = 1.0 if option_type == 'call' else -1.0
+
+    return (
+        d1, d2, sqrt_t,
+        ndtr(sign * d1), ndtr(sign * d2), _norm_pdf(d1),
+        np.exp(-r * T)
+    )
+
+
 def black_scholes_call(
     S: float,
     K: float,
@@ -62,10 +138,9 @@ def black_scholes_call(
     if T <= 0:
         return max(S - K, 0)
 
-    d1 = (np.log(S / K) + (r + 0.5 * sigma ** 2) * T) / (sigma * np.sqrt(T))
-    d2 = d1 - sigma * np.sqrt(T)
+    _, _, _, nd1, nd2, _, disc = _bs_core(S, K, T, r, sigma, 'call')
 
-    call_price = S * norm.cdf(d1) - K * np.exp(-r * T) * norm.cdf(d2)
+    call_price = S * nd1 - K * disc * nd2
 
     return call_price
 
@@ -93,10 +168,9 @@ def black_scholes_put(
     if T <= 0:
         return max(K - S, 0)
 
-    d1 = (np.log(S / K) + (r + 0.5 * sigma ** 2) * T) / (sigma * np.sqrt(T))
-    d2 = d1 - sigma * np.sqrt(T)
+    _, _, _, nd1, nd2, _, disc = _bs_core(S, K, T, r, sigma, 'put')
 
-    put_price = K * np.exp(-r * T) * norm.cdf(-d2) - S * norm.cdf(-d1)
+    put_price = K * disc * nd2 - S * nd1
 
     return put_price
 
@@ -138,12 +212,12 @@ def calculate_delta(
         else:
             return -1.0 if S < K else 0.0
 
-    d1 = (np.log(S / K) + (r + 0.5 * sigma ** 2) * T) / (sigma * np.sqrt(T))
+    d1, _, _ = _d1_d2(S, K, T, r, sigma)
 
     if option_type == 'call':
-        delta = norm.cdf(d1)
+        delta = ndtr(d1)
     else:  # put
-        delta = norm.cdf(d1) - 1
+        delta = ndtr(d1) - 1
 
     return delta
 
@@ -179,9 +253,9 @@ def calculate_gamma(
     if T <= 0:
         return 0
 
-    d1 = (np.log(S / K) + (r + 0.5 * sigma ** 2) * T) / (sigma * np.sqrt(T))
+    d1, _, sqrt_t = _d1_d2(S, K, T, r, sigma)
 
-    gamma = norm.pdf(d1) / (S * sigma * np.sqrt(T))
+    gamma = _norm_pdf(d1) / (S * sigma * sqrt_t)
 
     return gamma
 
@@ -219,19 +293,12 @@ def calculate_theta(
     if T <= 0:
         return 0
 
-    d1 = (np.log(S / K) + (r + 0.5 * sigma ** 2) * T) / (sigma * np.sqrt(T))
-    d2 = d1 - sigma * np.sqrt(T)
+    _, _, sqrt_t, _, nd2, pdf_d1, disc = _bs_core(S, K, T, r, sigma, option_type)
 
     if option_type == 'call':
-        theta = (
-            -S * norm.pdf(d1) * sigma / (2 * np.sqrt(T))
-            - r * K * np.exp(-r * T) * norm.cdf(d2)
-        )
+        theta = -S * pdf_d1 * sigma / (2 * sqrt_t) - r * K * disc * nd2
     else:  # put
-        theta = (
-            -S * norm.pdf(d1) * sigma / (2 * np.sqrt(T))
-            + r * K * np.exp(-r * T) * norm.cdf(-d2)
-        )
+        theta = -S * pdf_d1 * sigma / (2 * sqrt_t) + r * K * disc * nd2
 
     # Convert to per-day theta
     theta_per_day = theta / 365
@@ -270,9 +337,9 @@ def calculate_vega(
     if T <= 0:
         return 0
 
-    d1 = (np.log(S / K) + (r + 0.5 * sigma ** 2) * T) / (sigma * np.sqrt(T))
+    d1, _, sqrt_t = _d1_d2(S, K, T, r, sigma)
 
-    vega = S * norm.pdf(d1) * np.sqrt(T)
+    vega = S * _norm_pdf(d1) * sqrt_t
 
     # Convert to per 1% change
     vega = vega / 100
@@ -312,13 +379,12 @@ def calculate_rho(
     if T <= 0:
         return 0
 
-    d1 = (np.log(S / K) + (r + 0.5 * sigma ** 2) * T) / (sigma * np.sqrt(T))
-    d2 = d1 - sigma * np.sqrt(T)
+    d1, d2, _ = _d1_d2(S, K, T, r, sigma)
 
     if option_type == 'call':
-        rho = K * T * np.exp(-r * T) * norm.cdf(d2)
+        rho = K * T * np.exp(-r * T) * ndtr(d2)
     else:  # put
-        rho = -K * T * np.exp(-r * T) * norm.cdf(-d2)
+        rho = -K * T * np.exp(-r * T) * ndtr(-d2)
 
     # Convert to per 1% change
     rho = rho / 100
@@ -348,23 +414,122 @@ def calculate_all_greeks(
     Returns:
         dict: All Greeks values
     """
+    if T <= 0:
+        greeks = {
+            'delta': calculate_delta(S, K, T, r, sigma, option_type),
+            'gamma': 0,
+            'theta': 0,
+            'vega': 0,
+            'rho': 0
+        }
+
+        if option_type == 'call':
+            greeks['theoretical_price'] = black_scholes_call(S, K, T, r, sigma)
+        else:
+            greeks['theoretical_price'] = black_scholes_put(S, K, T, r, sigma)
+
+        return greeks
+
+    # d1/d2 and the normal CDF/PDF values are shared by every Greek
+    _, _, sqrt_t, nd1, nd2, pdf_d1, disc = _bs_core(S, K, T, r, sigma, option_type)
+    sign = 1.0 if option_type == 'call' else -1.0
+
     greeks = {
-        'delta': calculate_delta(S, K, T, r, sigma, option_type),
-        'gamma': calculate_gamma(S, K, T, r, sigma),
-        'theta': calculate_theta(S, K, T, r, sigma, option_type),
-        'vega': calculate_vega(S, K, T, r, sigma),
-        'rho': calculate_rho(S, K, T, r, sigma, option_type)
+        'delta': sign * nd1,
+        'gamma': pdf_d1 / (S * sigma * sqrt_t),
+        'theta': (-S * pdf_d1 * sigma / (2 * sqrt_t) - sign * r * K * disc * nd2) / 365,
+        'vega': S * pdf_d1 * sqrt_t / 100,
+        'rho': sign * K * T * disc * nd2 / 100,
+        'theoretical_price': sign * (S * nd1 - K * disc * nd2)
     }
 
-    # Add theoretical price
-    if option_type == 'call':
-        greeks['theoretical_price'] = black_scholes_call(S, K, T, r, sigma)
-    else:
-        greeks['theoretical_price'] = black_scholes_put(S, K, T, r, sigma)
-
     return greeks
 
 
+def calculate_greeks_vectorized(
+    S: Union[float, np.ndarray],
+    K: Union[float, np.ndarray],
+    T: Union[float, np.ndarray],
+    r: Union[float, np.ndarray],
+    sigma: Union[float, np.ndarray],
+    is_call: Union[bool, np.ndarray] = True
+) -> Dict[str, np.ndarray]:
+    """
+    Calculate price and all Greeks for many options at once.
+
+    Inputs broadcast against each other, so a whole chain (arrays of
+    strikes, IVs and call/put flags against one stock price) is priced in
+    a few array operations instead of a Python loop of scalar calls.
+    Values match `calculate_all_greeks` element by element, including
+    intrinsic value and zero Greeks for expired options (T <= 0). With
+    Numba installed the chain is priced by a compiled, parallel loop.
+
+    Args:
+        S: Current stock price(s)
+        K: Strike price(s)
+        T: Time(s) to expiration (years)
+        r: Risk-free interest rate(s)
+        sigma: Implied volatility(ies)
+        is_call: True for calls, False for puts
+
+    Returns:
+        dict: Arrays for delta, gamma, theta, vega, rho and theoretical_price
+    """
+    S, K, T, r, sigma = (np.asarray(a, dtype=np.float64) for a in (S, K, T, r, sigma))
+    is_call = np.asarray(is_call, dtype=bool)
+    shape = np.broadcast_shapes(S.shape, K.shape, T.shape, r.shape, sigma.shape, is_call.shape)
+
+    if NUMBA_AVAILABLE:
+        values = greeks_kernel(*(
+            np.ascontiguousarray(np.broadcast_to(a, shape)).ravel()
+            for a in (S, K, T, r, sigma, is_call)
+        ))
+        names = ('delta', 'gamma', 'theta', 'vega', 'rho', 'theoretical_price')
+        return {name: values[:, i].reshape(shape) for i, name in enumerate(names)}
+
+    sign = np.where(is_call, 1.0, -1.0)
+    live = T > 0
+
+    # Time terms depend only on T and r, so they are computed at their own
+    # shape (once per expiration for a chain), not once per contract.
+    # Expired options take the intrinsic branch below; give them a
+    # harmless T so the shared terms stay finite.
+    t = np.where(live, T, 1.0)
+    sqrt_t = np.sqrt(t)
+    disc = np.exp(-r * t)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        vol_t = sigma * sqrt_t
+        d1 = (np.log(S / K) + (r + 0.5 * sigma ** 2) * t) / vol_t
+        d2 = d1 - vol_t
+
+        nd1 = ndtr(sign * d1)
+        nd2 = ndtr(sign * d2)
+        pdf_d1 = _norm_pdf(d1)
+
+        gamma = pdf_d1 / (S * vol_t)
+        theta = (-S * pdf_d1 * sigma / (2 * sqrt_t) - sign * r * K * disc * nd2) / 365
+
+    expired_delta = np.where(is_call, (S > K).astype(np.float64), -(S < K).astype(np.float64))
+
+    greeks = {
+        'delta': np.where(live, sign * nd1, expired_delta),
+        'gamma': np.where(live, gamma, 0.0),
+        'theta': np.where(live, theta, 0.0),
+        'vega': np.where(live, S * pdf_d1 * sqrt_t / 100, 0.0),
+        'rho': np.where(live, sign * K * T * disc * nd2 / 100, 0.0),
+        'theoretical_price': np.where(
+            live, sign * (S * nd1 - K * disc * nd2), np.maximum(sign * (S - K), 0.0)
+        )
+    }
+
+    # Terms that skip an input (gamma ignores is_call) come back smaller
+    return {
+        name: values if values.shape == shape else np.broadcast_to(values, shape).copy()
+        for name, values in greeks.items()
+    }
+
+
 def explain_greeks() -> Dict[str, str]:
     """
     Return explanations of each Greek.
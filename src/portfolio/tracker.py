@@ -20,18 +20,29 @@ def calculate_portfolio_value(holdings: pd.DataFrame, current_prices: Dict[str,
     Returns:
         pd.DataFrame: Holdings with added value and P/L columns
     """
-    result_df = holdings.copy()
-
-    # Add current prices
-    result_df['current_price'] = result_df['ticker'].map(current_prices)
-
-    # Calculate values
-    result_df['cost_basis'] = result_df['shares'] * result_df['purchase_price']
-    result_df['current_value'] = result_df['shares'] * result_df['current_price']
-    result_df['gain_loss'] = result_df['current_value'] - result_df['cost_basis']
-    result_df['gain_loss_pct'] = (result_df['gain_loss'] / result_df['cost_basis']) * 100
-
-    return result_df
+    # Look up current prices (missing tickers become NaN)
+    current_price = np.array(
+        [current_prices.get(ticker, np.nan) for ticker in holdings['ticker']],
+        dtype=np.float64
+    )
+
+    # Calculate values on the raw arrays
+    shares = holdings['shares'].to_numpy(dtype=np.float64)
+    cost_basis = shares * holdings['purchase_price'].to_numpy(dtype=np.float64)
+    current_value = shares * current_price
+    gain_loss = current_value - cost_basis
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        gain_loss_pct = (gain_loss / cost_basis) * 100
+
+    # Attach all new columns in one step
+    return holdings.assign(
+        current_price=current_price,
+        cost_basis=cost_basis,
+        current_value=current_value,
+        gain_loss=gain_loss,
+        gain_loss_pct=gain_loss_pct
+    )
 
 
 def calculate_portfolio_performance(holdings: pd.DataFrame) -> Dict:
@@ -103,28 +114,47 @@ def calculate_portfolio_beta(
     # Calculate returns for benchmark
     benchmark_returns = benchmark_data['Close'].pct_change().dropna()
 
-    weighted_beta = 0
+    # Each stock's returns (on its own dates), side by side on the benchmark's dates
+    tickers = [
+        ticker for ticker in holdings['ticker'].unique()
+        if ticker in price_data and not price_data[ticker].empty
+    ]
+    if not tickers:
+        return 0.0
+
+    returns = pd.concat(
+        {ticker: price_data[ticker]['Close'].pct_change().dropna() for ticker in tickers},
+        axis=1
+    ).reindex(benchmark_returns.index)
 
-    for _, holding in holdings.iterrows():
-        ticker = holding['ticker']
-        weight = holding['allocation_pct'] / 100
+    stock = returns.to_numpy(dtype=np.float64)
+    benchmark = benchmark_returns.to_numpy(dtype=np.float64)[:, None]
 
-        if ticker in price_data and not price_data[ticker].empty:
-            # Calculate returns for this stock
-            stock_returns = price_data[ticker]['Close'].pct_change().dropna()
+    # Covariance and benchmark variance per column over the dates both
+    # series have (the same pairs an inner join per ticker would keep)
+    valid = ~np.isnan(stock) & ~np.isnan(benchmark)
+    n = valid.sum(axis=0)
 
-            # Align dates
-            aligned_returns = pd.concat([stock_returns, benchmark_returns], axis=1, join='inner')
-            aligned_returns.columns = ['stock', 'benchmark']
+    with np.errstate(divide='ignore', invalid='ignore'):
+        stock_mean = np.where(valid, stock, 0).sum(axis=0) / n
+        benchmark_mean = np.where(valid, benchmark, 0).sum(axis=0) / n
 
-            if len(aligned_returns) > 20:  # Need enough data
-                # Calculate beta: covariance(stock, benchmark) / variance(benchmark)
-                covariance = aligned_returns['stock'].cov(aligned_returns['benchmark'])
-                variance = aligned_returns['benchmark'].var()
+        stock_dev = np.where(valid, stock - stock_mean, 0)
+        benchmark_dev = np.where(valid, benchmark - benchmark_mean, 0)
 
-                if variance > 0:
-                    beta = covariance / variance
-                    weighted_beta += beta * weight
+        covariance = (stock_dev * benchmark_dev).sum(axis=0) / (n - 1)
+        variance = (benchmark_dev ** 2).sum(axis=0) / (n - 1)
+
+        # Need enough data and a non-flat benchmark
+        beta = np.where((n > 20) & (variance > 0), covariance / variance, 0.0)
+
+    betas = pd.Series(beta, index=tickers)
+
+    # Weight each holding's beta by its allocation
+    weights = holdings['allocation_pct'].to_numpy(dtype=np.float64) / 100
+    holding_betas = betas.reindex(holdings['ticker']).fillna(0).to_numpy()
+
+    weighted_beta = float((holding_betas * weights).sum())
 
     return weighted_beta
 
@@ -195,14 +225,17 @@ def calculate_max_drawdown(prices: pd.Series) -> Tuple[float, str, str]:
     Returns:
         Tuple of (max_drawdown_pct, peak_date, trough_date)
     """
-    cumulative = prices / prices.iloc[0]  # Normalize to 1
-    running_max = cumulative.expanding().max()
+    values = prices.to_numpy(dtype=np.float64)
+    cumulative = values / values[0]  # Normalize to 1
+
+    # Running peak in one pass (fmax skips missing prices)
+    running_max = np.fmax.accumulate(cumulative)
     drawdown = (cumulative - running_max) / running_max
 
-    max_dd = drawdown.min()
-    max_dd_idx = drawdown.idxmin()
+    trough = int(np.nanargmin(drawdown))
+    max_dd = drawdown[trough]
 
     # Find the peak before the trough
-    peak_idx = cumulative[:max_dd_idx].idxmax()
+    peak = int(np.nanargmax(cumulative[:trough + 1]))
 
-    return max_dd * 100, str(peak_idx), str(max_dd_idx)
+    return max_dd * 100, str(prices.index[peak]), str(prices.index[trough])
@@ -12,19 +12,38 @@ Scan criteria include:
 - Volume surge detection
 """
 
+import logging
+import threading
+import time
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Optional
-from src.data.data_fetcher import fetch_historical_data, fetch_multiple_tickers
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from numpy.lib.stride_tricks import sliding_window_view
+from typing import Callable, List, Dict, Optional, Tuple
+from src.data.data_fetcher import (
+    fetch_historical_data,
+    fetch_multiple_tickers,
+    fetch_batch_historical_data
+)
 from src.analysis.technical import (
     calculate_sma,
-    calculate_rsi,
-    identify_golden_death_cross
-)
-from src.analysis.patterns import (
-    detect_consolidation,
-    calculate_52_week_high_low
+    calculate_rsi
 )
+from src.analysis.patterns import detect_consolidation
+
+logger = logging.getLogger(__name__)
+
+# Scans that opt in with `cache_ttl` share signals through this store,
+# keyed on (tickers, period, interval, liquidity_filter) with the time
+# each scan finished
+_signals_cache: Dict[tuple, Tuple[float, Dict[str, Dict]]] = {}
+_signals_cache_lock = threading.Lock()
+
+
+def clear_signals_cache() -> None:
+    """Forget cached scan signals so the next scan refetches."""
+    with _signals_cache_lock:
+        _signals_cache.clear()
 
 
 def calculate_relative_volume(df: pd.DataFrame, period: int = 20) -> float:
@@ -41,8 +60,9 @@ def calculate_relative_volume(df: pd.DataFrame, period: int = 20) -> float:
     if len(df) < period + 1:
         return None
 
-    avg_volume = df['Volume'].iloc[:-1].tail(period).mean()
-    current_volume = df['Volume'].iloc[-1]
+    volume = df['Volume'].to_numpy()
+    avg_volume = np.nanmean(volume[-period - 1:-1])
+    current_volume = volume[-1]
 
     if avg_volume == 0:
         return None
@@ -50,18 +70,25 @@ def calculate_relative_volume(df: pd.DataFrame, period: int = 20) -> float:
     return current_volume / avg_volume
 
 
-def check_volume_surge(df: pd.DataFrame, threshold: float = 2.0) -> bool:
+def check_volume_surge(
+    df: pd.DataFrame,
+    threshold: float = 2.0,
+    rel_vol: Optional[float] = None
+) -> bool:
     """
     Check if current volume shows a surge (significantly above average).
 
     Args:
         df: DataFrame with Volume data
         threshold: Minimum relative volume to consider a surge (default: 2.0)
+        rel_vol: Precomputed `calculate_relative_volume(df)`, if the caller
+            already has it
 
     Returns:
         bool: True if volume surge detected
     """
-    rel_vol = calculate_relative_volume(df)
+    if rel_vol is None:
+        rel_vol = calculate_relative_volume(df)
 
     if rel_vol is None:
         return False
@@ -69,7 +96,12 @@ def check_volume_surge(df: pd.DataFrame, threshold: float = 2.0) -> bool:
     return rel_vol >= threshold
 
 
-def check_rsi_signal(df: pd.DataFrame, oversold: float = 30, overbought: float = 70) -> str:
+def check_rsi_signal(
+    df: pd.DataFrame,
+    oversold: float = 30,
+    overbought: float = 70,
+    rsi: Optional[pd.Series] = None
+) -> str:
     """
     Check RSI for oversold or overbought conditions.
 
@@ -77,11 +109,13 @@ def check_rsi_signal(df: pd.DataFrame, oversold: float = 30, overbought: float =
         df: DataFrame with Close prices
         oversold: RSI threshold for oversold (default: 30)
         overbought: RSI threshold for overbought (default: 70)
+        rsi: Precomputed RSI of `df['Close']`, if the caller already has it
 
     Returns:
         str: 'oversold', 'overbought', or 'neutral'
     """
-    rsi = calculate_rsi(df['Close'])
+    if rsi is None:
+        rsi = calculate_rsi(df['Close'])
 
     if rsi.empty or pd.isna(rsi.iloc[-1]):
         return 'neutral'
@@ -96,12 +130,27 @@ def check_rsi_signal(df: pd.DataFrame, oversold: float = 30, overbought: float =
         return 'neutral'
 
 
-def check_ma_crossover(df: pd.DataFrame) -> str:
+def _trailing_sma(values: np.ndarray, window: int, count: int) -> np.ndarray:
+    """SMA of the last `count` bars only (NaN where the window doesn't fit yet)."""
+    sma = np.full(count, np.nan)
+    available = min(count, len(values) - window + 1)
+
+    if available > 0:
+        sma[count - available:] = sliding_window_view(values[-(window + available - 1):], window).mean(axis=1)
+
+    return sma
+
+
+def check_ma_crossover(df: pd.DataFrame, lookback: int = 5) -> str:
     """
     Check for moving average crossover signals.
 
+    Only the SMA values needed for the last `lookback` bars (plus the bar
+    before them) are computed, not the full 50/200-day series.
+
     Args:
         df: DataFrame with Close prices
+        lookback: Number of recent bars checked for a crossover (default: 5)
 
     Returns:
         str: 'golden_cross', 'death_cross', or 'none'
@@ -109,14 +158,16 @@ def check_ma_crossover(df: pd.DataFrame) -> str:
     if len(df) < 200:
         return 'none'
 
-    df_with_cross = identify_golden_death_cross(df)
+    close = df['Close'].to_numpy(dtype=np.float64)
+    sma_50 = _trailing_sma(close, 50, lookback + 1)
+    sma_200 = _trailing_sma(close, 200, lookback + 1)
 
-    # Check last 5 days for crossovers
-    recent = df_with_cross.tail(5)
+    prev_fast, prev_slow = sma_50[:-1], sma_200[:-1]
+    curr_fast, curr_slow = sma_50[1:], sma_200[1:]
 
-    if recent['Golden_Cross'].any():
+    if ((curr_fast > curr_slow) & (prev_fast <= prev_slow)).any():
         return 'golden_cross'
-    elif recent['Death_Cross'].any():
+    elif ((curr_fast < curr_slow) & (prev_fast >= prev_slow)).any():
         return 'death_cross'
     else:
         return 'none'
@@ -133,8 +184,13 @@ def check_near_52w_high(df: pd.DataFrame, threshold: float = 5.0) -> bool:
     Returns:
         bool: True if within threshold of 52-week high
     """
-    stats = calculate_52_week_high_low(df)
-    return abs(stats['pct_from_high']) <= threshold
+    # Same distance as calculate_52_week_high_low's pct_from_high, without
+    # building the rest of its stats
+    high_52w = np.nanmax(df['High'].to_numpy(dtype=np.float64)[-252:])
+    current_price = df['Close'].to_numpy(dtype=np.float64)[-1]
+
+    pct_from_high = ((current_price - high_52w) / high_52w) * 100
+    return abs(pct_from_high) <= threshold
 
 
 def check_consolidation_breakout(df: pd.DataFrame) -> Dict:
@@ -152,8 +208,9 @@ def check_consolidation_breakout(df: pd.DataFrame) -> Dict:
     if len(consolidation) < 2:
         return {'in_consolidation': False, 'breaking_out': False}
 
-    currently_consolidating = consolidation.iloc[-1]
-    was_consolidating = consolidation.iloc[-10:-1].any() if len(consolidation) > 10 else False
+    consolidating = consolidation.to_numpy()
+    currently_consolidating = consolidating[-1]
+    was_consolidating = consolidating[-10:-1].any() if len(consolidating) > 10 else False
 
     # Breakout: was consolidating recently, but not anymore
     # AND price is moving up with volume
@@ -161,7 +218,8 @@ def check_consolidation_breakout(df: pd.DataFrame) -> Dict:
 
     if breaking_out and len(df) > 5:
         # Check if price is rising
-        recent_close_change = ((df['Close'].iloc[-1] - df['Close'].iloc[-5]) / df['Close'].iloc[-5]) * 100
+        close = df['Close'].to_numpy()
+        recent_close_change = ((close[-1] - close[-5]) / close[-5]) * 100
         breaking_out = breaking_out and recent_close_change > 2  # At least 2% up
 
     return {
@@ -170,6 +228,156 @@ def check_consolidation_breakout(df: pd.DataFrame) -> Dict:
     }
 
 
+def scan_ticker_from_df(ticker: str, df: pd.DataFrame) -> Optional[Dict]:
+    """
+    Compute breakout signals for a ticker from already-fetched price data.
+
+    Args:
+        ticker: Stock ticker symbol
+        df: DataFrame with OHLCV data
+
+    Returns:
+        dict: Dictionary of signals and metrics, or None if not enough data
+    """
+    if df.empty or len(df) < 50:
+        return None
+
+    # RSI feeds both the signal and the reported value
+    rsi = calculate_rsi(df['Close'])
+    close = df['Close'].to_numpy()
+    consolidation = check_consolidation_breakout(df)
+    rel_vol = calculate_relative_volume(df)
+
+    # Calculate all signals
+    signals = {
+        'ticker': ticker,
+        'current_price': close[-1],
+        'relative_volume': rel_vol,
+        'volume_surge': check_volume_surge(df, rel_vol=rel_vol),
+        'rsi_signal': check_rsi_signal(df, rsi=rsi),
+        'ma_crossover': check_ma_crossover(df),
+        'near_52w_high': check_near_52w_high(df),
+        'consolidation': consolidation,
+        'is_breaking_out': bool(consolidation['breaking_out']),
+        'price_change_5d': ((close[-1] - close[-6]) / close[-6] * 100) if len(df) > 5 else None,
+        'price_change_20d': ((close[-1] - close[-21]) / close[-21] * 100) if len(df) > 20 else None,
+    }
+
+    if not rsi.empty:
+        signals['rsi_value'] = rsi.iloc[-1]
+
+    return signals
+
+
+def scan_tickers_from_frames(frames: Dict[str, pd.DataFrame]) -> Dict[str, Dict]:
+    """
+    Compute breakout signals for many tickers at once.
+
+    Frames that share the same index are stacked into wide Close/High/Volume
+    DataFrames (one column per ticker), so moving averages, RSI, relative
+    volume and price changes run as single column-wise pandas operations.
+    Results match `scan_ticker_from_df` for each ticker. Consolidation
+    detection still runs per ticker.
+
+    Args:
+        frames: Dictionary mapping ticker symbols to OHLCV DataFrames
+
+    Returns:
+        dict: Dictionary mapping ticker symbols to their signals. Tickers
+            with fewer than 50 bars are left out.
+    """
+    # Group tickers whose rows line up exactly
+    groups = []
+    for ticker, df in frames.items():
+        if df.empty or len(df) < 50:
+            continue
+
+        for index, members in groups:
+            if index.equals(df.index):
+                members.append(ticker)
+                break
+        else:
+            groups.append((df.index, [ticker]))
+
+    signals_by_ticker = {}
+
+    for _, members in groups:
+        close = pd.DataFrame({t: frames[t]['Close'] for t in members})
+        high = pd.DataFrame({t: frames[t]['High'] for t in members})
+        volume = pd.DataFrame({t: frames[t]['Volume'] for t in members})
+        n = len(close)
+
+        current_price = close.iloc[-1]
+
+        # Relative volume: current vs prior 20-bar average
+        if n >= 21:
+            avg_volume = volume.iloc[:-1].tail(20).mean()
+            relative_volume = volume.iloc[-1] / avg_volume
+
+        # RSI
+        rsi = calculate_rsi(close).iloc[-1]
+
+        # 50/200-day crossovers within the last 5 bars
+        if n >= 200:
+            sma_50 = calculate_sma(close, 50)
+            sma_200 = calculate_sma(close, 200)
+            golden = ((sma_50 > sma_200) & (sma_50.shift(1) <= sma_200.shift(1))).tail(5).any()
+            death = ((sma_50 < sma_200) & (sma_50.shift(1) >= sma_200.shift(1))).tail(5).any()
+
+        # Distance from 52-week high
+        high_52w = high.tail(min(n, 252)).max()
+        pct_from_high = (current_price - high_52w) / high_52w * 100
+
+        # Price changes
+        if n > 5:
+            price_change_5d = (current_price - close.iloc[-6]) / close.iloc[-6] * 100
+        if n > 20:
+            price_change_20d = (current_price - close.iloc[-21]) / close.iloc[-21] * 100
+
+        for ticker in members:
+            if n < 21 or avg_volume[ticker] == 0:
+                rel_vol = None
+            else:
+                rel_vol = relative_volume[ticker]
+
+            if pd.isna(rsi[ticker]):
+                rsi_signal = 'neutral'
+            elif rsi[ticker] < 30:
+                rsi_signal = 'oversold'
+            elif rsi[ticker] > 70:
+                rsi_signal = 'overbought'
+            else:
+                rsi_signal = 'neutral'
+
+            if n < 200:
+                ma_crossover = 'none'
+            elif golden[ticker]:
+                ma_crossover = 'golden_cross'
+            elif death[ticker]:
+                ma_crossover = 'death_cross'
+            else:
+                ma_crossover = 'none'
+
+            consolidation = check_consolidation_breakout(frames[ticker])
+
+            signals_by_ticker[ticker] = {
+                'ticker': ticker,
+                'current_price': current_price[ticker],
+                'relative_volume': rel_vol,
+                'volume_surge': False if rel_vol is None else rel_vol >= 2.0,
+                'rsi_signal': rsi_signal,
+                'ma_crossover': ma_crossover,
+                'near_52w_high': abs(pct_from_high[ticker]) <= 5.0,
+                'consolidation': consolidation,
+                'is_breaking_out': bool(consolidation['breaking_out']),
+                'price_change_5d': price_change_5d[ticker] if n > 5 else None,
+                'price_change_20d': price_change_20d[ticker] if n > 20 else None,
+                'rsi_value': rsi[ticker]
+            }
+
+    return signals_by_ticker
+
+
 def scan_ticker(ticker: str, period: str = '1y', interval: str = '1d') -> Optional[Dict]:
     """
     Scan a single ticker for breakout signals.
@@ -184,68 +392,208 @@ def scan_ticker(ticker: str, period: str = '1y', interval: str = '1d') -> Option
     """
     try:
         df = fetch_historical_data(ticker, period=period, interval=interval)
-
-        if df.empty or len(df) < 50:
-            return None
-
-        # Calculate all signals
-        signals = {
-            'ticker': ticker,
-            'current_price': df['Close'].iloc[-1],
-            'relative_volume': calculate_relative_volume(df),
-            'volume_surge': check_volume_surge(df),
-            'rsi_signal': check_rsi_signal(df),
-            'ma_crossover': check_ma_crossover(df),
-            'near_52w_high': check_near_52w_high(df),
-            'consolidation': check_consolidation_breakout(df),
-            'price_change_5d': ((df['Close'].iloc[-1] - df['Close'].iloc[-6]) / df['Close'].iloc[-6] * 100) if len(df) > 5 else None,
-            'price_change_20d': ((df['Close'].iloc[-1] - df['Close'].iloc[-21]) / df['Close'].iloc[-21] * 100) if len(df) > 20 else None,
-        }
-
-        # Calculate RSI value
-        rsi = calculate_rsi(df['Close'])
-        if not rsi.empty:
-            signals['rsi_value'] = rsi.iloc[-1]
-
-        return signals
+        return scan_ticker_from_df(ticker, df)
 
     except Exception as e:
         print(f"Error scanning {ticker}: {str(e)}")
         return None
 
 
+def filter_liquid_tickers(
+    tickers: List[str],
+    min_price: float = 5.0,
+    min_rel_volume: float = 0.5
+) -> List[str]:
+    """
+    Cheap pre-screen that drops illiquid tickers before a full scan.
+
+    Downloads only the last 5 days for the whole list in one batch and keeps
+    tickers whose last close is above `min_price` and whose last volume is
+    at least `min_rel_volume` times their 5-day average. Tickers missing
+    from the download, or whose last row has no close or volume, are kept
+    so the full scan can decide.
+
+    Args:
+        tickers: List of ticker symbols
+        min_price: Minimum last close price (default: 5.0)
+        min_rel_volume: Minimum last volume vs 5-day average (default: 0.5)
+
+    Returns:
+        list: Tickers passing the screen, in their original order
+    """
+    try:
+        frames = fetch_batch_historical_data(tickers, period='5d', interval='1d')
+    except ValueError as e:
+        print(f"Warning: Skipping liquidity filter - {str(e)}")
+        return list(tickers)
+
+    liquid = []
+
+    for ticker in tickers:
+        df = frames.get(ticker)
+
+        if df is None or df.empty:
+            liquid.append(ticker)
+            continue
+
+        last_close = df['Close'].iloc[-1]
+        last_volume = df['Volume'].iloc[-1]
+
+        # A gap in the last row (e.g. a holiday on the ticker's exchange)
+        # says nothing about liquidity; keep it like a missing ticker
+        if pd.isna(last_close) or pd.isna(last_volume):
+            liquid.append(ticker)
+            continue
+
+        avg_volume = df['Volume'].mean()
+        rel_volume = last_volume / avg_volume if avg_volume > 0 else 0.0
+
+        if last_close > min_price and rel_volume > min_rel_volume:
+            liquid.append(ticker)
+
+    return liquid
+
+
+def _scan_signals(
+    tickers: List[str],
+    period: str,
+    interval: str,
+    max_workers: int,
+    progress_callback: Optional[Callable[[int, int], None]]
+) -> Dict[str, Dict]:
+    """Fetch and score a ticker universe; see `scan_multiple_tickers`."""
+    signals_by_ticker = {}
+    total = len(tickers)
+    completed = 0
+
+    # One batched request for the whole universe
+    try:
+        frames = fetch_batch_historical_data(tickers, period=period, interval=interval)
+    except ValueError as e:
+        print(f"Warning: {str(e)}")
+        frames = {}
+
+    # Indicators for the whole batch are computed column-wise
+    signals_by_ticker.update(scan_tickers_from_frames(frames))
+
+    completed += len(frames)
+    if frames and progress_callback is not None:
+        progress_callback(completed, total)
+
+    # Fall back to per-ticker requests for anything the batch missed
+    remaining = [t for t in tickers if t not in frames]
+
+    if remaining:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(remaining)))) as executor:
+            futures = {}
+            for ticker in remaining:
+                logger.debug("Scanning %s...", ticker)
+                futures[executor.submit(scan_ticker, ticker, period, interval)] = ticker
+
+            for future in as_completed(futures):
+                signals = future.result()
+
+                if signals is not None:
+                    signals_by_ticker[futures[future]] = signals
+
+                completed += 1
+                if progress_callback is not None:
+                    progress_callback(completed, total)
+
+    return signals_by_ticker
+
+
 def scan_multiple_tickers(
     tickers: List[str],
     period: str = '1y',
     interval: str = '1d',
-    filters: Optional[Dict] = None
+    filters: Optional[Dict] = None,
+    max_workers: int = 8,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    liquidity_filter: bool = False,
+    predicate: Optional[Callable[[Dict], bool]] = None,
+    cache_ttl: float = 0
 ) -> pd.DataFrame:
     """
     Scan multiple tickers and return results as DataFrame.
 
+    All tickers are first requested in a single batched download and
+    scored column-wise (see `scan_tickers_from_frames`). Any ticker missing
+    from the batch is fetched individually on a thread pool since those
+    requests are dominated by network latency.
+
+    With `cache_ttl` set, signals are reused for repeated scans of the
+    same tickers, period, interval and liquidity filter finished less
+    than `cache_ttl` seconds ago, so several finders run back to back
+    download and score the universe once. `clear_signals_cache` forces a rescan.
+
     Args:
         tickers: List of ticker symbols
         period: Data period (default: '1y')
         interval: Data interval (default: '1d')
         filters: Optional filters to apply (e.g., {'volume_surge': True})
+        max_workers: Number of fallback tickers fetched in parallel (default: 8)
+        progress_callback: Optional callable invoked as (completed, total)
+            after each ticker finishes
+        liquidity_filter: Drop illiquid tickers with `filter_liquid_tickers`
+            before the full scan (default: False)
+        predicate: Optional callable taking a ticker's signals dict; tickers
+            it rejects are dropped before the DataFrame is built
+        cache_ttl: Seconds a previous scan's signals may be reused
+            (default: 0, always rescan)
 
     Returns:
-        pd.DataFrame: DataFrame of scan results
+        pd.DataFrame: DataFrame of scan results, in the order of `tickers`.
+            `rsi_signal` and `ma_crossover` are categoricals.
     """
-    results = []
+    if not tickers:
+        return pd.DataFrame()
 
-    for ticker in tickers:
-        print(f"Scanning {ticker}...")
-        signals = scan_ticker(ticker, period=period, interval=interval)
+    # Looked up before the liquidity screen, which downloads too
+    key = (tuple(tickers), period, interval, liquidity_filter)
+    signals_by_ticker = None
+
+    if cache_ttl > 0:
+        with _signals_cache_lock:
+            entry = _signals_cache.get(key)
+        if entry is not None and time.time() - entry[0] < cache_ttl:
+            signals_by_ticker = entry[1]
+
+    if signals_by_ticker is None:
+        scanned = filter_liquid_tickers(tickers) if liquidity_filter else tickers
+        signals_by_ticker = _scan_signals(scanned, period, interval, max_workers, progress_callback)
+
+        # Empty scans usually mean a failed download; don't keep them
+        if cache_ttl > 0 and signals_by_ticker:
+            now = time.time()
+            with _signals_cache_lock:
+                for stale in [k for k, (stamp, _) in _signals_cache.items() if now - stamp >= cache_ttl]:
+                    del _signals_cache[stale]
+                _signals_cache[key] = (now, signals_by_ticker)
+    elif progress_callback is not None:
+        progress_callback(len(tickers), len(tickers))
 
-        if signals is not None:
-            results.append(signals)
+    # Keep results in the caller's ticker order
+    results = [signals_by_ticker[t] for t in tickers if t in signals_by_ticker]
+
+    if predicate is not None:
+        results = [signals for signals in results if predicate(signals)]
 
     if not results:
         return pd.DataFrame()
 
     df = pd.DataFrame(results)
 
+    # Alongside the consolidation dict, expose its in-consolidation flag as
+    # a bool column (the breakout half is already `is_breaking_out`), and
+    # store the string signals as categoricals
+    df.insert(
+        df.columns.get_loc('consolidation') + 1,
+        'in_consolidation',
+        np.fromiter((bool(c['in_consolidation']) for c in df['consolidation']), dtype=bool, count=len(df))
+    )
+    df = df.astype({'rsi_signal': 'category', 'ma_crossover': 'category'})
+
     # Apply filters if provided
     if filters:
         for key, value in filters.items():
@@ -258,49 +606,82 @@ def scan_multiple_tickers(
     return df
 
 
-def find_high_volume_movers(tickers: List[str], min_rel_volume: float = 2.0) -> pd.DataFrame:
+def find_high_volume_movers(
+    tickers: List[str],
+    min_rel_volume: float = 2.0,
+    max_workers: int = 8,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    liquidity_filter: bool = False,
+    cache_ttl: float = 0
+) -> pd.DataFrame:
     """
     Find tickers with high relative volume.
 
     Args:
         tickers: List of ticker symbols
         min_rel_volume: Minimum relative volume (default: 2.0)
+        max_workers: Number of tickers fetched in parallel (default: 8)
+        progress_callback: Optional callable invoked as (completed, total)
+        liquidity_filter: Pre-screen out illiquid tickers (default: False)
+        cache_ttl: Reuse signals from a scan of the same tickers finished
+            within this many seconds (default: 0, always rescan)
 
     Returns:
         pd.DataFrame: Sorted by relative volume (descending)
     """
-    df = scan_multiple_tickers(tickers)
+    # Filter for high volume
+    df = scan_multiple_tickers(
+        tickers,
+        max_workers=max_workers,
+        progress_callback=progress_callback,
+        liquidity_filter=liquidity_filter,
+        cache_ttl=cache_ttl,
+        predicate=lambda s: s['relative_volume'] is not None and s['relative_volume'] >= min_rel_volume
+    )
 
     if df.empty:
         return df
 
-    # Filter for high volume
-    df = df[df['relative_volume'] >= min_rel_volume]
-
     # Sort by relative volume
     df = df.sort_values('relative_volume', ascending=False)
 
     return df
 
 
-def find_oversold_stocks(tickers: List[str]) -> pd.DataFrame:
+def find_oversold_stocks(
+    tickers: List[str],
+    max_workers: int = 8,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    liquidity_filter: bool = False,
+    cache_ttl: float = 0
+) -> pd.DataFrame:
     """
     Find tickers with RSI indicating oversold conditions.
 
     Args:
         tickers: List of ticker symbols
+        max_workers: Number of tickers fetched in parallel (default: 8)
+        progress_callback: Optional callable invoked as (completed, total)
+        liquidity_filter: Pre-screen out illiquid tickers (default: False)
+        cache_ttl: Reuse signals from a scan of the same tickers finished
+            within this many seconds (default: 0, always rescan)
 
     Returns:
         pd.DataFrame: Sorted by RSI (ascending)
     """
-    df = scan_multiple_tickers(tickers)
+    # Filter for oversold
+    df = scan_multiple_tickers(
+        tickers,
+        max_workers=max_workers,
+        progress_callback=progress_callback,
+        liquidity_filter=liquidity_filter,
+        cache_ttl=cache_ttl,
+        predicate=lambda s: s['rsi_signal'] == 'oversold'
+    )
 
     if df.empty:
         return df
 
-    # Filter for oversold
-    df = df[df['rsi_signal'] == 'oversold']
-
     # Sort by RSI value
     if 'rsi_value' in df.columns:
         df = df.sort_values('rsi_value', ascending=True)
@@ -308,28 +689,56 @@ def find_oversold_stocks(tickers: List[str]) -> pd.DataFrame:
     return df
 
 
-def find_golden_cross_stocks(tickers: List[str]) -> pd.DataFrame:
+def find_golden_cross_stocks(
+    tickers: List[str],
+    max_workers: int = 8,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    liquidity_filter: bool = False,
+    cache_ttl: float = 0
+) -> pd.DataFrame:
     """
     Find tickers with recent golden cross signals.
 
     Args:
         tickers: List of ticker symbols
+        max_workers: Number of tickers fetched in parallel (default: 8)
+        progress_callback: Optional callable invoked as (completed, total)
+        liquidity_filter: Pre-screen out illiquid tickers (default: False)
+        cache_ttl: Reuse signals from a scan of the same tickers finished
+            within this many seconds (default: 0, always rescan)
 
     Returns:
         pd.DataFrame: Stocks with golden cross signals
     """
-    df = scan_multiple_tickers(tickers)
+    # Filter for golden cross
+    return scan_multiple_tickers(
+        tickers,
+        max_workers=max_workers,
+        progress_callback=progress_callback,
+        liquidity_filter=liquidity_filter,
+        cache_ttl=cache_ttl,
+        predicate=lambda s: s['ma_crossover'] == 'golden_cross'
+    )
 
-    if df.empty:
-        return df
 
-    # Filter for golden cross
-    df = df[df['ma_crossover'] == 'golden_cross']
+def _is_breakout_candidate(signals: Dict) -> bool:
+    """Breakout criteria of `find_breakout_candidates` for one ticker's signals."""
+    rel_vol = signals['relative_volume']
 
-    return df
+    return bool(
+        signals['is_breaking_out'] or
+        (signals['near_52w_high'] and signals['volume_surge']) or
+        (signals['ma_crossover'] == 'golden_cross' and rel_vol is not None and rel_vol > 1.5)
+    )
 
 
-def find_breakout_candidates(tickers: List[str]) -> pd.DataFrame:
+def find_breakout_candidates(
+    tickers: List[str],
+    max_workers: int = 8,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    liquidity_filter: bool = False,
+    cache_ttl: float = 0
+) -> pd.DataFrame:
     """
     Find tickers showing potential breakout signals.
 
@@ -340,31 +749,34 @@ def find_breakout_candidates(tickers: List[str]) -> pd.DataFrame:
 
     Args:
         tickers: List of ticker symbols
+        max_workers: Number of tickers fetched in parallel (default: 8)
+        progress_callback: Optional callable invoked as (completed, total)
+        liquidity_filter: Pre-screen out illiquid tickers (default: False)
+        cache_ttl: Reuse signals from a scan of the same tickers finished
+            within this many seconds (default: 0, always rescan)
 
     Returns:
         pd.DataFrame: Sorted by multiple breakout indicators
     """
-    df = scan_multiple_tickers(tickers)
-
-    if df.empty:
-        return df
-
-    # Extract consolidation breakout flag
-    df['is_breaking_out'] = df['consolidation'].apply(lambda x: x.get('breaking_out', False) if isinstance(x, dict) else False)
-
     # Find breakout candidates
-    breakout_candidates = df[
-        (df['is_breaking_out']) |
-        ((df['near_52w_high']) & (df['volume_surge'])) |
-        ((df['ma_crossover'] == 'golden_cross') & (df['relative_volume'] > 1.5))
-    ]
+    breakout_candidates = scan_multiple_tickers(
+        tickers,
+        max_workers=max_workers,
+        progress_callback=progress_callback,
+        liquidity_filter=liquidity_filter,
+        cache_ttl=cache_ttl,
+        predicate=_is_breakout_candidate
+    )
+
+    if breakout_candidates.empty:
+        return breakout_candidates
 
     # Calculate composite score
     breakout_candidates['breakout_score'] = (
-        breakout_candidates['is_breaking_out'].astype(int) * 3 +
-        breakout_candidates['near_52w_high'].astype(int) * 2 +
-        breakout_candidates['volume_surge'].astype(int) * 2 +
-        (breakout_candidates['ma_crossover'] == 'golden_cross').astype(int) * 2
+        breakout_candidates['is_breaking_out'].to_numpy(dtype=np.int64) * 3 +
+        breakout_candidates['near_52w_high'].to_numpy(dtype=np.int64) * 2 +
+        breakout_candidates['volume_surge'].to_numpy(dtype=np.int64) * 2 +
+        (breakout_candidates['ma_crossover'].to_numpy() == 'golden_cross') * 2
     )
 
     # Sort by score
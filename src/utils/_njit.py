@@ -0,0 +1,28 @@
+"""
+Optional Numba support.
+
+Numba is an optional dependency. When it is installed, `njit` compiles
+the decorated function; otherwise it is a no-op decorator so the same
+kernels still run as plain Python. Callers that only want the compiled
+path should check `NUMBA_AVAILABLE` and fall back to pandas otherwise.
+"""
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+
+except ImportError:  # pragma: no cover - exercised only without numba
+    NUMBA_AVAILABLE = False
+
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit supporting both decorator forms."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
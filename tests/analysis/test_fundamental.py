@@ -0,0 +1,175 @@
+"""
+Unit tests for fundamental analysis module.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from src.analysis.fundamental import (
+    calculate_valuation_ratios,
+    calculate_profitability_metrics,
+    calculate_financial_health,
+    calculate_growth_metrics,
+    get_dividend_metrics,
+    create_fundamental_summary,
+    analyze_financial_statements,
+    simple_dcf_valuation,
+    simple_dcf_valuation_batch
+)
+
+
+class TestDCFValuation:
+    """Tests for DCF valuation."""
+
+    def test_simple_dcf_valuation(self):
+        """Test DCF against a hand-computed projection."""
+        result = simple_dcf_valuation(100.0, growth_rate=0.05, discount_rate=0.10,
+                                      terminal_growth_rate=0.02, projection_years=3,
+                                      shares_outstanding=10.0)
+
+        projected = [100.0 * 1.05 ** year for year in range(1, 4)]
+        sum_pv = sum(fcf / 1.10 ** year for year, fcf in enumerate(projected, start=1))
+        terminal_value = projected[-1] * 1.02 / (0.10 - 0.02)
+        enterprise_value = sum_pv + terminal_value / 1.10 ** 3
+
+        assert result['projected_fcf'] == pytest.approx(projected)
+        assert result['sum_pv_fcf'] == pytest.approx(sum_pv)
+        assert result['enterprise_value'] == pytest.approx(enterprise_value)
+        assert result['intrinsic_value_per_share'] == pytest.approx(enterprise_value / 10.0)
+
+    def test_negative_fcf(self):
+        """Test that non-positive FCF is rejected."""
+        result = simple_dcf_valuation(-50.0)
+        assert result['intrinsic_value_per_share'] is None
+
+    def test_batch_matches_scalar(self):
+        """Test that the batch version broadcasts to the scalar results."""
+        growth = np.array([0.0, 0.05, 0.15])[:, np.newaxis]
+        discount = np.array([0.08, 0.12])
+
+        result = simple_dcf_valuation_batch(100.0, growth, 0.03, discount, 5, 10.0)
+
+        assert result['intrinsic_value_per_share'].shape == (3, 2)
+        for i, g in enumerate(growth[:, 0]):
+            for j, r in enumerate(discount):
+                expected = simple_dcf_valuation(100.0, g, 0.03, r, 5, 10.0)
+                assert result['enterprise_value'][i, j] == pytest.approx(expected['enterprise_value'])
+                assert result['intrinsic_value_per_share'][i, j] == pytest.approx(
+                    expected['intrinsic_value_per_share']
+                )
+
+    def test_batch_invalid_inputs(self):
+        """Test that non-positive FCF or shares give NaN."""
+        result = simple_dcf_valuation_batch(
+            np.array([100.0, -5.0, 100.0]),
+            shares_outstanding=np.array([1.0, 1.0, 0.0])
+        )
+
+        assert not np.isnan(result['intrinsic_value_per_share'][0])
+        assert np.isnan(result['enterprise_value'][1])
+        assert np.isnan(result['intrinsic_value_per_share'][2])
+
+
+class TestFundamentalSummary:
+    """Tests for info metric extraction."""
+
+    def test_create_fundamental_summary(self):
+        """Test summary layout and fallback keys."""
+        info = {
+            'shortName': 'Test Co',
+            'sector': 'Technology',
+            'regularMarketPrice': 42.0,
+            'trailingPE': None,
+            'forwardPE': 18.5,
+            'grossMargins': 0.45,
+            'dividendYield': 0.01
+        }
+
+        summary = create_fundamental_summary(info)
+
+        assert summary['Company_Name'] == 'Test Co'
+        assert summary['Current_Price'] == 42.0
+        assert summary['Industry'] is None
+        assert summary['Valuation']['PE_Ratio'] == 18.5
+        assert summary['Profitability']['Gross_Margin'] == 0.45
+        assert summary['Dividends']['Dividend_Yield'] == 0.01
+        assert list(summary) == [
+            'Company_Name', 'Sector', 'Industry', 'Market_Cap', 'Current_Price',
+            'Valuation', 'Profitability', 'Financial_Health', 'Growth', 'Dividends'
+        ]
+
+    def test_category_functions_match_summary(self):
+        """Test that the per-category helpers agree with the summary."""
+        info = {'trailingPE': 25.0, 'returnOnEquity': 0.2, 'totalDebt': 1e9, 'revenueGrowth': 0.1}
+        summary = create_fundamental_summary(info)
+
+        assert calculate_valuation_ratios(info) == summary['Valuation']
+        assert calculate_profitability_metrics(info) == summary['Profitability']
+        assert calculate_financial_health(info) == summary['Financial_Health']
+        assert calculate_growth_metrics(info) == summary['Growth']
+        assert get_dividend_metrics(info) == summary['Dividends']
+
+    def test_summaries_are_independent(self):
+        """Test that editing one summary does not leak into later calls."""
+        info = {'longName': 'Memo Co', 'trailingPE': 12.0}
+        first = create_fundamental_summary(info)
+        first['Company_Name'] = 'Edited'
+        first['Valuation']['PE_Ratio'] = None
+
+        second = create_fundamental_summary(dict(info))
+
+        assert second['Company_Name'] == 'Memo Co'
+        assert second['Valuation']['PE_Ratio'] == 12.0
+
+    def test_summary_unhashable_values(self):
+        """Test that unhashable info values are passed through."""
+        summary = create_fundamental_summary({'sector': ['Technology']})
+
+        assert summary['Sector'] == ['Technology']
+
+
+class TestFinancialStatements:
+    """Tests for financial statement trend analysis."""
+
+    def test_growth_rates(self):
+        """Test growth of the most recent period over the previous one."""
+        columns = ['2024', '2023', '2022']
+        statements = {
+            'income_statement': pd.DataFrame(
+                [[110.0, 100.0, 90.0], [-5.0, -10.0, 2.0]],
+                index=['Total Revenue', 'Net Income'], columns=columns
+            ),
+            'balance_sheet': pd.DataFrame(
+                [[200.0, 180.0, 150.0], [50.0, 60.0, 70.0]],
+                index=['Total Assets', 'Total Liabilities Net Minority Interest'], columns=columns
+            ),
+            'cash_flow': pd.DataFrame([[30.0, 0.0, 10.0]], index=['Free Cash Flow'], columns=columns)
+        }
+
+        analysis = analyze_financial_statements(statements)
+
+        assert analysis['Revenue_Growth_%'] == pytest.approx(10.0)
+        assert analysis['Earnings_Growth_%'] == pytest.approx(50.0)
+        assert analysis['Debt_to_Assets_Ratio'] == pytest.approx(0.25)
+        # FCF growth is undefined when the previous period is zero
+        assert 'FCF_Growth_%' not in analysis
+
+    def test_missing_rows(self):
+        """Test that absent rows and single-period statements are skipped."""
+        statements = {
+            'income_statement': pd.DataFrame([[110.0]], index=['Total Revenue'], columns=['2024']),
+            'cash_flow': pd.DataFrame([[1.0, 2.0]], index=['Operating Cash Flow'], columns=['2024', '2023'])
+        }
+
+        assert analyze_financial_statements(statements) == {}
+
+    def test_undefined_growth_skipped(self):
+        """Test that a zero or missing previous period yields no growth rate."""
+        statements = {
+            'income_statement': pd.DataFrame(
+                [[110.0, 0.0], [5.0, np.nan]],
+                index=['Total Revenue', 'Net Income'], columns=['2024', '2023']
+            )
+        }
+
+        assert analyze_financial_statements(statements) == {}
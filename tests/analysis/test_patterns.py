@@ -0,0 +1,130 @@
+"""
+Unit tests for pattern recognition module.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+from src.analysis.patterns import (
+    identify_doji,
+    identify_engulfing,
+    identify_hammer,
+    identify_shooting_star,
+    detect_consolidation,
+    find_support_resistance_levels,
+    add_all_patterns,
+    summarize_patterns,
+    PATTERN_COUNTS
+)
+
+
+@pytest.fixture
+def ohlc_data():
+    """Create random OHLC candles, including flat and missing ones."""
+    rng = np.random.RandomState(7)
+    n = 200
+    open_ = 100 + rng.randn(n).cumsum()
+    close = open_ + rng.randn(n)
+    high = np.maximum(open_, close) + rng.exponential(1.0, n)
+    low = np.minimum(open_, close) - rng.exponential(1.0, n)
+
+    data = pd.DataFrame({
+        'Open': open_,
+        'High': high,
+        'Low': low,
+        'Close': close,
+        'Volume': rng.randint(1000000, 5000000, n)
+    }, index=pd.date_range('2024-01-01', periods=n, freq='D'))
+
+    # Zero-range candle and a missing open
+    data.iloc[10, :4] = 100.0
+    data.iloc[20, 0] = np.nan
+
+    return data
+
+
+class TestAddAllPatterns:
+    """Tests for the fused pattern pass."""
+
+    def test_matches_individual_detectors(self, ohlc_data):
+        """Test that add_all_patterns agrees with each detector."""
+        result = add_all_patterns(ohlc_data)
+        bullish, bearish = identify_engulfing(ohlc_data)
+
+        expected = {
+            'Doji': identify_doji(ohlc_data),
+            'Bullish_Engulfing': bullish,
+            'Bearish_Engulfing': bearish,
+            'Hammer': identify_hammer(ohlc_data),
+            'Shooting_Star': identify_shooting_star(ohlc_data),
+            'Consolidation': detect_consolidation(ohlc_data)
+        }
+
+        for column, series in expected.items():
+            np.testing.assert_array_equal(result[column].to_numpy(), series.to_numpy(), err_msg=column)
+
+    def test_keeps_original_columns(self, ohlc_data):
+        """Test that the input columns are preserved and the input is untouched."""
+        result = add_all_patterns(ohlc_data)
+
+        assert list(result.columns[:5]) == list(ohlc_data.columns)
+        assert result.index.equals(ohlc_data.index)
+        assert 'Doji' not in ohlc_data.columns
+
+    def test_pattern_flags_bits(self, ohlc_data):
+        """Test that each Pattern_Flags bit mirrors its boolean column."""
+        result = add_all_patterns(ohlc_data)
+        flags = result['Pattern_Flags'].to_numpy()
+
+        assert flags.dtype == np.uint8
+        for bit, column in enumerate(PATTERN_COUNTS):
+            np.testing.assert_array_equal((flags >> bit) & 1 == 1, result[column].to_numpy(dtype=bool))
+
+    def test_tail_matches_full_run(self, ohlc_data):
+        """Test that a tail-only run matches the end of a full run."""
+        full = add_all_patterns(ohlc_data)
+
+        pd.testing.assert_frame_equal(add_all_patterns(ohlc_data, tail=30), full.tail(30))
+        pd.testing.assert_frame_equal(add_all_patterns(ohlc_data, tail=500), full)
+
+
+class TestSupportResistance:
+    """Tests for support and resistance levels."""
+
+    def test_levels_from_local_extrema(self):
+        """Test level selection on a hand-built series."""
+        df = pd.DataFrame({
+            'Low':  [10, 8, 9, 7, 9, 6, 9, 8.5, 9, 5, 10],
+            'High': [20, 22, 21, 24, 21, 23, 21, 25, 21, 22, 20]
+        })
+
+        support, resistance = find_support_resistance_levels(df, num_levels=2)
+
+        # Local minima 8, 7, 6, 8.5, 5 -> four highest are 8.5, 8, 7, 6
+        assert support == [6.0, 7.0]
+        # Local maxima 22, 24, 23, 25, 22 -> four lowest are 22, 22, 23, 24
+        assert resistance == [24.0, 23.0]
+        assert all(isinstance(level, float) for level in support + resistance)
+
+    def test_no_extrema(self):
+        """Test that monotonic prices yield no levels."""
+        df = pd.DataFrame({'Low': np.arange(10.0), 'High': np.arange(10.0) + 1})
+
+        assert find_support_resistance_levels(df) == ([], [])
+
+
+class TestSummarizePatterns:
+    """Test pattern summary counts."""
+
+    def test_counts_recent_patterns(self, ohlc_data):
+        """Counts should match per-column sums over the last 30 rows."""
+        summary = summarize_patterns(ohlc_data)
+        recent = add_all_patterns(ohlc_data).tail(30)
+
+        assert summary['doji_count'] == recent['Doji'].sum()
+        assert summary['bullish_engulfing_count'] == recent['Bullish_Engulfing'].sum()
+        assert summary['bearish_engulfing_count'] == recent['Bearish_Engulfing'].sum()
+        assert summary['hammer_count'] == recent['Hammer'].sum()
+        assert summary['shooting_star_count'] == recent['Shooting_Star'].sum()
+        assert summary['consolidation_days'] == recent['Consolidation'].sum()
+        assert summary['in_consolidation'] == recent['Consolidation'].iloc[-1]
@@ -13,24 +13,35 @@ from src.analysis.technical import (
     calculate_bollinger_bands,
     calculate_vwap,
     calculate_obv,
+    add_indicators,
     add_all_indicators,
     identify_crossover,
     identify_golden_death_cross
 )
+from src.analysis import technical
+from src.analysis._numba_kernels import (
+    ema_kernel,
+    rsi_kernel,
+    rsi_columns_kernel,
+    crossover_kernel,
+    obv_kernel,
+    moving_averages_kernel,
+    vwap_kernel
+)
 
 
 @pytest.fixture
 def sample_price_data():
     """Create sample price data for testing."""
     dates = pd.date_range('2024-01-01', periods=100, freq='D')
-    np.random.seed(42)
+    rng = np.random.RandomState(42)
 
     data = pd.DataFrame({
-        'Open': np.random.uniform(100, 110, 100),
-        'High': np.random.uniform(110, 120, 100),
-        'Low': np.random.uniform(90, 100, 100),
-        'Close': np.random.uniform(95, 115, 100),
-        'Volume': np.random.uniform(1000000, 5000000, 100).astype(int)
+        'Open': rng.uniform(100, 110, 100),
+        'High': rng.uniform(110, 120, 100),
+        'Low': rng.uniform(90, 100, 100),
+        'Close': rng.uniform(95, 115, 100),
+        'Volume': rng.uniform(1000000, 5000000, 100).astype(int)
     }, index=dates)
 
     return data
@@ -40,18 +51,19 @@ def sample_price_data():
 def trending_data():
     """Create data with a clear uptrend for testing crossovers."""
     dates = pd.date_range('2024-01-01', periods=300, freq='D')
+    rng = np.random.RandomState(0)
 
     # Create uptrend
     trend = np.linspace(100, 150, 300)
-    noise = np.random.normal(0, 2, 300)
+    noise = rng.normal(0, 2, 300)
     close_prices = trend + noise
 
     data = pd.DataFrame({
-        'Open': close_prices - np.random.uniform(0, 2, 300),
-        'High': close_prices + np.random.uniform(0, 2, 300),
-        'Low': close_prices - np.random.uniform(0, 2, 300),
+        'Open': close_prices - rng.uniform(0, 2, 300),
+        'High': close_prices + rng.uniform(0, 2, 300),
+        'Low': close_prices - rng.uniform(0, 2, 300),
         'Close': close_prices,
-        'Volume': np.random.uniform(1000000, 5000000, 300).astype(int)
+        'Volume': rng.uniform(1000000, 5000000, 300).astype(int)
     }, index=dates)
 
     return data
@@ -254,6 +266,26 @@ class TestAddAllIndicators:
 
         assert sample_price_data.columns.tolist() == original_columns
 
+    def test_add_indicators_subset(self, sample_price_data):
+        """Test that only the requested indicator groups are added."""
+        result = add_indicators(sample_price_data, ['SMA_50', 'MACD'])
+
+        added = [col for col in result.columns if col not in sample_price_data.columns]
+        assert added == ['SMA_50', 'MACD', 'MACD_Signal', 'MACD_Histogram']
+
+    def test_add_all_indicators_tail(self, trending_data):
+        """Test that a tail-only run matches the end of a full run."""
+        full = add_all_indicators(trending_data)
+        result = add_all_indicators(trending_data, tail=30)
+
+        assert result.index.equals(full.index[-30:])
+        pd.testing.assert_frame_equal(result, full.tail(30), rtol=1e-4)
+
+    def test_add_indicators_unknown_group(self, sample_price_data):
+        """Test that unknown indicator groups raise ValueError."""
+        with pytest.raises(ValueError):
+            add_indicators(sample_price_data, ['SMA_20', 'ICHIMOKU'])
+
 
 class TestCrossovers:
     """Tests for crossover identification."""
@@ -309,3 +341,133 @@ class TestEdgeCases:
         # Should not raise error, but will have many NaN values
         sma = calculate_sma(small_df['Close'], 10)
         assert sma.isna().all()  # All NaN since we need 10 periods
+
+
+class TestNumbaKernels:
+    """Test that the loop kernels match the pandas implementations."""
+
+    def test_ema_kernel_matches_pandas(self, sample_price_data):
+        """Test EMA kernel against pandas ewm, including interior NaNs."""
+        close = sample_price_data['Close'].copy()
+        close.iloc[[0, 1, 40, 41, 75]] = np.nan
+
+        expected = close.ewm(span=12, adjust=False).mean()
+        result = ema_kernel(close.to_numpy(dtype=np.float64), 2.0 / 13)
+
+        np.testing.assert_allclose(result, expected.to_numpy(), rtol=1e-10)
+
+    def test_rsi_kernel_matches_pandas(self, sample_price_data):
+        """Test RSI kernel against the Wilder-smoothed pandas formula."""
+        close = sample_price_data['Close'].copy()
+        close.iloc[50] = np.nan
+        close.iloc[60:80] = 100.0  # Flat stretch: zero gains and losses
+
+        delta = close.diff()
+        gain = delta.clip(lower=0)
+        loss = (-delta).clip(lower=0)
+        rs = (
+            gain.ewm(alpha=1 / 14, adjust=False, min_periods=14).mean()
+            / loss.ewm(alpha=1 / 14, adjust=False, min_periods=14).mean()
+        )
+        expected = 100 - (100 / (1 + rs))
+
+        result = rsi_kernel(close.to_numpy(dtype=np.float64), 14)
+
+        np.testing.assert_allclose(result, expected.to_numpy(), rtol=1e-10)
+        assert np.isnan(result[13]) and not np.isnan(result[14])
+
+    def test_rsi_columns_kernel_matches_rsi_kernel(self, sample_price_data):
+        """Test the parallel column kernel against rsi_kernel per column."""
+        closes = np.column_stack([
+            sample_price_data['Close'].to_numpy(dtype=np.float64),
+            sample_price_data['Open'].to_numpy(dtype=np.float64),
+            sample_price_data['High'].to_numpy(dtype=np.float64)
+        ])
+        closes[:5, 1] = np.nan
+
+        result = rsi_columns_kernel(closes, 14)
+
+        for i in range(closes.shape[1]):
+            np.testing.assert_array_equal(result[:, i], rsi_kernel(closes[:, i].copy(), 14))
+
+    def test_rsi_frame_matches_series(self, sample_price_data, monkeypatch):
+        """Test that wide-frame RSI matches per-column pandas RSI."""
+        closes = pd.DataFrame({
+            'A': sample_price_data['Close'],
+            'B': sample_price_data['Close'][::-1].to_numpy()
+        })
+        closes.iloc[:5, 1] = np.nan
+
+        result = calculate_rsi(closes)
+
+        monkeypatch.setattr(technical, 'NUMBA_AVAILABLE', False)
+        expected = calculate_rsi(closes)
+
+        pd.testing.assert_frame_equal(result, expected, rtol=1e-10)
+
+    def test_moving_averages_kernel_matches_pandas(self, sample_price_data):
+        """Test fused SMA/EMA kernel against rolling and ewm, including NaNs."""
+        close = sample_price_data['Close'].copy()
+        close.iloc[[0, 1, 40, 75]] = np.nan
+
+        expected = np.column_stack([
+            close.rolling(window=5).mean(),
+            close.rolling(window=20).mean(),
+            close.ewm(span=12, adjust=False).mean()
+        ])
+        result = moving_averages_kernel(
+            close.to_numpy(dtype=np.float64),
+            np.array([5, 20]),
+            np.array([2.0 / 13])
+        )
+
+        np.testing.assert_allclose(result, expected, rtol=1e-10)
+
+    def test_crossover_kernel_matches_pandas(self, trending_data):
+        """Test crossover kernel against shifted comparisons."""
+        fast = calculate_sma(trending_data['Close'], 5)
+        slow = calculate_sma(trending_data['Close'], 20)
+
+        bullish = (fast > slow) & (fast.shift(1) <= slow.shift(1))
+        bearish = (fast < slow) & (fast.shift(1) >= slow.shift(1))
+        expected = np.where(bullish, 1, np.where(bearish, -1, 0))
+
+        result = crossover_kernel(fast.to_numpy(), slow.to_numpy())
+
+        np.testing.assert_array_equal(result, expected)
+
+    def test_vwap_kernel_matches_pandas(self, sample_price_data):
+        """Test VWAP kernel against cumulative sums, including gaps."""
+        data = sample_price_data.copy()
+        data.iloc[:3, data.columns.get_loc('Volume')] = 0
+        data.iloc[40, data.columns.get_loc('Close')] = np.nan
+        data.iloc[60, data.columns.get_loc('Volume')] = np.nan
+
+        typical_price = (data['High'] + data['Low'] + data['Close']) / 3
+        expected = (typical_price * data['Volume']).cumsum() / data['Volume'].cumsum()
+
+        result = vwap_kernel(*(
+            data[column].to_numpy(dtype=np.float64)
+            for column in ('High', 'Low', 'Close', 'Volume')
+        ))
+
+        np.testing.assert_allclose(result, expected.to_numpy(), rtol=1e-10)
+
+    def test_obv_kernel_matches_vectorized(self, sample_price_data, monkeypatch):
+        """Test OBV kernel against the NumPy path, including flat closes."""
+        data = sample_price_data.copy()
+        data.iloc[30:35, data.columns.get_loc('Close')] = 100.0
+
+        monkeypatch.setattr(technical, 'NUMBA_AVAILABLE', False)
+        expected = calculate_obv(data)
+
+        direction = np.sign(data['Close'].diff()).fillna(0)
+        reference = (direction * data['Volume']).cumsum() + data['Volume'].iloc[0]
+
+        result = obv_kernel(
+            data['Close'].to_numpy(dtype=np.float64),
+            data['Volume'].to_numpy(dtype=np.float64)
+        )
+
+        np.testing.assert_allclose(expected.to_numpy(), reference.to_numpy())
+        np.testing.assert_allclose(result, expected.to_numpy())
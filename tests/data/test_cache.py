@@ -0,0 +1,143 @@
+"""
+Unit tests for the disk cache used by the data fetcher.
+"""
+
+import os
+import time
+import pytest
+import pandas as pd
+from pathlib import Path
+from src.data._cache import cache_dir as get_cache_dir, disk_cache
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Point the cache at a temporary directory."""
+    monkeypatch.setenv('DASHBOARD_CACHE_DIR', str(tmp_path))
+    return tmp_path
+
+
+class TestDiskCache:
+    """Test suite for the disk_cache decorator."""
+
+    def test_hit_skips_call(self):
+        """Test that a repeated call is served from disk."""
+        calls = []
+
+        @disk_cache(ttl=60)
+        def fetch(ticker, period='1mo'):
+            calls.append(ticker)
+            return pd.DataFrame({'Close': [1.0, 2.0]})
+
+        first = fetch('AAPL')
+        second = fetch('AAPL', period='1mo')
+
+        assert calls == ['AAPL']
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_arguments_are_part_of_key(self):
+        """Test that different arguments are cached separately."""
+        calls = []
+
+        @disk_cache(ttl=60)
+        def fetch(ticker, period='1mo'):
+            calls.append((ticker, period))
+            return ticker
+
+        fetch('AAPL')
+        fetch('AAPL', period='1y')
+        fetch('MSFT')
+
+        assert len(calls) == 3
+
+    def test_expired_entry_refetched(self, cache_dir):
+        """Test that entries older than the TTL are refreshed."""
+        calls = []
+
+        @disk_cache(ttl=60)
+        def fetch(ticker):
+            calls.append(ticker)
+            return len(calls)
+
+        assert fetch('AAPL') == 1
+
+        # Age the entry past its TTL
+        stale = time.time() - 120
+        for path in cache_dir.iterdir():
+            os.utime(path, (stale, stale))
+
+        assert fetch('AAPL') == 2
+
+    def test_errors_not_cached(self):
+        """Test that exceptions propagate and are retried next call."""
+        calls = []
+
+        @disk_cache(ttl=60)
+        def fetch(ticker):
+            calls.append(ticker)
+            raise ValueError(f"Invalid ticker: {ticker}")
+
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Invalid ticker"):
+                fetch('INVALID_XYZ')
+
+        assert len(calls) == 2
+
+    def test_misses_cached_with_miss_ttl(self, cache_dir):
+        """Test that ValueErrors are replayed within miss_ttl, then retried."""
+        calls = []
+
+        @disk_cache(ttl=60, miss_ttl=30)
+        def fetch(ticker):
+            calls.append(ticker)
+            raise ValueError(f"Invalid ticker: {ticker}")
+
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Invalid ticker: INVALID_XYZ"):
+                fetch('INVALID_XYZ')
+
+        assert len(calls) == 1
+
+        # Age the miss past miss_ttl (but not ttl)
+        stale = time.time() - 45
+        for path in cache_dir.iterdir():
+            os.utime(path, (stale, stale))
+
+        with pytest.raises(ValueError):
+            fetch('INVALID_XYZ')
+
+        assert len(calls) == 2
+
+    def test_other_errors_not_cached_with_miss_ttl(self):
+        """Test that only ValueErrors are cached as misses."""
+        calls = []
+
+        @disk_cache(ttl=60, miss_ttl=30)
+        def fetch(ticker):
+            calls.append(ticker)
+            raise RuntimeError("network down")
+
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                fetch('AAPL')
+
+        assert len(calls) == 2
+
+
+class TestCacheDir:
+    """Test suite for resolving the cache directory."""
+
+    def test_env_override(self, cache_dir):
+        """Test that DASHBOARD_CACHE_DIR wins."""
+        assert get_cache_dir() == cache_dir
+
+    def test_default_under_user_cache(self, tmp_path, monkeypatch):
+        """Test that the default is anchored to the user cache, not the CWD."""
+        monkeypatch.delenv('DASHBOARD_CACHE_DIR')
+        monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+
+        assert get_cache_dir() == tmp_path / 'financial_dashboard' / 'yfinance'
+
+        monkeypatch.delenv('XDG_CACHE_HOME')
+
+        assert get_cache_dir() == Path.home() / '.cache' / 'financial_dashboard' / 'yfinance'
@@ -9,12 +9,21 @@ from datetime import datetime, timedelta
 from src.data.data_fetcher import (
     fetch_historical_data,
     fetch_multiple_tickers,
+    fetch_batch_historical_data,
+    fetch_closes,
     fetch_ticker_info,
     fetch_financial_statements,
     validate_ticker
 )
 
 
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Point the cache at a temporary directory so tests hit the network."""
+    monkeypatch.setenv('DASHBOARD_CACHE_DIR', str(tmp_path))
+    return tmp_path
+
+
 class TestFetchHistoricalData:
     """Test suite for fetch_historical_data function."""
 
@@ -88,6 +97,55 @@ class TestFetchMultipleTickers:
         assert data_dict == {}
 
 
+class TestFetchBatchHistoricalData:
+    """Test suite for fetch_batch_historical_data function."""
+
+    def test_fetch_batch_valid_tickers(self):
+        """Test that a batched download is split back into per-ticker frames."""
+        tickers = ['AAPL', 'MSFT', 'GOOGL']
+        data_dict = fetch_batch_historical_data(tickers, period='1mo', interval='1d')
+
+        assert set(data_dict) == set(tickers)
+        for df in data_dict.values():
+            assert not isinstance(df.columns, pd.MultiIndex)
+            assert 'Close' in df.columns
+            assert df.index.name == 'Date'
+
+    def test_fetch_batch_skips_invalid_tickers(self):
+        """Test that tickers without data are left out."""
+        data_dict = fetch_batch_historical_data(['AAPL', 'INVALID_XYZ'], period='1mo', interval='1d')
+
+        assert 'AAPL' in data_dict
+        assert 'INVALID_XYZ' not in data_dict
+
+    def test_empty_ticker_list(self):
+        """Test that empty ticker list returns empty dict."""
+        assert fetch_batch_historical_data([], period='1mo', interval='1d') == {}
+
+
+class TestFetchCloses:
+    """Test suite for fetch_closes function."""
+
+    def test_fetch_closes_wide_frame(self):
+        """Test that closes come back with one column per ticker."""
+        tickers = ['AAPL', 'MSFT', 'SPY']
+        closes = fetch_closes(tickers, period='1mo', interval='1d')
+
+        assert list(closes.columns) == tickers
+        assert closes.index.name == 'Date'
+        assert not closes.iloc[-1].isna().all()
+
+    def test_fetch_closes_skips_invalid_tickers(self):
+        """Test that tickers without data are left out."""
+        closes = fetch_closes(['AAPL', 'INVALID_XYZ'], period='1mo', interval='1d')
+
+        assert list(closes.columns) == ['AAPL']
+
+    def test_empty_ticker_list(self):
+        """Test that empty ticker list returns an empty DataFrame."""
+        assert fetch_closes([], period='1mo', interval='1d').empty
+
+
 class TestFetchTickerInfo:
     """Test suite for fetch_ticker_info function."""
 
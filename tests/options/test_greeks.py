@@ -0,0 +1,131 @@
+"""
+Unit tests for options Greeks module.
+"""
+
+import pytest
+import numpy as np
+from datetime import date, timedelta
+from src.options.greeks import (
+    black_scholes_call,
+    black_scholes_put,
+    calculate_delta,
+    calculate_gamma,
+    calculate_theta,
+    calculate_vega,
+    calculate_rho,
+    calculate_all_greeks,
+    calculate_greeks_vectorized,
+    calculate_time_to_expiration,
+    calculate_times_to_expiration
+)
+from src.options import greeks
+from src.options._numba_kernels import norm_cdf
+from scipy.stats import norm
+
+
+class TestTimeToExpiration:
+    """Tests for calculate_time_to_expiration."""
+
+    def test_string_and_date_inputs(self):
+        """Test that string and date expirations give the same year fraction."""
+        expiration = date.today() + timedelta(days=73)
+
+        assert calculate_time_to_expiration(expiration.isoformat()) == pytest.approx(0.2)
+        assert calculate_time_to_expiration(expiration) == pytest.approx(0.2)
+
+    def test_expired_floor(self):
+        """Test that past expirations are floored at a small positive value."""
+        assert calculate_time_to_expiration('2000-01-01') == 0.001
+
+    def test_bulk_matches_scalar(self):
+        """Test that the array variant matches per-date calculation."""
+        today = date.today()
+        expirations = ['2000-01-01', today.isoformat()] + [
+            (today + timedelta(days=days)).isoformat() for days in (1, 30, 365, 800)
+        ]
+
+        result = calculate_times_to_expiration(expirations)
+        expected = [calculate_time_to_expiration(expiration) for expiration in expirations]
+
+        np.testing.assert_allclose(result, expected)
+        np.testing.assert_allclose(calculate_times_to_expiration(np.array(expirations, dtype='datetime64[D]')), expected)
+
+
+class TestAllGreeks:
+    """Tests for the fused calculate_all_greeks."""
+
+    @pytest.mark.parametrize('option_type', ['call', 'put'])
+    @pytest.mark.parametrize('S, K, T', [(100, 100, 0.5), (100, 60, 2.0), (100, 160, 0.05)])
+    def test_matches_individual_functions(self, S, K, T, option_type):
+        """Test that the shared-term Greeks match each single Greek."""
+        r, sigma = 0.05, 0.3
+        greeks = calculate_all_greeks(S, K, T, r, sigma, option_type)
+        pricer = black_scholes_call if option_type == 'call' else black_scholes_put
+
+        expected = {
+            'delta': calculate_delta(S, K, T, r, sigma, option_type),
+            'gamma': calculate_gamma(S, K, T, r, sigma),
+            'theta': calculate_theta(S, K, T, r, sigma, option_type),
+            'vega': calculate_vega(S, K, T, r, sigma),
+            'rho': calculate_rho(S, K, T, r, sigma, option_type),
+            'theoretical_price': pricer(S, K, T, r, sigma)
+        }
+
+        for name, value in expected.items():
+            assert greeks[name] == pytest.approx(value, rel=1e-9, abs=1e-12), name
+
+    def test_put_call_parity(self):
+        """Test that call - put = S - K * exp(-rT)."""
+        S, K, T, r, sigma = 100, 95, 0.75, 0.04, 0.25
+        call = calculate_all_greeks(S, K, T, r, sigma, 'call')
+        put = calculate_all_greeks(S, K, T, r, sigma, 'put')
+
+        parity = call['theoretical_price'] - put['theoretical_price']
+        assert parity == pytest.approx(S - K * np.exp(-r * T))
+        assert call['delta'] - put['delta'] == pytest.approx(1.0)
+
+    def test_expired_option(self):
+        """Test intrinsic value and zero Greeks at expiration."""
+        greeks = calculate_all_greeks(110, 100, 0, 0.05, 0.3, 'call')
+
+        assert greeks['theoretical_price'] == 10
+        assert greeks['delta'] == 1.0
+        assert greeks['gamma'] == 0
+
+
+class TestVectorizedGreeks:
+    """Tests for chain-level Greeks."""
+
+    def test_matches_scalar_greeks(self):
+        """Test that each element matches calculate_all_greeks."""
+        strikes = np.array([60.0, 90.0, 100.0, 110.0, 160.0, 100.0])
+        ivs = np.array([0.5, 0.3, 0.25, 0.3, 0.6, 0.2])
+        is_call = np.array([True, False, True, False, True, False])
+        T = np.array([1.0, 0.25, 0.5, 0.1, 2.0, 0.0])
+
+        result = calculate_greeks_vectorized(100.0, strikes, T, 0.04, ivs, is_call)
+
+        for i in range(len(strikes)):
+            option_type = 'call' if is_call[i] else 'put'
+            expected = calculate_all_greeks(100.0, strikes[i], T[i], 0.04, ivs[i], option_type)
+
+            for name, value in expected.items():
+                assert result[name][i] == pytest.approx(value, rel=1e-9, abs=1e-12), (i, name)
+
+    def test_kernel_matches_numpy_path(self, monkeypatch):
+        """Test that the compiled chain loop matches the NumPy path."""
+        strikes = np.linspace(50, 150, 21)
+        ivs = np.linspace(0.1, 0.9, 21)
+        ivs[3] = np.nan
+
+        compiled = calculate_greeks_vectorized(100.0, strikes, 0.3, 0.05, ivs, strikes > 100)
+        monkeypatch.setattr(greeks, 'NUMBA_AVAILABLE', False)
+        expected = calculate_greeks_vectorized(100.0, strikes, 0.3, 0.05, ivs, strikes > 100)
+
+        for name, values in expected.items():
+            np.testing.assert_allclose(compiled[name], values, rtol=1e-12, atol=1e-14, err_msg=name)
+
+    @pytest.mark.parametrize('x', [-8.0, -2.5, -0.3, 0.0, 0.7, 3.0, 8.0])
+    def test_norm_cdf(self, x):
+        """Test the erfc-based normal CDF against scipy."""
+        assert norm_cdf(x) == pytest.approx(norm.cdf(x), rel=1e-12)
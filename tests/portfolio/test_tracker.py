@@ -0,0 +1,86 @@
+"""
+Unit tests for portfolio tracker module.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+from src.portfolio.tracker import (
+    calculate_portfolio_value,
+    calculate_portfolio_beta,
+    calculate_max_drawdown
+)
+
+
+@pytest.fixture
+def holdings():
+    """Create a small set of holdings, including a repeated ticker."""
+    return pd.DataFrame({
+        'ticker': ['AAPL', 'MSFT', 'NVDA', 'AAPL'],
+        'shares': [10, 5, 8, 2],
+        'purchase_price': [150.0, 300.0, 400.0, 200.0]
+    })
+
+
+class TestPortfolioValue:
+    """Tests for calculate_portfolio_value."""
+
+    def test_values_and_gain_loss(self, holdings):
+        """Test cost basis, value and P/L per holding."""
+        result = calculate_portfolio_value(holdings, {'AAPL': 180.0, 'MSFT': 270.0, 'NVDA': 500.0})
+
+        np.testing.assert_allclose(result['current_price'], [180.0, 270.0, 500.0, 180.0])
+        np.testing.assert_allclose(result['cost_basis'], [1500.0, 1500.0, 3200.0, 400.0])
+        np.testing.assert_allclose(result['current_value'], [1800.0, 1350.0, 4000.0, 360.0])
+        np.testing.assert_allclose(result['gain_loss'], [300.0, -150.0, 800.0, -40.0])
+        np.testing.assert_allclose(result['gain_loss_pct'], [20.0, -10.0, 25.0, -10.0])
+
+    def test_missing_price(self, holdings):
+        """Test that holdings without a price get NaN values."""
+        result = calculate_portfolio_value(holdings, {'AAPL': 180.0})
+
+        assert result['current_value'].isna().tolist() == [False, True, True, False]
+        assert list(holdings.columns) == ['ticker', 'shares', 'purchase_price']
+
+
+class TestPortfolioBeta:
+    """Tests for calculate_portfolio_beta."""
+
+    def test_weighted_beta(self):
+        """Test allocation-weighted beta of leveraged and short-history holdings."""
+        dates = pd.date_range('2024-01-01', periods=120, freq='B')
+        rng = np.random.RandomState(3)
+        benchmark_returns = rng.normal(0, 0.01, 120)
+        benchmark = pd.DataFrame({'Close': 100 * np.cumprod(1 + benchmark_returns)}, index=dates)
+
+        price_data = {
+            # Exactly twice the benchmark's daily returns: beta 2
+            'LEV': pd.DataFrame({'Close': 50 * np.cumprod(1 + 2 * benchmark_returns)}, index=dates),
+            # Too little overlapping history: contributes nothing
+            'NEW': pd.DataFrame({'Close': [10.0, 10.5, 10.2]}, index=dates[-3:])
+        }
+        holdings = pd.DataFrame({
+            'ticker': ['LEV', 'NEW', 'GONE'],
+            'allocation_pct': [50.0, 30.0, 20.0]
+        })
+
+        beta = calculate_portfolio_beta(holdings, price_data, benchmark)
+
+        assert beta == pytest.approx(1.0)
+
+
+class TestMaxDrawdown:
+    """Tests for calculate_max_drawdown."""
+
+    def test_peak_and_trough(self):
+        """Test the largest decline is measured from the preceding peak."""
+        prices = pd.Series(
+            [100.0, 120.0, 90.0, 130.0, np.nan, 104.0, 110.0],
+            index=pd.date_range('2024-01-01', periods=7)
+        )
+
+        max_dd, peak, trough = calculate_max_drawdown(prices)
+
+        assert max_dd == pytest.approx(-25.0)
+        assert peak == str(prices.index[1])
+        assert trough == str(prices.index[2])
@@ -2,6 +2,7 @@
 Unit tests for breakout scanner module.
 """
 
+from types import SimpleNamespace
 import pytest
 import pandas as pd
 import numpy as np
@@ -9,44 +10,54 @@ from src.scanner.breakout_scanner import (
     calculate_relative_volume,
     check_volume_surge,
     check_rsi_signal,
-    check_consolidation_breakout
+    check_consolidation_breakout,
+    scan_ticker_from_df,
+    scan_tickers_from_frames,
+    filter_liquid_tickers,
+    scan_multiple_tickers,
+    clear_signals_cache,
+    find_high_volume_movers,
+    find_oversold_stocks,
+    find_golden_cross_stocks,
+    find_breakout_candidates
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def sample_high_volume_data():
     """Create sample data with volume surge."""
     dates = pd.date_range('2024-01-01', periods=30, freq='D')
-    np.random.seed(42)
+    rng = np.random.RandomState(42)
 
     # Normal volume, then surge
     volumes = [1000000] * 25 + [3000000] * 5
 
     data = pd.DataFrame({
-        'Open': np.random.uniform(100, 110, 30),
-        'High': np.random.uniform(110, 120, 30),
-        'Low': np.random.uniform(90, 100, 30),
-        'Close': np.random.uniform(95, 115, 30),
+        'Open': rng.uniform(100, 110, 30),
+        'High': rng.uniform(110, 120, 30),
+        'Low': rng.uniform(90, 100, 30),
+        'Close': rng.uniform(95, 115, 30),
         'Volume': volumes
     }, index=dates)
 
     return data
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def sample_oversold_data():
     """Create sample data showing oversold conditions."""
     dates = pd.date_range('2024-01-01', periods=50, freq='D')
+    rng = np.random.RandomState(0)
 
     # Declining prices to trigger oversold RSI
-    close_prices = np.linspace(120, 80, 50) + np.random.normal(0, 1, 50)
+    close_prices = np.linspace(120, 80, 50) + rng.normal(0, 1, 50)
 
     data = pd.DataFrame({
-        'Open': close_prices - np.random.uniform(0, 2, 50),
-        'High': close_prices + np.random.uniform(0, 2, 50),
-        'Low': close_prices - np.random.uniform(0, 2, 50),
+        'Open': close_prices - rng.uniform(0, 2, 50),
+        'High': close_prices + rng.uniform(0, 2, 50),
+        'Low': close_prices - rng.uniform(0, 2, 50),
         'Close': close_prices,
-        'Volume': np.random.uniform(1000000, 2000000, 50)
+        'Volume': rng.uniform(1000000, 2000000, 50)
     }, index=dates)
 
     return data
@@ -80,6 +91,13 @@ class TestRelativeVolume:
 
         assert has_surge == True
 
+    def test_check_volume_surge_precomputed(self, sample_high_volume_data):
+        """Test that a precomputed relative volume gives the same answer."""
+        rel_vol = calculate_relative_volume(sample_high_volume_data)
+
+        assert check_volume_surge(sample_high_volume_data, rel_vol=rel_vol) == True
+        assert check_volume_surge(sample_high_volume_data, threshold=rel_vol + 1, rel_vol=rel_vol) == False
+
 
 class TestRSISignals:
     """Tests for RSI signal detection."""
@@ -94,9 +112,10 @@ class TestRSISignals:
     def test_check_rsi_neutral(self):
         """Test RSI neutral condition."""
         dates = pd.date_range('2024-01-01', periods=30, freq='D')
+        rng = np.random.RandomState(0)
         # Stable prices should give neutral RSI
         data = pd.DataFrame({
-            'Close': [100] * 30 + np.random.normal(0, 0.5, 30)
+            'Close': [100] * 30 + rng.normal(0, 0.5, 30)
         }, index=dates)
 
         signal = check_rsi_signal(data)
@@ -120,10 +139,11 @@ class TestConsolidation:
     def test_check_consolidation(self):
         """Test consolidation detection."""
         dates = pd.date_range('2024-01-01', periods=50, freq='D')
+        rng = np.random.RandomState(0)
 
         # First 30 days: consolidation (narrow range)
         # Last 20 days: breakout (wider range)
-        prices_consolidation = np.random.uniform(99, 101, 30)
+        prices_consolidation = rng.uniform(99, 101, 30)
         prices_breakout = np.linspace(101, 120, 20)
         all_prices = np.concatenate([prices_consolidation, prices_breakout])
 
@@ -132,7 +152,7 @@ class TestConsolidation:
             'High': all_prices + 1,
             'Low': all_prices - 1,
             'Close': all_prices,
-            'Volume': np.random.uniform(1000000, 2000000, 50)
+            'Volume': rng.uniform(1000000, 2000000, 50)
         }, index=dates)
 
         result = check_consolidation_breakout(data)
@@ -144,6 +164,230 @@ class TestConsolidation:
         assert isinstance(result['breaking_out'], (bool, np.bool_))
 
 
+class TestScanTickerFromDf:
+    """Tests for scanning already-fetched price data."""
+
+    def test_scan_ticker_from_df(self, sample_oversold_data):
+        """Test that signals are computed from a provided DataFrame."""
+        signals = scan_ticker_from_df('TEST', sample_oversold_data)
+
+        assert signals['ticker'] == 'TEST'
+        assert signals['current_price'] == sample_oversold_data['Close'].iloc[-1]
+        assert signals['rsi_signal'] in ['oversold', 'neutral', 'overbought']
+        assert 'consolidation' in signals
+        assert signals['is_breaking_out'] == signals['consolidation']['breaking_out']
+
+    def test_scan_ticker_from_df_insufficient_data(self, sample_high_volume_data):
+        """Test that fewer than 50 bars returns None."""
+        assert scan_ticker_from_df('TEST', sample_high_volume_data) is None
+
+
+class TestScanTickersFromFrames:
+    """Tests for the column-wise multi-ticker scan."""
+
+    @staticmethod
+    def _make_frame(seed, periods):
+        dates = pd.date_range('2023-01-01', periods=periods, freq='D')
+        rng = np.random.default_rng(seed)
+        close = 100 + rng.normal(0, 1, periods).cumsum()
+
+        return pd.DataFrame({
+            'Open': close + rng.uniform(-1, 1, periods),
+            'High': close + rng.uniform(0, 2, periods),
+            'Low': close - rng.uniform(0, 2, periods),
+            'Close': close,
+            'Volume': rng.integers(1000000, 5000000, periods)
+        }, index=dates)
+
+    def test_matches_per_ticker_scan(self):
+        """Test that wide results equal scan_ticker_from_df for every ticker."""
+        frames = {
+            'AAA': self._make_frame(1, 260),
+            'BBB': self._make_frame(2, 260),
+            'CCC': self._make_frame(3, 120),  # Shorter history, separate group
+        }
+        frames['BBB']['Volume'] = 0  # Relative volume undefined
+
+        result = scan_tickers_from_frames(frames)
+
+        assert set(result) == set(frames)
+        for ticker, df in frames.items():
+            expected = scan_ticker_from_df(ticker, df)
+            assert list(result[ticker]) == list(expected)
+            for key, value in expected.items():
+                if isinstance(value, float):
+                    assert result[ticker][key] == pytest.approx(value, nan_ok=True)
+                else:
+                    assert result[ticker][key] == value
+
+    def test_skips_insufficient_data(self, sample_high_volume_data):
+        """Test that frames with fewer than 50 bars are left out."""
+        assert scan_tickers_from_frames({'TEST': sample_high_volume_data}) == {}
+
+
+class TestLiquidityFilter:
+    """Tests for the liquidity pre-screen."""
+
+    def test_filter_liquid_tickers(self, monkeypatch):
+        """Test that cheap or thinly traded tickers are dropped."""
+        dates = pd.date_range('2024-01-01', periods=5, freq='D')
+        frames = {
+            'LIQUID': pd.DataFrame({'Close': [50.0] * 5, 'Volume': [1000000] * 5}, index=dates),
+            'PENNY': pd.DataFrame({'Close': [2.0] * 5, 'Volume': [1000000] * 5}, index=dates),
+            'THIN': pd.DataFrame({'Close': [50.0] * 5, 'Volume': [1000000] * 4 + [10000]}, index=dates),
+        }
+        monkeypatch.setattr(
+            'src.scanner.breakout_scanner.fetch_batch_historical_data',
+            lambda tickers, **kwargs: frames
+        )
+
+        result = filter_liquid_tickers(['THIN', 'LIQUID', 'PENNY', 'MISSING'])
+
+        # Tickers without screening data are kept for the full scan
+        assert result == ['LIQUID', 'MISSING']
+
+    def test_filter_keeps_nan_last_row(self, monkeypatch):
+        """Test that a ticker whose last row is NaN is kept, like a missing one."""
+        dates = pd.date_range('2024-01-01', periods=5, freq='D')
+        frames = {
+            'NO_CLOSE': pd.DataFrame({'Close': [50.0] * 4 + [np.nan], 'Volume': [1000000.0] * 5}, index=dates),
+            'NO_VOLUME': pd.DataFrame({'Close': [50.0] * 5, 'Volume': [1000000.0] * 4 + [np.nan]}, index=dates),
+            'PENNY': pd.DataFrame({'Close': [2.0] * 5, 'Volume': [1000000.0] * 5}, index=dates),
+        }
+        monkeypatch.setattr(
+            'src.scanner.breakout_scanner.fetch_batch_historical_data',
+            lambda tickers, **kwargs: frames
+        )
+
+        result = filter_liquid_tickers(['NO_CLOSE', 'NO_VOLUME', 'PENNY'])
+
+        assert result == ['NO_CLOSE', 'NO_VOLUME']
+
+
+class TestScanMultipleTickers:
+    """Tests for the scan results DataFrame."""
+
+    def test_consolidation_columns(self, sample_oversold_data, monkeypatch):
+        """Test that the consolidation dict is kept next to its bool flag."""
+        monkeypatch.setattr(
+            'src.scanner.breakout_scanner.fetch_batch_historical_data',
+            lambda tickers, **kwargs: {'TEST': sample_oversold_data}
+        )
+
+        df = scan_multiple_tickers(['TEST'])
+        columns = list(df.columns)
+
+        assert columns.index('in_consolidation') == columns.index('consolidation') + 1
+        assert df['in_consolidation'].dtype == bool
+        assert df['in_consolidation'].iloc[0] == df['consolidation'].iloc[0]['in_consolidation']
+
+
+class TestSignalsCache:
+    """Tests for reusing scan signals across finder calls."""
+
+    def test_repeat_scan_reuses_signals(self, sample_oversold_data, monkeypatch):
+        """Test that a second scan of the same universe skips fetching."""
+        calls = []
+
+        def fetch(tickers, **kwargs):
+            calls.append(tuple(tickers))
+            return {'TEST': sample_oversold_data}
+
+        monkeypatch.setattr('src.scanner.breakout_scanner.fetch_batch_historical_data', fetch)
+        clear_signals_cache()
+
+        first = scan_multiple_tickers(['TEST'], cache_ttl=600)
+        second = scan_multiple_tickers(['TEST'], cache_ttl=600)
+        scan_multiple_tickers(['TEST'], period='6mo', cache_ttl=600)
+
+        assert calls == [('TEST',), ('TEST',)]
+        pd.testing.assert_frame_equal(first, second)
+
+        clear_signals_cache()
+        scan_multiple_tickers(['TEST'], cache_ttl=600)
+
+        assert len(calls) == 3
+
+    def test_finders_share_one_download(self, sample_oversold_data, monkeypatch):
+        """Test that different finders on the same tickers download once."""
+        calls = []
+
+        def fetch(tickers, **kwargs):
+            calls.append((tuple(tickers), kwargs.get('period')))
+            return {'TEST': sample_oversold_data}
+
+        monkeypatch.setattr('src.scanner.breakout_scanner.fetch_batch_historical_data', fetch)
+        clear_signals_cache()
+
+        find_oversold_stocks(['TEST'], cache_ttl=600)
+        find_breakout_candidates(['TEST'], cache_ttl=600)
+        find_golden_cross_stocks(['TEST'], cache_ttl=600)
+
+        assert calls == [(('TEST',), '1y')]
+
+        # The liquidity screen's own download is skipped on a hit as well
+        find_oversold_stocks(['TEST'], liquidity_filter=True, cache_ttl=600)
+        find_high_volume_movers(['TEST'], liquidity_filter=True, cache_ttl=600)
+
+        assert calls == [(('TEST',), '1y'), (('TEST',), '5d'), (('TEST',), '1y')]
+
+    def test_shared_signals_serve_every_finder(self, sample_oversold_data, monkeypatch):
+        """Test that finders reading cached signals match a fresh scan."""
+        monkeypatch.setattr(
+            'src.scanner.breakout_scanner.fetch_batch_historical_data',
+            lambda tickers, **kwargs: {'TEST': sample_oversold_data}
+        )
+        clear_signals_cache()
+        finders = [
+            lambda **kw: find_oversold_stocks(['TEST'], **kw),
+            lambda **kw: find_high_volume_movers(['TEST'], min_rel_volume=0.0, **kw),
+            lambda **kw: find_golden_cross_stocks(['TEST'], **kw),
+            lambda **kw: find_breakout_candidates(['TEST'], **kw)
+        ]
+
+        for finder in finders:
+            pd.testing.assert_frame_equal(finder(cache_ttl=600), finder())
+
+        assert len(finders[0](cache_ttl=600)) == 1
+
+    def test_cache_off_by_default(self, sample_oversold_data, monkeypatch):
+        """Test that scans rescan unless cache_ttl is given."""
+        calls = []
+
+        def fetch(tickers, **kwargs):
+            calls.append(tuple(tickers))
+            return {'TEST': sample_oversold_data}
+
+        monkeypatch.setattr('src.scanner.breakout_scanner.fetch_batch_historical_data', fetch)
+        clear_signals_cache()
+
+        scan_multiple_tickers(['TEST'])
+        scan_multiple_tickers(['TEST'])
+
+        assert len(calls) == 2
+
+    def test_expired_entry_rescans(self, sample_oversold_data, monkeypatch):
+        """Test that signals older than cache_ttl are refetched."""
+        calls = []
+        now = [1000.0]
+
+        def fetch(tickers, **kwargs):
+            calls.append(tuple(tickers))
+            return {'TEST': sample_oversold_data}
+
+        monkeypatch.setattr('src.scanner.breakout_scanner.fetch_batch_historical_data', fetch)
+        monkeypatch.setattr('src.scanner.breakout_scanner.time', SimpleNamespace(time=lambda: now[0]))
+        clear_signals_cache()
+
+        scan_multiple_tickers(['TEST'], cache_ttl=60)
+        now[0] += 30
+        scan_multiple_tickers(['TEST'], cache_ttl=60)
+        now[0] += 60
+        scan_multiple_tickers(['TEST'], cache_ttl=60)
+
+        assert len(calls) == 2
+
+
 class TestEdgeCases:
     """Test edge cases."""
 
@@ -0,0 +1,59 @@
+"""
+Large-N benchmarks for the breakout scanner signal functions.
+
+Requires pytest-benchmark; the module is skipped when it isn't installed.
+Run with `pytest tests/scanner/test_scanner_benchmark.py --benchmark-only`,
+or pass `--benchmark-skip` to leave these out of a regular run.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+from src.scanner.breakout_scanner import (
+    calculate_relative_volume,
+    check_rsi_signal,
+    check_ma_crossover,
+    check_near_52w_high,
+    check_consolidation_breakout,
+    scan_ticker_from_df
+)
+
+pytest.importorskip('pytest_benchmark')
+
+
+@pytest.fixture(scope='module', params=[10_000, 100_000], ids=lambda n: f'n={n}')
+def large_ohlcv_data(request):
+    """Create a long synthetic OHLCV history."""
+    n = request.param
+    rng = np.random.default_rng(0)
+    close = rng.standard_normal(n).cumsum() + 100 + 0.01 * n
+
+    return pd.DataFrame({
+        'Open': close + rng.uniform(-1, 1, n),
+        'High': close + rng.uniform(0, 2, n),
+        'Low': close - rng.uniform(0, 2, n),
+        'Close': close,
+        'Volume': rng.integers(1000000, 5000000, n)
+    }, index=pd.date_range('1900-01-01', periods=n, freq='D'))
+
+
+@pytest.mark.parametrize('func', [
+    calculate_relative_volume,
+    check_rsi_signal,
+    check_ma_crossover,
+    check_near_52w_high,
+    check_consolidation_breakout,
+    lambda df: scan_ticker_from_df('TEST', df)
+], ids=[
+    'relative_volume',
+    'rsi_signal',
+    'ma_crossover',
+    'near_52w_high',
+    'consolidation_breakout',
+    'scan_ticker_from_df'
+])
+def test_signal_benchmark(benchmark, large_ohlcv_data, func):
+    """Benchmark each signal on a long history."""
+    result = benchmark(func, large_ohlcv_data)
+
+    assert result is not None